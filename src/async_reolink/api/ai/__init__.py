@@ -4,9 +4,8 @@
 from abc import ABC, abstractmethod
 from typing import Mapping
 
-from ..errors import ErrorCodes, ReolinkResponseError
+from ..errors import ErrorCodes
 
-from ..commands import CommandErrorResponse, ResponseCode
 from ..commands.ai import (
     GetAiConfigRequest,
     GetAiConfigResponse,
@@ -17,7 +16,7 @@ from ..commands.ai import (
 
 from .typings import AITypes, Config
 
-from .. import connection
+from ..executor import command
 
 
 class AI(ABC):
@@ -27,65 +26,40 @@ class AI(ABC):
     def _create_get_ai_state_request(self, channel: int) -> GetAiStateRequest:
         ...
 
-    async def get_ai_state(self, channel: int = 0):
+    @command(
+        GetAiStateResponse, "state", channel="channel", error="Get AI State failed"
+    )
+    def get_ai_state(self, channel: int = 0):
         """Get AI State Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ai_state_request(channel)
-            ):
-                if (
-                    isinstance(response, GetAiStateResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.state
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get AI State failed")
-
-        raise ReolinkResponseError("Get AI State failed")
+        return self._create_get_ai_state_request(channel)
 
     @abstractmethod
     def _create_get_ai_config_request(self, channel: int) -> GetAiConfigRequest:
         ...
 
-    async def get_ai_config(self, channel: int = 0):
+    @command(
+        GetAiConfigResponse,
+        "config",
+        channel="channel",
+        error="Get AI Config failed",
+        cache="get_ai_config",
+    )
+    def get_ai_config(self, channel: int = 0):
         """Get AI Config Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ai_config_request(channel)
-            ):
-                if (
-                    isinstance(response, GetAiConfigResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.config
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get AI State failed")
-
-        raise ReolinkResponseError("Get AI State failed")
+        return self._create_get_ai_config_request(channel)
 
     @abstractmethod
     def _create_set_ai_config(self, channel: int, config: Config) -> SetAiConfigRequest:
         ...
 
-    async def set_ai_config(
+    @command(error="Set AI Config failed", evicts=("get_ai_config",))
+    def set_ai_config(
         self,
         config: Config,
         channel: int = 0,
     ):
         """Set AI Configuration"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ai_config(channel, config)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set AI State failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set AI State failed")
+        return self._create_set_ai_config(channel, config)
@@ -2,11 +2,9 @@
 
 from abc import ABC, abstractmethod
 
-from ..errors import ReolinkResponseError
+from ..commands import alarm
 
-from ..commands import CommandErrorResponse, alarm
-
-from .. import connection
+from ..executor import command
 
 
 class Alarm(ABC):
@@ -16,15 +14,8 @@ class Alarm(ABC):
     def _create_get_md_state(self, channel: int) -> alarm.GetMotionStateRequest:
         ...
 
-    async def get_md_state(self, channel: int = 0):
+    @command(alarm.GetMostionStateResponse, "state", error="Get Motion State failed")
+    def get_md_state(self, channel: int = 0):
         """Get Motion Detection Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_md_state(channel)):
-                if isinstance(response, alarm.GetMostionStateResponse):
-                    return response.state
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get Motion State failed")
-
-        raise ReolinkResponseError("Get Motion State failed")
+        return self._create_get_md_state(channel)
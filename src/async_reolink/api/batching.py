@@ -0,0 +1,215 @@
+"""Command Batching"""
+
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Generator, Sequence
+
+from .errors import ReolinkResponseError
+
+from .commands import CommandRequest, CommandResponse
+
+if TYPE_CHECKING:
+    from .connection import Connection
+
+Correlator = Callable[[Sequence[CommandRequest], CommandResponse, int], int]
+"""Maps a response to the index of the command it answers, given the next unanswered position"""
+
+
+class CommandHandle:
+    """Pending response of a single batched command"""
+
+    __slots__ = ("command", "_future")
+
+    def __init__(self, command: CommandRequest) -> None:
+        self.command = command
+        self._future: asyncio.Future[CommandResponse | bytes] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def __await__(self) -> Generator[None, None, CommandResponse | bytes]:
+        return self._future.__await__()
+
+    def done(self):
+        """response received"""
+        return self._future.done()
+
+    def result(self):
+        """response, raises if not done"""
+        return self._future.result()
+
+    def cancel(self):
+        """stop waiting on the response"""
+        return self._future.cancel()
+
+    def add_done_callback(self, callback: Callable[[CommandHandle], None]):
+        """call when the response is received"""
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def shield(self):
+        """await without cancelling the response for other waiters"""
+        return asyncio.shield(self._future)
+
+    def _set_result(self, response: CommandResponse | bytes):
+        if not self._future.done():
+            self._future.set_result(response)
+
+    def _set_exception(self, error: BaseException):
+        if not self._future.done():
+            self._future.set_exception(error)
+
+    def _abandon(self, error: BaseException):
+        """fail waiters, if any, without logging an unretrieved error"""
+        if not self._future.done():
+            self._future.set_exception(error)
+            self._future.exception()
+
+
+async def resolve(
+    responses: AsyncIterable[CommandResponse | bytes],
+    handles: Sequence[CommandHandle],
+    correlate: Correlator,
+):
+    """Resolve handles from a batch response stream as each response arrives
+
+    Consecutive byte chunks are joined and belong to the next unanswered command.
+    """
+
+    commands = [handle.command for handle in handles]
+    position = 0
+    chunks: list[bytes] | None = None
+    try:
+        async for response in responses:
+            if isinstance(response, bytes):
+                if chunks is None:
+                    chunks = []
+                chunks.append(response)
+                continue
+            if chunks is not None:
+                if position < len(handles):
+                    handles[position]._set_result(b"".join(chunks))
+                chunks = None
+                while position < len(handles) and handles[position].done():
+                    position += 1
+            index = correlate(commands, response, position)
+            if 0 <= index < len(handles):
+                handles[index]._set_result(response)
+            while position < len(handles) and handles[position].done():
+                position += 1
+    except Exception as error:  # pylint: disable=broad-except
+        for handle in handles:
+            handle._set_exception(error)
+        return
+
+    if chunks is not None and position < len(handles):
+        handles[position]._set_result(b"".join(chunks))
+    for handle in handles:
+        handle._set_exception(ReolinkResponseError("Batch response missing"))
+
+
+class Collector:
+    """Collects commands from concurrent callers into a single batch
+
+    With no window commands are held until the collector is drained.
+    """
+
+    __slots__ = ("_connection", "_window", "_pending", "_handle")
+
+    def __init__(self, connection: Connection, window: float | None) -> None:
+        self._connection = connection
+        self._window = window
+        self._pending: list[CommandHandle] = []
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def connection(self):
+        """connection batches are sent on"""
+        return self._connection
+
+    @property
+    def window(self):
+        """collection window in seconds"""
+        return self._window
+
+    @property
+    def pending(self):
+        """number of queued commands"""
+        return len(self._pending)
+
+    def add(self, handles: Sequence[CommandHandle]):
+        """queue commands for the next batch"""
+
+        self._pending.extend(handles)
+        if self._handle is None and self._window is not None:
+            self._handle = asyncio.get_running_loop().call_later(self._window, self.flush)
+        return handles
+
+    def flush(self):
+        """send all queued commands as a single batch"""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending = [handle for handle in self._pending if not handle.done()]
+        self._pending = []
+        if pending:
+            self._connection._submit(pending)
+
+    def drain(self):
+        """flush now and send anything queued later on the next loop iteration"""
+
+        self._window = 0
+        self.flush()
+
+
+active_collector: ContextVar[Collector | None] = ContextVar("active_collector", default=None)
+"""Collector of the enclosing explicit batch"""
+
+
+class BatchContext:
+    """Explicit batch of mixin calls
+
+    Calls made through the context return pending results, the commands they
+    issue are sent as a single batch when the context exits.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        self._collector = Collector(connection, None)
+        self._tasks: list[asyncio.Future] = []
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._connection, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs) -> asyncio.Future:
+            token = active_collector.set(self._collector)
+            try:
+                task = asyncio.ensure_future(attr(*args, **kwargs))
+            finally:
+                active_collector.reset(token)
+            self._tasks.append(task)
+            return task
+
+        return call
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+            self._collector.drain()
+            return
+
+        # let every call run up to its first command before sending
+        count = -1
+        while count != self._collector.pending:
+            count = self._collector.pending
+            await asyncio.sleep(0)
+        self._collector.drain()
+        if self._tasks:
+            await asyncio.wait(self._tasks)
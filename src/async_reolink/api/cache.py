@@ -0,0 +1,131 @@
+"""Response Cache"""
+
+from __future__ import annotations
+
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Final, Hashable, Mapping
+from weakref import ref
+
+DEFAULT_TTLS: Final[Mapping[str, float]] = MappingProxyType(
+    {
+        "get_device_info": 600,
+        "get_local_link": 300,
+        "get_ports": 300,
+        "get_p2p": 3600,
+        "get_wifi": 300,
+        "get_users": 300,
+        "get_encoding": 300,
+        "get_ptz_presets": 300,
+        "get_ptz_patrols": 300,
+        "get_ptz_tatterns": 300,
+        "get_ptz_autofocus": 60,
+        "get_ir_lights": 60,
+        "get_power_led": 60,
+        "get_white_led": 60,
+        "get_ai_config": 300,
+    }
+)
+"""Default time to live in seconds by command method"""
+
+
+class ResponseCache:
+    """Time to live cache of read command results
+
+    Entries are keyed by command method name and channel (None for device
+    wide commands), names without a time to live are never cached. Cached
+    values are shared between callers and should not be modified.
+
+    Keys do not identify the device, so a cache is bound to the one
+    connection using it and cannot be shared.
+    """
+
+    __slots__ = ("_ttls", "_default_ttl", "_entries", "_epoch", "_owner")
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        default_ttl: float | None = None,
+    ) -> None:
+        self._ttls = dict(ttls)
+        self._default_ttl = default_ttl
+        self._entries: dict[str, dict[Hashable, tuple[float, Any]]] = {}
+        self._epoch = 0
+        self._owner: ref | None = None
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    @property
+    def epoch(self):
+        """changes on every eviction, results fetched across one are not stored"""
+        return self._epoch
+
+    def bind(self, owner: object):
+        """attach to the connection whose results are cached
+
+        Raises ValueError when already bound to another live connection.
+        """
+
+        if (bound := self._bound()) is owner:
+            return
+        if bound is not None:
+            raise ValueError("Response cache is used by another connection")
+        self.clear()
+        self._owner = ref(owner)
+
+    def unbind(self, owner: object):
+        """detach from a connection, dropping its values"""
+
+        if (bound := self._bound()) is owner or bound is None:
+            self._owner = None
+            self.clear()
+
+    def _bound(self):
+        return self._owner() if self._owner is not None else None
+
+    def ttl(self, name: str):
+        """time to live of a command, None when not cached"""
+        return self._ttls.get(name, self._default_ttl)
+
+    def set_ttl(self, name: str, ttl: float | None):
+        """change the time to live of a command, None disables caching it"""
+        self._ttls[name] = ttl
+        if not ttl:
+            self._entries.pop(name, None)
+
+    def get(self, name: str, channel: Hashable = None, default: Any = None):
+        """cached value or default when missing or expired"""
+
+        if (entries := self._entries.get(name)) is None:
+            return default
+        if (entry := entries.get(channel)) is None:
+            return default
+        if entry[0] <= monotonic():
+            del entries[channel]
+            return default
+        return entry[1]
+
+    def put(self, name: str, channel: Hashable, value: Any, epoch: int | None = None):
+        """store a value, ignored when an eviction happened since `epoch`"""
+
+        if (epoch is not None and epoch != self._epoch) or not (ttl := self.ttl(name)):
+            return
+        self._entries.setdefault(name, {})[channel] = (monotonic() + ttl, value)
+
+    def evict(self, name: str, channel: Hashable = None):
+        """drop a command value for a channel, or all channels when channel is None"""
+
+        self._epoch += 1
+        if (entries := self._entries.get(name)) is None:
+            return
+        if channel is None:
+            entries.clear()
+        else:
+            entries.pop(channel, None)
+            entries.pop(None, None)
+
+    def clear(self):
+        """drop all values"""
+        self._epoch += 1
+        self._entries.clear()
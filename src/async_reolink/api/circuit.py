@@ -0,0 +1,86 @@
+"""Circuit Breaker"""
+
+from __future__ import annotations
+
+from enum import Enum, auto
+from time import monotonic
+
+
+class CircuitState(Enum):
+    """Circuit States"""
+
+    CLOSED = auto()
+    """Device reachable, commands are sent"""
+    OPEN = auto()
+    """Device unreachable, commands fail immediately"""
+    HALF_OPEN = auto()
+    """Reset timeout elapsed, a single trial command is let through"""
+
+
+class CircuitBreaker:
+    """Per device circuit breaker
+
+    Opens after `failure_threshold` consecutive connection failures and
+    lets a trial command through once `reset_timeout` seconds have passed.
+    """
+
+    __slots__ = ("_failure_threshold", "_reset_timeout", "_failures", "_opened_at", "_trial")
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30) -> None:
+        self._failure_threshold = max(failure_threshold, 1)
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self):
+        """current state"""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if monotonic() - self._opened_at < self._reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def failures(self):
+        """consecutive failures"""
+        return self._failures
+
+    @property
+    def retry_in(self):
+        """seconds until a trial command is allowed"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - monotonic())
+
+    def allow(self):
+        """may a command be sent now"""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.OPEN or self._trial:
+            return False
+        self._trial = True
+        return True
+
+    def success(self):
+        """record a response from the device"""
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def failure(self):
+        """record a connection failure"""
+        self._failures += 1
+        self._trial = False
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = monotonic()
+
+    def release(self):
+        """give up a trial command without an outcome"""
+        self._trial = False
+
+    def reset(self):
+        """close the circuit"""
+        self.success()
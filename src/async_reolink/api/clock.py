@@ -0,0 +1,142 @@
+"""Device Clock"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone, tzinfo
+from time import monotonic, time
+
+
+class DeviceClock:
+    """Local model of the device clock
+
+    Each sync records the device time of a GetTime response against the
+    local monotonic clock, taking the midpoint of the request as the moment
+    the device read its clock. Device time is then computed locally until
+    `resync_after` seconds pass. When consecutive syncs disagree by more
+    than `tolerance` seconds the device clock is drifting (or was set) and
+    the resync interval is halved, down to `min_resync_after`.
+    """
+
+    __slots__ = (
+        "_resync_after",
+        "_min_resync_after",
+        "_tolerance",
+        "_interval",
+        "_offset",
+        "_synced",
+        "_uncertainty",
+        "_skew",
+        "_drift",
+        "_tzinfo",
+        "_suspect",
+    )
+
+    def __init__(
+        self,
+        resync_after: float | None = 3600,
+        *,
+        tolerance: float = 2,
+        min_resync_after: float = 60,
+    ) -> None:
+        self._resync_after = resync_after
+        self._min_resync_after = min_resync_after
+        self._tolerance = tolerance
+        self._interval = resync_after
+        self._offset: float | None = None
+        self._synced: float | None = None
+        self._uncertainty = 0.0
+        self._skew: float | None = None
+        self._drift: float | None = None
+        self._tzinfo: tzinfo | None = None
+        self._suspect = False
+
+    @property
+    def synced(self):
+        """device time is known"""
+        return self._offset is not None
+
+    @property
+    def stale(self):
+        """device time should be read again"""
+        if self._offset is None or self._suspect:
+            return True
+        return (
+            self._interval is not None and monotonic() - self._synced >= self._interval
+        )
+
+    @property
+    def resync_interval(self):
+        """seconds until the current sync goes stale, None when never"""
+        return self._interval
+
+    @property
+    def tzinfo(self):
+        """device timezone"""
+        return self._tzinfo
+
+    @property
+    def uncertainty(self):
+        """possible error of the device time in seconds"""
+        return self._uncertainty
+
+    @property
+    def skew(self):
+        """seconds the device clock is ahead of the local clock, None before a sync"""
+        return self._skew
+
+    @property
+    def drift(self):
+        """device clock seconds gained per local second between the last two syncs"""
+        return self._drift
+
+    def sync(self, device_time: datetime, sent: float, received: float):
+        """record a device time read between the monotonic times `sent` and `received`"""
+
+        midpoint = (sent + received) / 2
+        uncertainty = (received - sent) / 2
+        timestamp = device_time.timestamp()
+        if not device_time.microsecond:
+            # devices report whole seconds, assume the middle of the second
+            timestamp += 0.5
+            uncertainty += 0.5
+        offset = timestamp - midpoint
+        if self._offset is not None and self._synced is not None:
+            error = offset - self._offset
+            if (elapsed := midpoint - self._synced) >= self._min_resync_after:
+                self._drift = error / elapsed
+            if abs(error) > self._tolerance + self._uncertainty + uncertainty:
+                if self._interval is not None:
+                    self._interval = max(self._interval / 2, self._min_resync_after)
+            else:
+                self._interval = self._resync_after
+        self._offset = offset
+        self._synced = midpoint
+        self._uncertainty = uncertainty
+        self._skew = timestamp - (time() - (monotonic() - midpoint))
+        self._tzinfo = device_time.tzinfo
+        self._suspect = False
+
+    def suspect(self):
+        """mark the device time as doubtful so the next read resyncs"""
+        self._suspect = True
+
+    def reset(self):
+        """forget the device time"""
+        self._offset = self._synced = self._skew = self._drift = self._tzinfo = None
+        self._uncertainty = 0.0
+        self._interval = self._resync_after
+        self._suspect = False
+
+    def timestamp(self):
+        """device POSIX timestamp now, None before a sync"""
+        if self._offset is None:
+            return None
+        return monotonic() + self._offset
+
+    def now(self):
+        """device time now in the device timezone, None before a sync"""
+        if self._offset is None:
+            return None
+        return datetime.fromtimestamp(
+            monotonic() + self._offset, self._tzinfo or timezone.utc
+        )
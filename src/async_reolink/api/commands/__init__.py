@@ -1,6 +1,8 @@
 """Commands"""
 
-from typing import Any, Protocol, runtime_checkable
+from abc import ABC
+from enum import IntEnum
+from typing import Any, Protocol, TypeGuard, runtime_checkable
 
 from ..errors import ReolinkResponseError
 
@@ -42,3 +44,67 @@ class CommandErrorResponse(CommandResponse, ErrorResponseValue, Protocol):
 
 class CommandRequest(Protocol):
     """Command Request"""
+
+
+class ReadRequest(CommandRequest, ABC):
+    """Command Request without side effects"""
+
+
+class ResponseKind(IntEnum):
+    """Response Kinds"""
+
+    VALUE = 0
+    """Command specific value"""
+    CODE = 1
+    """Response code only"""
+    ERROR = 2
+    """Error response"""
+    DATA = 3
+    """Streamed data"""
+
+
+_KINDS: dict[type, ResponseKind] = {
+    bytes: ResponseKind.DATA,
+    bytearray: ResponseKind.DATA,
+    memoryview: ResponseKind.DATA,
+}
+
+
+def register_response_kind(kind: ResponseKind):
+    """Tag a response type with its kind, skipping classification"""
+
+    def decorator(cls: type):
+        _KINDS[cls] = kind
+        return cls
+
+    return decorator
+
+
+def response_kind(response: CommandResponse | bytes) -> ResponseKind:
+    """Kind of a response
+
+    Untagged types are classified against the runtime protocols once, on
+    their first instance, and the result is kept per type.
+    """
+
+    try:
+        return _KINDS[type(response)]
+    except KeyError:
+        pass
+    if isinstance(response, CommandErrorResponse):
+        kind = ResponseKind.ERROR
+    elif isinstance(response, ResponseCode):
+        kind = ResponseKind.CODE
+    else:
+        kind = ResponseKind.VALUE
+    return _KINDS.setdefault(type(response), kind)
+
+
+def is_error(response: CommandResponse | bytes) -> TypeGuard[CommandErrorResponse]:
+    """response is an error response"""
+    return response_kind(response) is ResponseKind.ERROR
+
+
+def is_code(response: CommandResponse | bytes) -> TypeGuard[ResponseCode]:
+    """response is a response code"""
+    return response_kind(response) is ResponseKind.CODE
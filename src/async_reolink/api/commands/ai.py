@@ -1,16 +1,19 @@
 """AI Commands"""
 
 from abc import ABC
-from typing import Mapping, MutableMapping
+from typing import ClassVar, Mapping, MutableMapping
 
 from ..ai.typings import AlarmState, AITypes, Config
+from ..gating import Gate
 
-from . import CommandRequest, CommandResponse, ChannelValue
+from . import CommandRequest, CommandResponse, ChannelValue, ReadRequest
 
 
-class GetAiStateRequest(CommandRequest, ChannelValue, ABC):
+class GetAiStateRequest(ReadRequest, ChannelValue, ABC):
     """Get AI State"""
 
+    capability: ClassVar = Gate("supports.ai", channel=True)
+
 
 class GetAiStateResponse(CommandResponse, ChannelValue, ABC):
     """Get AI State Response"""
@@ -18,9 +21,11 @@ class GetAiStateResponse(CommandResponse, ChannelValue, ABC):
     state: Mapping[AITypes, AlarmState]
 
 
-class GetAiConfigRequest(CommandRequest, ChannelValue, ABC):
+class GetAiConfigRequest(ReadRequest, ChannelValue, ABC):
     """Get AI Configuration"""
 
+    capability: ClassVar = Gate("supports.ai", channel=True)
+
 
 class GetAiConfigResponse(CommandResponse, ChannelValue, ABC):
     """Get AI Configuration Response"""
@@ -31,6 +36,8 @@ class GetAiConfigResponse(CommandResponse, ChannelValue, ABC):
 class SetAiConfigRequest(CommandRequest, ChannelValue, ABC):
     """Set AI Configuration"""
 
+    capability: ClassVar = Gate("supports.ai", channel=True)
+
     detect_type: MutableMapping[AITypes, bool]
     ai_track: bool
     track_type: MutableMapping[AITypes, bool]
@@ -1,13 +1,17 @@
 """Alarm Commands"""
 
 from abc import ABC
+from typing import ClassVar
 
-from . import CommandRequest, ChannelValue, CommandResponse
+from ..gating import Gate
+from . import ChannelValue, CommandResponse, ReadRequest
 
 
-class GetMotionStateRequest(CommandRequest, ChannelValue, ABC):
+class GetMotionStateRequest(ReadRequest, ChannelValue, ABC):
     """Get Motion State Request"""
 
+    capability: ClassVar = Gate("alarm.motion", channel=True)
+
 
 class GetMostionStateResponse(CommandResponse, ABC):
     """Get Mostion State Response"""
@@ -1,14 +1,18 @@
 """Encoding Commands"""
 
 from abc import ABC
+from typing import ClassVar
 
 from ..encoding.typings import EncodingInfo
-from . import CommandRequest, CommandResponse, ChannelValue
+from ..gating import Gate
+from . import CommandResponse, ChannelValue, ReadRequest
 
 
-class GetEncodingRequest(CommandRequest, ChannelValue, ABC):
+class GetEncodingRequest(ReadRequest, ChannelValue, ABC):
     """Get Encoding"""
 
+    capability: ClassVar = Gate("enc", channel=True)
+
 
 class GetEncodingResponse(CommandResponse, ChannelValue, ABC):
     """Get Encoding Response"""
@@ -1,14 +1,18 @@
 """LED Commands"""
 
 from abc import ABC
+from typing import ClassVar
 
+from ..gating import Gate
 from ..led.typings import LightStates, WhiteLedInfo
-from . import ChannelValue, CommandRequest, CommandResponse
+from . import ChannelValue, CommandRequest, CommandResponse, ReadRequest
 
 
-class GetIrLightsRequest(CommandRequest, ChannelValue, ABC):
+class GetIrLightsRequest(ReadRequest, ChannelValue, ABC):
     """Get IR Lights"""
 
+    capability: ClassVar = Gate("led_control", channel=True)
+
 
 class GetIrLightsResponse(CommandResponse, ChannelValue, ABC):
     """Get IR Lights Response"""
@@ -19,12 +23,16 @@ class GetIrLightsResponse(CommandResponse, ChannelValue, ABC):
 class SetIrLightsRequest(CommandRequest, ChannelValue, ABC):
     """Set Ir Lights"""
 
+    capability: ClassVar = Gate("led_control", channel=True)
+
     state: LightStates
 
 
-class GetPowerLedRequest(CommandRequest, ChannelValue, ABC):
+class GetPowerLedRequest(ReadRequest, ChannelValue, ABC):
     """Get Power Led"""
 
+    capability: ClassVar = Gate("power_led", channel=True)
+
 
 class GetPowerLedResponse(CommandResponse, ChannelValue, ABC):
     """Get Power Led Response"""
@@ -35,12 +43,16 @@ class GetPowerLedResponse(CommandResponse, ChannelValue, ABC):
 class SetPowerLedRequest(CommandRequest, ChannelValue, ABC):
     """Set Power Led"""
 
+    capability: ClassVar = Gate("power_led", channel=True)
+
     state: LightStates
 
 
-class GetWhiteLedRequest(CommandRequest, ChannelValue, ABC):
+class GetWhiteLedRequest(ReadRequest, ChannelValue, ABC):
     """Get White Led"""
 
+    capability: ClassVar = Gate("floodlight", channel=True)
+
 
 class GetWhiteLedResponse(CommandResponse, ChannelValue, ABC):
     """Get White Led Response"""
@@ -51,4 +63,6 @@ class GetWhiteLedResponse(CommandResponse, ChannelValue, ABC):
 class SetWhiteLedRequest(CommandRequest, ChannelValue, ABC):
     """Set White Led"""
 
+    capability: ClassVar = Gate("floodlight", channel=True)
+
     info: WhiteLedInfo
@@ -1,17 +1,34 @@
 """Network Commands"""
 
-from abc import ABC
-from typing import Mapping
-from . import ChannelValue, CommandRequest, CommandResponse
+from __future__ import annotations
 
-from ..network.typings import ChannelStatus, LinkInfo, NetworkPorts, P2PInfo, WifiInfo
+from abc import ABC
+from typing import TYPE_CHECKING, ClassVar, Mapping
+from . import ChannelValue, CommandRequest, CommandResponse, ReadRequest
 
 from ..typings import StreamTypes
 
+from ..gating import Gate
+
+if TYPE_CHECKING:
+    # the network package imports these commands
+    from ..network.typings import ChannelStatus, LinkInfo, NetworkPorts, P2PInfo, WifiInfo
+
+
+def _schedule_supported(version) -> bool:
+    # imported late to keep the system package out of the command imports
+    from ..system.capabilities import (  # pylint: disable=import-outside-toplevel
+        ScheduleVersion,
+    )
+
+    return version != ScheduleVersion.BASIC
 
-class GetLocalLinkRequest(CommandRequest, ABC):
+
+class GetLocalLinkRequest(ReadRequest, ABC):
     """Get Local Link Request"""
 
+    capability: ClassVar = Gate("local_link")
+
 
 class GetLocalLinkResponse(CommandResponse, ABC):
     """Get Local Link Response"""
@@ -19,7 +36,7 @@ class GetLocalLinkResponse(CommandResponse, ABC):
     local_link: LinkInfo
 
 
-class GetChannelStatusRequest(CommandRequest, ABC):
+class GetChannelStatusRequest(ReadRequest, ABC):
     """Get Channel Status Request"""
 
 
@@ -29,7 +46,7 @@ class GetChannelStatusResponse(CommandResponse, ABC):
     channels: Mapping[int, ChannelStatus]
 
 
-class GetNetworkPortsRequest(CommandRequest, ABC):
+class GetNetworkPortsRequest(ReadRequest, ABC):
     """Get Network Ports Request"""
 
 
@@ -39,9 +56,11 @@ class GetNetworkPortsResponse(CommandResponse, ABC):
     ports: NetworkPorts
 
 
-class GetRTSPUrlsRequest(CommandRequest, ChannelValue, ABC):
+class GetRTSPUrlsRequest(ReadRequest, ChannelValue, ABC):
     """Get RTSP URls Request"""
 
+    capability: ClassVar = Gate("schedule_version", accept=_schedule_supported)
+
 
 class GetRTSPUrlsResponse(CommandResponse, ChannelValue, ABC):
     """Get RTSP Urls Repsonse"""
@@ -49,7 +68,7 @@ class GetRTSPUrlsResponse(CommandResponse, ChannelValue, ABC):
     urls: Mapping[StreamTypes, str]
 
 
-class GetP2PRequest(CommandRequest, ABC):
+class GetP2PRequest(ReadRequest, ABC):
     """Get P2P Info Request"""
 
 
@@ -59,9 +78,11 @@ class GetP2PResponse(CommandResponse, ABC):
     info: P2PInfo
 
 
-class GetWifiInfoRequest(CommandRequest, ABC):
+class GetWifiInfoRequest(ReadRequest, ABC):
     """Get Wifi Info Request"""
 
+    capability: ClassVar = Gate("wifi")
+
 
 class GetWifiInfoResponse(CommandResponse, ABC):
     """Get Wifi Info Response"""
@@ -69,9 +90,11 @@ class GetWifiInfoResponse(CommandResponse, ABC):
     info: WifiInfo
 
 
-class GetWifiSignalRequest(CommandRequest, ABC):
+class GetWifiSignalRequest(ReadRequest, ABC):
     """Get Wifi Signal Strength Request"""
 
+    capability: ClassVar = Gate("wifi")
+
 
 class GetWifiSignalResponse(CommandRequest, ABC):
     """Get Wifi Signal Stength Response"""
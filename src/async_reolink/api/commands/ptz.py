@@ -1,15 +1,19 @@
 """PTZ Commands"""
 
 from abc import ABC
-from typing import Annotated, Mapping, MutableSequence
+from typing import Annotated, ClassVar, Mapping, MutableSequence
 
+from ..scheduling import Priority
+from ..gating import Gate
 from ..ptz.typings import Operation, Preset, Patrol, Track, ZoomFocus, ZoomOperation
-from . import CommandRequest, ChannelValue, CommandResponse
+from . import CommandRequest, ChannelValue, CommandResponse, ReadRequest
 
 
-class GetPresetRequest(CommandRequest, ChannelValue, ABC):
+class GetPresetRequest(ReadRequest, ChannelValue, ABC):
     """Get Presets Request"""
 
+    capability: ClassVar = Gate("ptz.preset", channel=True)
+
 
 class GetPresetResponse(CommandResponse, ChannelValue, ABC):
     """Get Presets Response"""
@@ -23,9 +27,11 @@ class SetPresetRequest(CommandRequest, ABC):
     preset: Preset
 
 
-class GetPatrolRequest(CommandRequest, ChannelValue, ABC):
+class GetPatrolRequest(ReadRequest, ChannelValue, ABC):
     """Get Patrol"""
 
+    capability: ClassVar = Gate("ptz.patrol", channel=True)
+
 
 class GetPatrolResponse(CommandResponse, ChannelValue, ABC):
     """Get Patrol Response"""
@@ -42,15 +48,19 @@ class SetPatrolRequest(CommandRequest, ABC):
 class SetControlRequest(CommandRequest, ChannelValue, ABC):
     """PTZ Control"""
 
+    priority: ClassVar = Priority.INTERACTIVE
+
     operation: Operation
     preset_id: int | None
     speed: Annotated[int, range(1, 64)] | None
     """Patrol speed for preset within 1 to 64"""
 
 
-class GetTatternRequest(CommandRequest, ChannelValue, ABC):
+class GetTatternRequest(ReadRequest, ChannelValue, ABC):
     """Get Tattern"""
 
+    capability: ClassVar = Gate("ptz.tattern", channel=True)
+
 
 class GetTatternResponse(CommandResponse, ChannelValue, ABC):
     """Get Tattern Response"""
@@ -61,12 +71,16 @@ class GetTatternResponse(CommandResponse, ChannelValue, ABC):
 class SetTatternRequest(CommandRequest, ChannelValue, ABC):
     """Set PTZ Tattern"""
 
+    capability: ClassVar = Gate("ptz.tattern", channel=True)
+
     tracks: MutableSequence[Track]
 
 
-class GetAutoFocusRequest(CommandRequest, ChannelValue, ABC):
+class GetAutoFocusRequest(ReadRequest, ChannelValue, ABC):
     """Get PTZ AutoFocus"""
 
+    capability: ClassVar = Gate("disable_autofocus", channel=True)
+
 
 class GetAutoFocusResponse(CommandResponse, ChannelValue, ABC):
     """Get PTZ Presets Response"""
@@ -77,12 +91,16 @@ class GetAutoFocusResponse(CommandResponse, ChannelValue, ABC):
 class SetAutoFocusRequest(CommandRequest, ChannelValue, ABC):
     """Set PTZ Preset"""
 
+    capability: ClassVar = Gate("disable_autofocus", channel=True)
+
     disabled: bool
 
 
-class GetZoomFocusRequest(CommandRequest, ChannelValue, ABC):
+class GetZoomFocusRequest(ReadRequest, ChannelValue, ABC):
     """Get Zoom and Focus"""
 
+    capability: ClassVar = Gate("ptz.control", channel=True)
+
 
 class GetZoomFocusResponse(CommandResponse, ChannelValue, ABC):
     """Get Zoom/Focus Response"""
@@ -93,5 +111,8 @@ class GetZoomFocusResponse(CommandResponse, ChannelValue, ABC):
 class SetZoomFocusRequest(CommandRequest, ChannelValue, ABC):
     """Set Zoom or Focus"""
 
+    priority: ClassVar = Priority.INTERACTIVE
+    capability: ClassVar = Gate("ptz.control", channel=True)
+
     operation: ZoomOperation
     position: int
@@ -1,20 +1,29 @@
 """Record Commands"""
 
 from abc import ABC
-from typing import Sequence
+from typing import ClassVar, Sequence
+
+from ..scheduling import Priority
+from ..gating import Gate
 
 from ..record.typings import Search, SearchStatus, File
 
-from . import CommandRequest, ChannelValue, CommandResponse
+from . import ChannelValue, CommandResponse, ReadRequest
 
 
-class GetSnapshotRequest(CommandRequest, ChannelValue, ABC):
+class GetSnapshotRequest(ReadRequest, ChannelValue, ABC):
     """Get Snapshot Request"""
 
+    priority: ClassVar = Priority.BULK
+    capability: ClassVar = Gate("snap", channel=True)
+
 
-class SearchRecordingsRequest(CommandRequest, ChannelValue, ABC):
+class SearchRecordingsRequest(ReadRequest, ChannelValue, ABC):
     """Search Recordings Request"""
 
+    priority: ClassVar = Priority.BULK
+    capability: ClassVar = Gate("record.replay", channel=True)
+
     search: Search
 
 
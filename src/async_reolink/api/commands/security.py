@@ -1,10 +1,11 @@
 """Security Commands"""
 
 from abc import ABC
-from typing import Sequence
-from . import CommandRequest, CommandResponse
+from typing import ClassVar, Sequence
+from . import CommandRequest, CommandResponse, ReadRequest
 
 from ..security import typings
+from ..gating import Gate
 
 
 class LoginRequest(CommandRequest, ABC):
@@ -22,9 +23,11 @@ class LogoutRequest(CommandRequest, ABC):
     """Logout Request"""
 
 
-class GetUserRequest(CommandRequest, ABC):
+class GetUserRequest(ReadRequest, ABC):
     """Get User(s) Request"""
 
+    capability: ClassVar = Gate("user")
+
 
 class GetUserResponse(CommandResponse, ABC):
     """Get User(s) Response"""
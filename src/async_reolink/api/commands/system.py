@@ -2,17 +2,22 @@
 
 
 from abc import ABC
-from datetime import datetime, timedelta, timezone, tzinfo
-from typing import Final, Mapping
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import ClassVar, Final, Iterable, Mapping
 
 from ..system.typings import DaylightSavingsTimeInfo, DeviceInfo, TimeInfo, StorageInfo
 
 from ..system.capabilities import Capabilities
+from ..gating import Gate
 
-from . import CommandRequest, CommandResponse
+from ..typings import DateTimeValue
 
+from . import CommandRequest, CommandResponse, ReadRequest
 
-class GetAbilitiesRequest(CommandRequest, ABC):
+
+class GetAbilitiesRequest(ReadRequest, ABC):
     """Get Capabilities"""
 
     user_name: str | None
@@ -24,7 +29,7 @@ class GetAbilitiesResponse(CommandResponse, ABC):
     capabilities: Capabilities
 
 
-class GetDeviceInfoRequest(CommandRequest, ABC):
+class GetDeviceInfoRequest(ReadRequest, ABC):
     """Get Device Info"""
 
 
@@ -34,67 +39,244 @@ class GetDeviceInfoResponse(CommandResponse, ABC):
     info: DeviceInfo
 
 
-class GetTimeRequest(CommandRequest, ABC):
+class GetTimeRequest(ReadRequest, ABC):
     """Get Time"""
 
 
 _ZERO: Final = timedelta(0)
 
+_EPOCH_ORDINAL: Final = date(1970, 1, 1).toordinal()
+
+
+def _wall_key(value: DateTimeValue):
+    """integer ordered like wall clock times within a year"""
+    return (
+        ((value.month * 32 + value.day) * 24 + value.hour) * 60 + value.minute
+    ) * 60 + value.second
+
 
 class _timezone(tzinfo):
-    _cache: dict[(bool, int), "_timezone"] = {}
-    __slots__ = ("_hr_chg", "_ofs", "_start", "_end", "_point_cache")
+    """Device timezone
+
+    Daylight savings transitions are computed once per year, as naive
+    datetimes and wall clock keys for local times and as sorted UTC instants
+    for conversions from UTC.
+
+    Local times follow PEP 495: in the hour repeated when daylight savings
+    ends `fold=1` selects the second, standard time, occurrence, in the hour
+    skipped when it starts `fold=0` uses the offset before the transition.
+    """
+
+    _cache: dict[tuple, "_timezone"] = {}
+    __slots__ = (
+        "_hr_chg",
+        "_ofs",
+        "_dst_ofs",
+        "_start",
+        "_end",
+        "_bounds",
+        "_years",
+        "_instants",
+        "_offsets",
+    )
+
+    @staticmethod
+    def _rule(dst: DaylightSavingsTimeInfo, _time: TimeInfo):
+        if not dst.enabled:
+            return (False, _time.timezone_offset)
+        return (
+            True,
+            _time.timezone_offset,
+            dst.hour_offset,
+            *(
+                (point.month, point.week, point.weekday, point.hour, point.minute)
+                for point in (dst.start, dst.end)
+            ),
+        )
 
     @classmethod
     def get(cls, dst: DaylightSavingsTimeInfo, _time: TimeInfo):
         """get or create tinezone object"""
-        key = (dst.enabled, _time.timezone_offset)
+        key = cls._rule(dst, _time)
         if key in cls._cache:
             return cls._cache[key]
 
         return cls._cache.setdefault(key, _timezone(dst, _time))
 
     def __init__(self, dst: DaylightSavingsTimeInfo, _time: TimeInfo) -> None:
-        self._hr_chg = timedelta(hours=dst.hour_offset)
+        self._hr_chg = timedelta(hours=dst.hour_offset) if dst.enabled else _ZERO
         self._ofs = timedelta(seconds=_time.timezone_offset)
+        self._dst_ofs = self._ofs + self._hr_chg
         self._start = dst.start
         self._end = dst.end
-        self._point_cache: dict[int, (datetime, datetime)] = {}
+        self._bounds: dict[
+            int, tuple[tuple[datetime, datetime, int, int, bool], ...]
+        ] = {}
+        self._years = range(0)
+        self._instants: list[int] = []
+        self._offsets: list[timedelta] = [self._ofs]
 
     def tzname(self, __dt: datetime | None) -> str | None:
         return None
 
-    def _get_start_end(self, year: int):
-        if year in self._point_cache:
-            return self._point_cache[year]
-        return self._point_cache.setdefault(
-            year, (self._start.to_datetime(year), self._end.to_datetime(year))
-        )
+    def _year(self, year: int):
+        """daylight savings bounds of a year, by fold
+
+        Each item holds the low and high bound as naive datetimes and wall
+        keys and whether daylight savings is inside the bounds (False when it
+        spans the new year, the bounds then delimit standard time). With fold
+        0 the skipped hour is standard time and the repeated hour daylight
+        savings time, the first of the two readings, with fold 1 the other way
+        around.
+        """
+        if (bounds := self._bounds.get(year)) is not None:
+            return bounds
+        start = self._start.to_datetime(year)
+        end = self._end.to_datetime(year)
+        by_fold = []
+        for first, last in ((start + self._hr_chg, end), (start, end - self._hr_chg)):
+            inside = first <= last
+            (low, high) = (first, last) if inside else (last, first)
+            by_fold.append((low, high, _wall_key(low), _wall_key(high), inside))
+        return self._bounds.setdefault(year, tuple(by_fold))
+
+    def precompute(self, first_year: int, last_year: int):
+        """compute the transitions of a year range, done on demand otherwise"""
+
+        if not self._hr_chg:
+            return
+        if self._years:
+            first_year = min(first_year, self._years[0])
+            last_year = max(last_year, self._years[-1])
+        years = range(first_year, last_year + 1)
+        transitions: list[tuple[int, timedelta]] = []
+        for year in years:
+            start = self._start.to_datetime(year)
+            end = self._end.to_datetime(year)
+            transitions.append((_seconds(start) - _seconds(self._ofs), self._dst_ofs))
+            transitions.append((_seconds(end) - _seconds(self._dst_ofs), self._ofs))
+        transitions.sort(key=lambda transition: transition[0])
+        self._instants = [instant for instant, _ in transitions]
+        before = self._ofs if transitions[0][1] is self._dst_ofs else self._dst_ofs
+        self._offsets = [before, *(offset for _, offset in transitions)]
+        self._years = years
 
     def utcoffset(self, __dt: datetime | None) -> timedelta | None:
-        if __dt is None:
+        if __dt is None or not self._hr_chg:
             return self._ofs
         if __dt.tzinfo is not None:
             if __dt.tzinfo is not self:
                 return __dt.utcoffset()
             __dt = __dt.replace(tzinfo=None)
-        (start, end) = self._get_start_end(__dt.year)
-        if start <= __dt < end:
-            return self._ofs + self._hr_chg
+        try:
+            bounds = self._bounds[__dt.year][__dt.fold]
+        except KeyError:
+            bounds = self._year(__dt.year)[__dt.fold]
+        if (bounds[0] <= __dt < bounds[1]) is bounds[4]:
+            return self._dst_ofs
         return self._ofs
 
     def dst(self, __dt: datetime | None) -> timedelta | None:
         if __dt is None:
-            return self._hour_offset
+            return self._hr_chg
+        if not self._hr_chg:
+            return _ZERO
         if __dt.tzinfo is not None:
             if __dt.tzinfo is not self:
                 return __dt.dst()
             __dt = __dt.replace(tzinfo=None)
-        (start, end) = self._get_start_end(__dt.year)
-        if start <= __dt < end:
+        try:
+            bounds = self._bounds[__dt.year][__dt.fold]
+        except KeyError:
+            bounds = self._year(__dt.year)[__dt.fold]
+        if (bounds[0] <= __dt < bounds[1]) is bounds[4]:
             return self._hr_chg
         return _ZERO
 
+    def fromutc(self, __dt: datetime) -> datetime:
+        if __dt.tzinfo is not self:
+            raise ValueError("fromutc: dt.tzinfo is not self")
+        if not self._hr_chg:
+            return __dt + self._ofs
+        if __dt.year not in self._years:
+            self.precompute(__dt.year - 1, __dt.year + 1)
+        instant = (__dt.toordinal() - _EPOCH_ORDINAL) * 86400 + (
+            __dt.hour * 3600 + __dt.minute * 60 + __dt.second
+        )
+        index = bisect_right(self._instants, instant)
+        offset = self._offsets[index]
+        if (
+            index
+            and offset is self._ofs
+            and instant - self._instants[index - 1] < _seconds(self._hr_chg)
+        ):
+            # second occurrence of the hour repeated when daylight savings ends
+            return (__dt + offset).replace(fold=1)
+        return __dt + offset
+
+    def timestamps(self, values: Iterable[DateTimeValue]):
+        """POSIX timestamps of device local date times, converted in one pass
+
+        Values without a `fold` attribute are taken as the first occurrence
+        of a repeated hour.
+        """
+
+        offset = _seconds(self._ofs)
+        dst_offset = _seconds(self._dst_ofs)
+        days: dict[int, tuple] = {}
+        result = array("q")
+        for value in values:
+            (year, month, day) = (value.year, value.month, value.day)
+            if (entry := days.get(day_key := (year * 13 + month) * 32 + day)) is None:
+                by_fold = (
+                    self._year(year)
+                    if dst_offset != offset
+                    else ((0, 0, 0, 0, True),) * 2
+                )
+                entry = days[day_key] = (
+                    (date(year, month, day).toordinal() - _EPOCH_ORDINAL) * 86400,
+                    (month * 32 + day) * 86400,
+                    *(bounds[2:] for bounds in by_fold),
+                )
+            seconds = value.hour * 3600 + value.minute * 60 + value.second
+            bounds = entry[3] if getattr(value, "fold", 0) else entry[2]
+            if (bounds[0] <= entry[1] + seconds < bounds[1]) is bounds[2]:
+                result.append(entry[0] + seconds - dst_offset)
+            else:
+                result.append(entry[0] + seconds - offset)
+        return result
+
+    def to_utc(self, values: Iterable[DateTimeValue]):
+        """UTC datetimes of device local date times, converted in one pass"""
+        fromtimestamp = datetime.fromtimestamp
+        return [
+            fromtimestamp(instant, timezone.utc) for instant in self.timestamps(values)
+        ]
+
+    def localize(self, values: Iterable[DateTimeValue]):
+        """aware datetimes in this timezone of device local date times"""
+        return [
+            datetime(
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                tzinfo=self,
+            )
+            for value in values
+        ]
+
+
+def _seconds(value: datetime | timedelta):
+    """whole seconds since the epoch of a naive datetime, or of a timedelta"""
+    if isinstance(value, timedelta):
+        return value.days * 86400 + value.seconds
+    return (value.toordinal() - _EPOCH_ORDINAL) * 86400 + (
+        value.hour * 3600 + value.minute * 60 + value.second
+    )
+
 
 class GetTimeResponse(CommandResponse, ABC):
     """Get Time Response"""
@@ -116,8 +298,10 @@ class GetTimeResponse(CommandResponse, ABC):
 class RebootRequest(CommandRequest, ABC):
     """Reboot Request"""
 
+    capability: ClassVar = Gate("reboot")
+
 
-class GetHddInfoRequest(CommandRequest, ABC):
+class GetHddInfoRequest(ReadRequest, ABC):
     """Get HDD Info Request"""
 
 
@@ -2,24 +2,80 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterable, Callable, Coroutine, Iterable
+from functools import partial
+from typing import AsyncIterable, Callable, Coroutine, Hashable, Iterable, Sequence
 
 from .const import DEFAULT_TIMEOUT
 
-from .commands import CommandRequest, CommandResponse
+from .errors import (
+    ReolinkCircuitOpenError,
+    ReolinkConnectionError,
+    ReolinkResponseError,
+    ReolinkTimeoutError,
+)
+
+from .commands import CommandRequest, CommandResponse, ReadRequest, is_error
+
+from .batching import BatchContext, CommandHandle, Collector, active_collector, resolve
+
+from .ratelimit import RateLimiter
+
+from .retry import RetryPolicy, retrying
+
+from .circuit import CircuitBreaker, CircuitState
+
+from .scheduling import Priority, PriorityScheduler, command_priority
+
+from .observers import RequestObserver, observed
+
+from .cache import ResponseCache
+
+from .gating import CommandGate, gated
+
+from . import system
 
 
 class Connection(ABC):
     """Abstract Connection Mixin"""
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        coalesce_window: float | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        single_flight: bool = True,
+        scheduler: PriorityScheduler | None = None,
+        observers: Iterable[RequestObserver] = (),
+        response_cache: ResponseCache | None = None,
+        command_gate: CommandGate | bool = True,
+        **kwargs,
+    ) -> None:
+        self.__collector = Collector(self, coalesce_window) if coalesce_window else None
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = retry_policy
+        self.__circuit_breaker = circuit_breaker
+        self.__flights: dict[Hashable, CommandHandle | None] | None = {} if single_flight else None
+        self.__scheduler = scheduler
+        self.__observers: tuple[RequestObserver, ...] = tuple(observers)
+        if response_cache is not None:
+            response_cache.bind(self)
+        self.__response_cache = response_cache
+        if command_gate is True:
+            command_gate = CommandGate()
+        self.__command_gate: CommandGate | None = command_gate or None
+        self.__tasks: set[asyncio.Task] = set()
         self._connect_callbacks: list[
             Callable[[], Coroutine[any, any, None] | None]
         ] = []
         self._disconnect_callbacks: list[
             Callable[[], Coroutine[any, any, None] | None]
         ] = []
+        self._disconnect_callbacks.append(self.__clear_cache)
+        self._disconnect_callbacks.append(self.__clear_gate)
         super().__init__(*args, **kwargs)
 
     @property
@@ -42,6 +98,108 @@ class Connection(ABC):
         """Secure connection"""
         return False
 
+    @property
+    def coalesce_window(self):
+        """Window in seconds for coalescing concurrent commands into one batch, None when disabled"""
+        return self.__collector.window if self.__collector is not None else None
+
+    @coalesce_window.setter
+    def coalesce_window(self, value: float | None):
+        self.__collector = Collector(self, value) if value else None
+
+    @property
+    def rate_limiter(self):
+        """Request rate limiter, None when unlimited"""
+        return self.__rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: RateLimiter | None):
+        self.__rate_limiter = value
+
+    @property
+    def retry_policy(self):
+        """Retry policy for failed commands, None when not retrying"""
+        return self.__retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: RetryPolicy | None):
+        self.__retry_policy = value
+
+    @property
+    def circuit_breaker(self):
+        """Circuit breaker, None when disabled"""
+        return self.__circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: CircuitBreaker | None):
+        self.__circuit_breaker = value
+
+    @property
+    def circuit_state(self):
+        """Reachability of the device as seen by the circuit breaker"""
+        if self.__circuit_breaker is None:
+            return CircuitState.CLOSED
+        return self.__circuit_breaker.state
+
+    @property
+    def scheduler(self):
+        """Request scheduler, None when requests are not queued"""
+        return self.__scheduler
+
+    @scheduler.setter
+    def scheduler(self, value: PriorityScheduler | None):
+        self.__scheduler = value
+
+    @property
+    def observers(self):
+        """Registered request observers"""
+        return self.__observers
+
+    def add_observer(self, observer: RequestObserver):
+        """Register a request observer"""
+        if observer not in self.__observers:
+            self.__observers += (observer,)
+
+    def remove_observer(self, observer: RequestObserver):
+        """Unregister a request observer"""
+        self.__observers = tuple(_o for _o in self.__observers if _o is not observer)
+
+    @property
+    def response_cache(self):
+        """Cache of read command results, None when not caching"""
+        return self.__response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: ResponseCache | None):
+        if value is not None:
+            value.bind(self)
+        if (current := self.__response_cache) is not None and current is not value:
+            current.unbind(self)
+        self.__response_cache = value
+
+    def __clear_cache(self):
+        if self.__response_cache is not None:
+            self.__response_cache.clear()
+
+    @property
+    def command_gate(self):
+        """Gate dropping commands known to be unsupported, None when disabled"""
+        return self.__command_gate
+
+    @command_gate.setter
+    def command_gate(self, value: CommandGate | None):
+        self.__command_gate = value
+
+    def __clear_gate(self):
+        if self.__command_gate is not None:
+            self.__command_gate.forget()
+
+    def _known_capabilities(self):
+        """device capabilities already fetched, None when unknown"""
+        if isinstance(self, system.System):
+            return self._get_known_abilities()
+        return None
+
     @abstractmethod
     async def connect(
         self,
@@ -59,10 +217,266 @@ class Connection(ABC):
     def _execute(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
         ...
 
+    def __observed(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if not (observers := self.__observers):
+            return self._execute(*args)
+        return observed(self._execute(*args), args, observers, self._correlate)
+
+    async def _transmit(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if (gate := self.__command_gate) is None:
+            responses = self.__retrying(*args)
+        else:
+            responses = gated(
+                self.__retrying, args, gate, self._known_capabilities(), self._correlate
+            )
+        async for response in responses:
+            yield response
+
+    def __retrying(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if (policy := self.__retry_policy) is None:
+            return self._attempt(*args)
+        return retrying(
+            self._attempt,
+            args,
+            policy,
+            self._correlate,
+            backoff=command_priority(args) != Priority.INTERACTIVE,
+        )
+
+    async def _attempt(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if (scheduler := self.__scheduler) is None:
+            async for response in self.__guarded(*args):
+                yield response
+            return
+
+        async with scheduler.slot(command_priority(args)):
+            async for response in self.__guarded(*args):
+                yield response
+
+    async def __guarded(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if (breaker := self.__circuit_breaker) is None:
+            async for response in self._limit(*args):
+                yield response
+            return
+
+        if not breaker.allow():
+            raise ReolinkCircuitOpenError("Device unreachable")
+        if (
+            breaker.state == CircuitState.HALF_OPEN
+            and (probe := self._create_probe_request()) is not None
+        ):
+            # the probe is the trial, not whatever command came next
+            if not await self.__trial(breaker, probe):
+                raise ReolinkCircuitOpenError("Device unreachable")
+        async for response in self.__tripping(breaker, self._limit(*args)):
+            yield response
+
+    async def __trial(self, breaker: CircuitBreaker, command: CommandRequest):
+        """send a probe, closing the circuit once the device answers"""
+
+        responses = self._limit(command)
+        try:
+            async for _ in responses:
+                # any answer, error codes included, shows the device is reachable
+                breaker.success()
+                return True
+        except (ReolinkConnectionError, ReolinkTimeoutError):
+            pass
+        finally:
+            await responses.aclose()
+        breaker.failure()
+        return False
+
+    async def __tripping(
+        self, breaker: CircuitBreaker, responses: AsyncIterable[CommandResponse | bytes]
+    ):
+        received = False
+        try:
+            async for response in responses:
+                if not received:
+                    received = True
+                    breaker.success()
+                yield response
+        except (ReolinkConnectionError, ReolinkTimeoutError):
+            breaker.failure()
+            raise
+        finally:
+            if not received:
+                breaker.release()
+
+    def _create_probe_request(self) -> CommandRequest | None:
+        """cheap command used to check if the device answers"""
+        if isinstance(self, system.System):
+            return self._create_get_time_request()
+        return None
+
+    async def probe(self):
+        """Check if the device answers, updating the circuit state"""
+
+        command = self._create_probe_request()
+        if command is None:
+            return self.circuit_state != CircuitState.OPEN
+
+        if (breaker := self.__circuit_breaker) is not None:
+            return await self.__trial(breaker, command)
+        responses = self._limit(command)
+        try:
+            async for _ in responses:
+                return True
+        except (ReolinkConnectionError, ReolinkTimeoutError):
+            return False
+        return False
+
+    async def _limit(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if (limiter := self.__rate_limiter) is None:
+            async for response in self.__observed(*args):
+                yield response
+            return
+
+        await limiter.acquire()
+        received = throttled = False
+        try:
+            async for response in self.__observed(*args):
+                received = True
+                if (
+                    not throttled
+                    and is_error(response)
+                    and response.error_code in limiter.throttle_codes
+                ):
+                    throttled = True
+                    limiter.throttled()
+                yield response
+        finally:
+            # callers stop reading once they have their answer
+            if received and not throttled:
+                limiter.success()
+
+    def _correlate(
+        self, commands: Sequence[CommandRequest], response: CommandResponse, position: int
+    ) -> int:
+        """index of the command a batch response answers
+
+        Responses arrive in command order by default, implementations with
+        correlation ids should override this.
+        """
+        return position
+
+    def _submit(self, handles: Sequence[CommandHandle]):
+        task = asyncio.create_task(
+            resolve(self.batch([handle.command for handle in handles]), handles, self._correlate)
+        )
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    def _flight_key(self, command: CommandRequest) -> Hashable | None:
+        """key shared by identical read commands, None when the command must always be sent"""
+        if not isinstance(command, ReadRequest):
+            return None
+        try:
+            key = (type(command), *sorted(vars(command).items()))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __land(self, key: Hashable, handle: CommandHandle):
+        if self.__flights is not None and self.__flights.get(key) is handle:
+            del self.__flights[key]
+
+    async def _send(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        collector = active_collector.get()
+        if collector is None or collector.connection is not self:
+            collector = self.__collector
+            # interactive commands neither wait out the window nor share a batch
+            if collector is not None and command_priority(args) == Priority.INTERACTIVE:
+                collector = None
+        if (flights := self.__flights) is not None:
+            keys = [self._flight_key(command) for command in args]
+        else:
+            keys = [None] * len(args)
+        if collector is None and not any(key is not None and key in flights for key in keys):
+            if len(args) != 1 or (key := keys[0]) is None:
+                async for response in self._transmit(*args):
+                    yield response
+                return
+
+            # nothing to join, send directly; a handle is only created once an
+            # identical read joins this one, and dropped as soon as it answers
+            flights[key] = None
+            chunks: list[bytes] | None = None
+            try:
+                async for response in self._transmit(*args):
+                    if isinstance(response, bytes):
+                        if chunks is None:
+                            chunks = []
+                        chunks.append(response)
+                    elif key is not None:
+                        if (handle := flights.pop(key, None)) is not None:
+                            handle._set_result(response)
+                        key = None
+                    yield response
+                if key is not None and (handle := flights.pop(key, None)) is not None:
+                    if chunks is not None:
+                        handle._set_result(b"".join(chunks))
+                    else:
+                        handle._abandon(ReolinkResponseError("Response missing"))
+                key = None
+            except Exception as error:
+                if key is not None and (handle := flights.pop(key, None)) is not None:
+                    handle._abandon(error)
+                key = None
+                raise
+            finally:
+                if key is not None and (handle := flights.pop(key, None)) is not None:
+                    handle._abandon(ReolinkResponseError("Shared request abandoned"))
+            return
+
+        handles: list[CommandHandle] = []
+        pending: list[CommandHandle] = []
+        for command, key in zip(args, keys):
+            if key is not None and key in flights:
+                if (handle := flights[key]) is None:
+                    handle = flights[key] = CommandHandle(command)
+                handles.append(handle)
+                continue
+            handle = CommandHandle(command)
+            if key is not None:
+                flights[key] = handle
+                handle.add_done_callback(partial(self.__land, key))
+            handles.append(handle)
+            pending.append(handle)
+
+        if pending:
+            if collector is not None:
+                collector.add(pending)
+            else:
+                self._submit(pending)
+        for handle, key in zip(handles, keys):
+            # shared reads must not be cancelled by a single waiter
+            yield await (handle.shield() if key is not None else handle)
+
     def batch(
         self,
         commands: Iterable[CommandRequest],
     ):
         """Execute a batch of commands"""
 
-        return self._execute(*commands)
+        return self._transmit(*commands)
+
+    def batched(self):
+        """Context collecting mixin calls into a single batch
+
+        `async with connection.batched() as batch:` calls such as
+        `batch.get_time()` return pending results that complete once
+        the context exits.
+        """
+
+        return BatchContext(self)
+
+    def submit(self, commands: Iterable[CommandRequest]):
+        """Execute a batch of commands, returning a pending handle per command"""
+
+        handles = [CommandHandle(command) for command in commands]
+        if handles:
+            self._submit(handles)
+        return handles
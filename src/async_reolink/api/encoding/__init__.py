@@ -2,12 +2,11 @@
 
 from abc import ABC, abstractmethod
 
-from ..errors import ErrorCodes, ReolinkResponseError
+from ..errors import ErrorCodes
 
-from ..commands import CommandErrorResponse
 from ..commands.encoding import GetEncodingRequest, GetEncodingResponse
 
-from .. import connection
+from ..executor import command
 
 
 class Encoding(ABC):
@@ -17,20 +16,14 @@ class Encoding(ABC):
     def _create_get_encoding_request(self, channel: int) -> GetEncodingRequest:
         ...
 
-    async def get_encoding(self, channel: int = 0):
+    @command(
+        GetEncodingResponse,
+        "info",
+        channel="channel",
+        error="Get Encoding failed",
+        cache="get_encoding",
+    )
+    def get_encoding(self, channel: int = 0):
         """Get Encoding Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_encoding_request(channel)
-            ):
-                if (
-                    isinstance(response, GetEncodingResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get AI State failed")
-
-        raise ReolinkResponseError("Get AI State failed")
+        return self._create_get_encoding_request(channel)
@@ -127,6 +127,10 @@ class ReolinkConnectionError(ReolinkError):
     """ReoLink Connection Error"""
 
 
+class ReolinkCircuitOpenError(ReolinkConnectionError):
+    """ReoLink Device marked unreachable"""
+
+
 class ReolinkTimeoutError(ReolinkError):
     """Reolink Operation Timeout"""
 
@@ -0,0 +1,160 @@
+"""Declarative Command Methods"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+from functools import update_wrapper
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from .errors import ReolinkResponseError
+
+from .cache import ResponseCache
+
+from .commands import CommandRequest, CommandResponse, ResponseKind, response_kind
+
+_MISSING: Any = object()
+
+
+def _argument(func: Callable, name: str):
+    """positional index (excluding self) and default of a named argument"""
+
+    for index, param in enumerate(inspect.signature(func).parameters.values()):
+        if param.name == name:
+            default = (
+                None if param.default is inspect.Parameter.empty else param.default
+            )
+            if param.kind is inspect.Parameter.KEYWORD_ONLY:
+                index = sys.maxsize
+            return (index - 1, default)
+    return None
+
+
+def _router(
+    response_type: type | None,
+    extract: Callable[[Any], Any] | None,
+    channel: bool,
+    error: str,
+):
+    """specialized response matcher, returns _MISSING for unrelated responses"""
+
+    if response_type is None:
+
+        def route_code(response: CommandResponse, _channel: int | None):
+            kind = response_kind(response)
+            if kind is ResponseKind.ERROR:
+                response.throw(error)
+            if kind is ResponseKind.CODE:
+                return True
+            return _MISSING
+
+        return route_code
+
+    if extract is None:
+
+        def extract(response):
+            return response
+
+    if not channel:
+
+        def route(response: CommandResponse, _channel: int | None):
+            if isinstance(response, response_type):
+                return extract(response)
+            if response_kind(response) is ResponseKind.ERROR:
+                response.throw(error)
+            return _MISSING
+
+        return route
+
+    def route_channel(response: CommandResponse, _channel: int | None):
+        if isinstance(response, response_type) and response.channel_id == _channel:
+            return extract(response)
+        if response_kind(response) is ResponseKind.ERROR:
+            response.throw(error)
+        return _MISSING
+
+    return route_channel
+
+
+def command(
+    response_type: type[CommandResponse] | None = None,
+    value: str | Callable[[Any], Any] | None = None,
+    *,
+    error: str,
+    channel: str | None = None,
+    default: Callable[[Any], Any] | None = None,
+    send: str = "_send",
+    cache: str | None = None,
+    evicts: Iterable[str] = (),
+):
+    """Command method from a request factory
+
+    The decorated function builds the request, the resulting coroutine method
+    sends it through the connection `send` method and returns `value` (an
+    attribute name or callable) of the first `response_type` response, or True
+    for a response code when `response_type` is None. `channel` names the
+    argument a response `channel_id` must match. Error responses raise with
+    `error`, when nothing matches `default(self)` is returned or `error` raised.
+
+    Results are kept in the connection response cache under the `cache` name
+    and the channel argument, the `evicts` names are dropped for the channel
+    once the command completes.
+
+    The response matching is specialized once, when the class is created.
+    """
+
+    extract = attrgetter(value) if isinstance(value, str) else value
+    route = _router(response_type, extract, channel is not None, error)
+    evicts = tuple(evicts)
+
+    def decorator(factory: Callable[..., CommandRequest]):
+        if (argument := _argument(factory, channel or "channel")) is not None:
+            index, fallback = argument
+            name = channel or "channel"
+        elif channel is not None:
+            raise TypeError(f"{factory.__qualname__} has no argument {channel}")
+        else:
+            index = None
+        caching = cache is not None or bool(evicts)
+
+        async def method(self, *args, **kwargs):
+            if (_send := getattr(self, send, None)) is not None:
+                if index is None:
+                    _channel = None
+                elif index < len(args):
+                    _channel = args[index]
+                else:
+                    _channel = kwargs.get(name, fallback)
+                if caching and (_cache := self.response_cache) is not None:
+                    return await cached(self, _send, _cache, _channel, args, kwargs)
+                async for response in _send(factory(self, *args, **kwargs)):
+                    if (result := route(response, _channel)) is not _MISSING:
+                        return result
+
+            if default is not None:
+                return default(self)
+            raise ReolinkResponseError(error)
+
+        async def cached(self, _send, _cache: ResponseCache, _channel, args, kwargs):
+            if cache is not None:
+                if (result := _cache.get(cache, _channel, _MISSING)) is not _MISSING:
+                    return result
+                epoch = _cache.epoch
+            try:
+                async for response in _send(factory(self, *args, **kwargs)):
+                    if (result := route(response, _channel)) is not _MISSING:
+                        if cache is not None:
+                            _cache.put(cache, _channel, result, epoch)
+                        return result
+            finally:
+                for evicted in evicts:
+                    _cache.evict(evicted, _channel)
+
+            if default is not None:
+                return default(self)
+            raise ReolinkResponseError(error)
+
+        return update_wrapper(method, factory)
+
+    return decorator
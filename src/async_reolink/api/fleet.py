@@ -0,0 +1,159 @@
+"""Device Fleet"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+from .errors import ReolinkTimeoutError
+
+from .connection import Connection
+
+_C = TypeVar("_C", bound=Connection)
+_R = TypeVar("_R")
+
+Selector = Callable[[_C], bool]
+"""Device selection predicate"""
+
+
+class FleetResult(Generic[_C, _R]):
+    """Outcome of a fleet call on a single device"""
+
+    __slots__ = ("device", "value", "error")
+
+    def __init__(self, device: _C, value: _R | None = None, error: BaseException | None = None):
+        self.device = device
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        """call succeeded"""
+        return self.error is None
+
+    def result(self) -> _R:
+        """value of the call, raises the error if it failed"""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        outcome = repr(self.value) if self.error is None else self.error
+        return f"<FleetResult {self.device.hostname}: {outcome}>"
+
+
+class Fleet(Generic[_C]):
+    """Pool of device connections with global and per host concurrency limits"""
+
+    def __init__(
+        self,
+        devices: Iterable[_C] = (),
+        *,
+        max_concurrency: int = 64,
+        max_per_host: int = 1,
+    ) -> None:
+        self._devices: dict[int, _C] = {}
+        self._max_per_host = max_per_host
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        for device in devices:
+            self.add(device)
+
+    def add(self, device: _C):
+        """add device to fleet"""
+        self._devices[id(device)] = device
+
+    def remove(self, device: _C):
+        """remove device from fleet"""
+        self._devices.pop(id(device), None)
+
+    def __len__(self):
+        return len(self._devices)
+
+    def __iter__(self) -> Iterator[_C]:
+        return iter(list(self._devices.values()))
+
+    def __contains__(self, device: object):
+        return id(device) in self._devices
+
+    def select(self, selector: Selector[_C] | Iterable[_C] | None = None):
+        """devices matching selection"""
+
+        if selector is None:
+            return list(self)
+        if callable(selector):
+            return [device for device in self if selector(device)]
+        return [device for device in selector if device in self]
+
+    def _host_limit(self, device: _C):
+        host = str(device.hostname)
+        if (limit := self._host_limits.get(host)) is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self._max_per_host)
+        return limit
+
+    async def _call(
+        self,
+        device: _C,
+        func: Callable[..., Awaitable[_R]],
+        args: tuple,
+        kwargs: dict[str, Any],
+        timeout: float | None,
+    ):
+        async with self._host_limit(device), self._limit:
+            try:
+                if timeout is None:
+                    return FleetResult(device, await func(device, *args, **kwargs))
+                try:
+                    return FleetResult(
+                        device, await asyncio.wait_for(func(device, *args, **kwargs), timeout)
+                    )
+                except asyncio.TimeoutError as error:
+                    raise ReolinkTimeoutError(f"{device.hostname} timed out") from error
+            except Exception as error:  # pylint: disable=broad-except
+                return FleetResult(device, error=error)
+
+    async def run(
+        self,
+        func: Callable[..., Awaitable[_R]] | str,
+        *args,
+        devices: Selector[_C] | Iterable[_C] | None = None,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> AsyncIterator[FleetResult[_C, _R]]:
+        """Run a coroutine across the selected devices
+
+        `func` is a mixin method name or a callable taking the device as its first
+        argument, results are yielded in completion order.
+        """
+
+        if isinstance(func, str):
+            method = func
+
+            def call(device: _C, *args, **kwargs):
+                return getattr(device, method)(*args, **kwargs)
+
+        else:
+            call = func
+
+        tasks = {
+            asyncio.ensure_future(self._call(device, call, args, kwargs, timeout))
+            for device in self.select(devices)
+        }
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,186 @@
+"""Capability Gating"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, AsyncIterable, Callable, Final, Hashable, Iterable, Sequence
+
+from .errors import ErrorCodes
+
+from .commands import (
+    CommandErrorResponse,
+    CommandRequest,
+    CommandResponse,
+    ResponseKind,
+    register_response_kind,
+    response_kind,
+)
+
+UNSUPPORTED_CODES: Final = frozenset((ErrorCodes.NOT_SUPPORTED,))
+"""Error codes meaning a command will keep failing on this device
+
+ABILITY is left out, it depends on the logged in user's permissions.
+"""
+
+
+class Gate:
+    """Capability a command depends on
+
+    Request classes declare it with a `capability` class attribute, `path` is
+    a dotted attribute path into `Capabilities`, or into the command channel
+    `ChannelCapabilities` when `channel` is set. The command is supported when
+    `accept` returns true for the capability value.
+    """
+
+    __slots__ = ("path", "channel", "_accept", "_getter")
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        channel: bool = False,
+        accept: Callable[[Any], bool] = bool,
+    ) -> None:
+        self.path = path
+        self.channel = channel
+        self._accept = accept
+        self._getter = attrgetter(path)
+
+    def __repr__(self) -> str:
+        scope = "channel" if self.channel else "device"
+        return f"<Gate {scope} {self.path}>"
+
+    def supported(self, command: CommandRequest, capabilities: Any) -> bool | None:
+        """command is supported, None when the capabilities do not tell"""
+
+        if self.channel:
+            channels = getattr(capabilities, "channels", None)
+            if (
+                not channels
+                or (channel := getattr(command, "channel_id", None)) is None
+            ):
+                return None
+            if (capabilities := channels.get(channel)) is None:
+                return None
+        try:
+            capability = self._getter(capabilities)
+        except AttributeError:
+            return None
+        return bool(self._accept(getattr(capability, "value", capability)))
+
+
+@register_response_kind(ResponseKind.ERROR)
+class SkippedResponse(CommandErrorResponse):
+    """Error response standing in for a command that was not sent"""
+
+    def __init__(self, error_code: int, details: str | None = None) -> None:
+        self.error_code = error_code
+        self.details = details
+
+    def __repr__(self) -> str:
+        return f"<SkippedResponse {self.error_code}: {self.details}>"
+
+
+class CommandGate:
+    """Drops commands known to fail before they are sent
+
+    Commands are checked against the gate declared on their request class
+    and the known device capabilities, and against error codes the device
+    already answered for the same command type and channel.
+    """
+
+    __slots__ = ("_learn_codes", "_learned", "_gates")
+
+    def __init__(self, learn_codes: Iterable[int] = UNSUPPORTED_CODES) -> None:
+        self._learn_codes = frozenset(learn_codes)
+        self._learned: dict[Hashable, int] = {}
+        self._gates: dict[type, Gate | None] = {}
+
+    def _key(self, command: CommandRequest):
+        return (type(command), getattr(command, "channel_id", None))
+
+    def gate(self, command: CommandRequest) -> Gate | None:
+        """capability gate of a command"""
+
+        try:
+            return self._gates[type(command)]
+        except KeyError:
+            gate = getattr(type(command), "capability", None)
+            if not isinstance(gate, Gate):
+                gate = None
+            return self._gates.setdefault(type(command), gate)
+
+    def check(self, command: CommandRequest, capabilities: Any = None):
+        """error response for a command that should not be sent, None otherwise"""
+
+        if (
+            self._learned
+            and (code := self._learned.get(self._key(command))) is not None
+        ):
+            return SkippedResponse(code, "Not supported by device")
+        if (
+            capabilities is not None
+            and (gate := self.gate(command)) is not None
+            and gate.supported(command, capabilities) is False
+        ):
+            return SkippedResponse(
+                ErrorCodes.NOT_SUPPORTED, f"Capability {gate.path} not supported"
+            )
+        return None
+
+    def learn(self, command: CommandRequest, response: CommandResponse):
+        """remember commands the device refused as unsupported"""
+
+        if (code := getattr(response, "error_code", None)) in self._learn_codes:
+            self._learned[self._key(command)] = code
+
+    def forget(self):
+        """drop learned failures"""
+        self._learned.clear()
+
+
+async def gated(
+    send: Callable[..., AsyncIterable[CommandResponse | bytes]],
+    commands: Sequence[CommandRequest],
+    gate: CommandGate,
+    capabilities: Any,
+    correlate: Callable[[Sequence[CommandRequest], CommandResponse, int], int],
+) -> AsyncIterable[CommandResponse | bytes]:
+    """Send the commands that may succeed, answering the others locally
+
+    Responses keep command order, learned failures are recorded on the way.
+    """
+
+    skipped: list[tuple[int, CommandResponse]] = []
+    sent: list[int] = []
+    for index, command in enumerate(commands):
+        if (response := gate.check(command, capabilities)) is not None:
+            skipped.append((index, response))
+        else:
+            sent.append(index)
+
+    if sent:
+        sending = [commands[index] for index in sent] if skipped else commands
+        position = 0
+        streaming = False
+        async for response in send(*sending):
+            kind = response_kind(response)
+            if kind is ResponseKind.DATA:
+                # a stream answers one command, like a response does
+                if not streaming:
+                    streaming = True
+                    position += 1
+                yield response
+                continue
+            streaming = False
+            index = correlate(sending, response, position)
+            position += 1
+            if 0 <= index < len(sent):
+                if kind is ResponseKind.ERROR:
+                    gate.learn(sending[index], response)
+                while skipped and skipped[0][0] < sent[index]:
+                    yield skipped.pop(0)[1]
+            yield response
+
+    for _, response in skipped:
+        yield response
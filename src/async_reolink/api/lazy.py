@@ -0,0 +1,100 @@
+"""Lazy Views
+
+Containers keeping the raw items of a response and building typed
+objects only when they are first accessed, so callers reading one entry
+of a large response do not pay for the rest of it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Iterator, TypeVar, overload
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+_MISSING: Any = object()
+
+
+class LazyMapping(Mapping[_K, _V]):
+    """Mapping decoding each raw value on first access"""
+
+    __slots__ = ("_raw", "_decode", "_values")
+
+    def __init__(self, raw: Mapping[_K, Any], decode: Callable[[Any], _V]) -> None:
+        self._raw = raw
+        self._decode = decode
+        self._values: dict[_K, _V] = {}
+
+    def __getitem__(self, key: _K) -> _V:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self._values[key] = self._decode(self._raw[key])
+        return value
+
+    def __contains__(self, key: object):
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {len(self._values)}/{len(self._raw)} decoded>"
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    @property
+    def decoded(self):
+        """number of values decoded so far"""
+        return len(self._values)
+
+
+class LazySequence(Sequence[_V]):
+    """Sequence decoding each raw item on first access"""
+
+    __slots__ = ("_raw", "_decode", "_values")
+
+    def __init__(self, raw: Sequence[Any], decode: Callable[[Any], _V]) -> None:
+        self._raw = raw
+        self._decode = decode
+        self._values: list[_V] = [_MISSING] * len(raw)
+
+    @overload
+    def __getitem__(self, index: int) -> _V:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_V]:
+        ...
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._values)))]
+        value = self._values[index]
+        if value is _MISSING:
+            value = self._values[index] = self._decode(self._raw[index])
+        return value
+
+    def __iter__(self) -> Iterator[_V]:
+        for index in range(len(self._values)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.decoded}/{len(self._values)} decoded>"
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    @property
+    def decoded(self):
+        """number of items decoded so far"""
+        return sum(1 for value in self._values if value is not _MISSING)
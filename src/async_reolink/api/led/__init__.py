@@ -9,10 +9,10 @@ from ..led.typings import LightStates, LightingSchedule, WhiteLedInfo
 
 from ..typings import PercentValue
 
-from .. import connection, ai
-from ..commands import CommandErrorResponse, ResponseCode, led
+from .. import ai
+from ..commands import led
 
-from ..errors import ReolinkResponseError
+from ..executor import command
 
 
 class LED(ABC):
@@ -22,23 +22,17 @@ class LED(ABC):
     def _create_get_ir_lights_request(self, channel: int) -> led.GetIrLightsRequest:
         ...
 
-    async def get_ir_lights(self, channel: int = 0):
+    @command(
+        led.GetIrLightsResponse,
+        "state",
+        channel="channel",
+        error="Get IR Lights failed",
+        cache="get_ir_lights",
+    )
+    def get_ir_lights(self, channel: int = 0):
         """Get IR Light State Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ir_lights_request(channel)
-            ):
-                if (
-                    isinstance(response, led.GetIrLightsResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.state
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get IR Lights failed")
-
-        raise ReolinkResponseError("Get IR Lights failed")
+        return self._create_get_ir_lights_request(channel)
 
     @abstractmethod
     def _create_set_ir_lights_request(
@@ -46,42 +40,27 @@ class LED(ABC):
     ) -> led.SetIrLightsRequest:
         ...
 
-    async def set_ir_lights(self, state: LightStates, channel: int = 0):
+    @command(error="Set IR Lights failed", evicts=("get_ir_lights",))
+    def set_ir_lights(self, state: LightStates, channel: int = 0):
         """Set IR Light State"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ir_lights_request(state, channel)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set IR Lights failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set IR Lights failed")
+        return self._create_set_ir_lights_request(state, channel)
 
     @abstractmethod
     def _create_get_power_led_request(self, channel: int) -> led.GetPowerLedRequest:
         ...
 
-    async def get_power_led(self, channel: int = 0):
+    @command(
+        led.GetPowerLedResponse,
+        "state",
+        channel="channel",
+        error="Get Power Led failed",
+        cache="get_power_led",
+    )
+    def get_power_led(self, channel: int = 0):
         """Get Power Led State Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_power_led_request(channel)
-            ):
-                if (
-                    isinstance(response, led.GetPowerLedResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.state
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get Power Led failed")
-
-        raise ReolinkResponseError("Get Power Led failed")
+        return self._create_get_power_led_request(channel)
 
     @abstractmethod
     def _create_set_power_led_request(
@@ -89,42 +68,27 @@ class LED(ABC):
     ) -> led.SetPowerLedRequest:
         ...
 
-    async def set_power_led(self, state: LightStates, channel: int):
+    @command(error="Set Power Led failed", evicts=("get_power_led",))
+    def set_power_led(self, state: LightStates, channel: int):
         """Set Power Led State"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_power_led_request(state, channel)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set Power Led failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set Power Led failed")
+        return self._create_set_power_led_request(state, channel)
 
     @abstractmethod
     def _create_get_white_led_request(self, channel: int) -> led.GetWhiteLedRequest:
         ...
 
-    async def get_white_led(self, channel: int = 0):
+    @command(
+        led.GetWhiteLedResponse,
+        "info",
+        channel="channel",
+        error="Get White Led failed",
+        cache="get_white_led",
+    )
+    def get_white_led(self, channel: int = 0):
         """Get White Led State Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_power_led_request(channel)
-            ):
-                if (
-                    isinstance(response, led.GetWhiteLedResponse)
-                    and response.channel_id == channel
-                ):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get White Led failed")
-
-        raise ReolinkResponseError("Get White Led failed")
+        return self._create_get_white_led_request(channel)
 
     @abstractmethod
     def _create_set_white_led_request(
@@ -134,21 +98,12 @@ class LED(ABC):
     ) -> led.SetWhiteLedRequest:
         ...
 
-    async def set_white_led(
+    @command(error="Set White Led failed", evicts=("get_white_led",))
+    def set_white_led(
         self,
         value: WhiteLedInfo,
         channel: int = 0,
     ):
         """Set White Led State"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_white_led_request(value, channel)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set White Led failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set White Led failed")
+        return self._create_set_white_led_request(value, channel)
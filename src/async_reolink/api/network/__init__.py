@@ -2,9 +2,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 
-from ..errors import ReolinkResponseError
+from ..commands import CommandResponse, network
 
-from ..commands import CommandErrorResponse, CommandResponse, network
+from ..executor import command
 
 from ..typings import StreamTypes
 
@@ -18,7 +18,7 @@ class Network(ABC):
         super().__init__(*args, **kwargs)
         self.__link = None
         self.__ports = None
-        self.__no_get_rtsp = None
+        self.__no_get_rtsp = False
 
         if isinstance(self, connection.Connection):
             self._disconnect_callbacks.append(self.__clear)
@@ -36,36 +36,32 @@ class Network(ABC):
         """Get Local Link"""
 
         self.__link = None
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_local_link_request()):
-                if isinstance(response, network.GetLocalLinkResponse):
-                    link = response.local_link
-                    self.__link = link
-                    return link
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get local link failed")
-
-        raise ReolinkResponseError("Get local link failed")
+        link = await self.__get_local_link()
+        self.__link = link
+        return link
+
+    @command(
+        network.GetLocalLinkResponse,
+        "local_link",
+        error="Get local link failed",
+        cache="get_local_link",
+    )
+    def __get_local_link(self):
+        return self._create_get_local_link_request()
 
     @abstractmethod
     def _create_get_channel_status_request(self) -> network.GetChannelStatusRequest:
         ...
 
-    async def get_channel_status(self):
+    @command(
+        network.GetChannelStatusResponse,
+        "channels",
+        error="Get channel status failed",
+    )
+    def get_channel_status(self):
         """Get Channel Statuses"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_channel_status_request()
-            ):
-                if isinstance(response, network.GetChannelStatusResponse):
-                    return response.channels
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get channel status failed")
-
-        raise ReolinkResponseError("Get channel status failed")
+        return self._create_get_channel_status_request()
 
     @abstractmethod
     def _create_get_ports_request(self) -> network.GetNetworkPortsRequest:
@@ -75,17 +71,18 @@ class Network(ABC):
         """Get Network Ports"""
 
         self.__ports = None
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_ports_request()):
-                if isinstance(response, network.GetNetworkPortsResponse):
-                    ports = response.ports
-                    self.__ports = ports
-                    return ports
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get network ports failed")
-
-        raise ReolinkResponseError("Get network ports failed")
+        ports = await self.__get_ports()
+        self.__ports = ports
+        return ports
+
+    @command(
+        network.GetNetworkPortsResponse,
+        "ports",
+        error="Get network ports failed",
+        cache="get_ports",
+    )
+    def __get_ports(self):
+        return self._create_get_ports_request()
 
     async def _ensure_ports_and_link(self):
 
@@ -102,12 +99,11 @@ class Network(ABC):
 
         if not commands:
             return
-        if isinstance(self, connection.Connection):
-            responses = self.batch(commands)
-        else:
+        if not isinstance(self, connection.Connection):
             return
 
-        async for response in responses:
+        for handle in self.submit(commands):
+            response = await handle
             if isinstance(response, network.GetLocalLinkResponse):
                 self.__link = response.local_link
             elif isinstance(response, network.GetNetworkPortsResponse):
@@ -124,23 +120,17 @@ class Network(ABC):
     ):
         """Get RTSP Url"""
 
-        if self.__no_get_rtsp is None:
-            self.__no_get_rtsp = True
+        if not self.__no_get_rtsp and isinstance(self, connection.Connection):
             if isinstance(self, system.System):
-                abilities = await self._ensure_abilities()
-                self.__no_get_rtsp = (
-                    abilities.schedule_version.value
-                    == system.capabilities.ScheduleVersion.BASIC
-                )
-
-        if not self.__no_get_rtsp:
-            if isinstance(self, connection.Connection):
-                async for response in self._execute(
-                    self._create_get_rtsp_urls_request(0)
-                ):
-                    if isinstance(response, network.GetRTSPUrlsResponse):
-                        return response.urls[stream]
-
+                # capabilities let the command gate skip unsupported devices
+                await self._ensure_abilities()
+            async for response in self._send(
+                self._create_get_rtsp_urls_request(channel)
+            ):
+                if isinstance(response, network.GetRTSPUrlsResponse):
+                    return response.urls[stream]
+            # refused, not asked again until reconnect when the gate is off
+            # or did not learn the error
             self.__no_get_rtsp = True
 
         await self._ensure_ports_and_link()
@@ -174,47 +164,33 @@ class Network(ABC):
     def _create_get_p2p_request(self) -> network.GetP2PRequest:
         ...
 
-    async def get_p2p(self):
+    @command(
+        network.GetP2PResponse, "info", error="Get p2p info failed", cache="get_p2p"
+    )
+    def get_p2p(self):
         """Get P2P"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_p2p_request()):
-                if isinstance(response, network.GetP2PResponse):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get p2p info failed")
-
-        raise ReolinkResponseError("Get p2p info failed")
+        return self._create_get_p2p_request()
 
     def _create_get_wifi_info_request(self) -> network.GetWifiInfoRequest:
         ...
 
-    async def get_wifi(self):
+    @command(
+        network.GetWifiInfoResponse,
+        "info",
+        error="Get wifi info failed",
+        cache="get_wifi",
+    )
+    def get_wifi(self):
         """Get Wifi Info"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_wifi_info_request()):
-                if isinstance(response, network.GetWifiInfoResponse):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get wifi info failed")
-
-        raise ReolinkResponseError("Get wifi info failed")
+        return self._create_get_wifi_info_request()
 
     def _create_get_wifi_signal_request(self) -> network.GetWifiSignalRequest:
         ...
 
-    async def get_wifi_signal(self):
+    @command(network.GetWifiSignalResponse, "signal", error="Get wifi signal failed")
+    def get_wifi_signal(self):
         """Get Wifi Signal Strength"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_wifi_signal_request()):
-                if isinstance(response, network.GetWifiSignalResponse):
-                    return response.signal
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get wifi signal failed")
-
-        raise ReolinkResponseError("Get wifi signal failed")
+        return self._create_get_wifi_signal_request()
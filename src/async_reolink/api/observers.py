@@ -0,0 +1,316 @@
+"""Request Observers"""
+
+from __future__ import annotations
+
+from collections import Counter
+from time import perf_counter_ns
+from typing import AsyncIterable, Callable, Sequence
+
+from .commands import CommandRequest, CommandResponse, ResponseKind, response_kind
+
+
+class ObservedRequest:
+    """A device request as seen by observers
+
+    Times are `perf_counter_ns` values, `errors` holds the error code per
+    command index for error responses.
+    """
+
+    __slots__ = (
+        "commands",
+        "started",
+        "first_byte",
+        "completed",
+        "byte_count",
+        "responses",
+        "errors",
+        "error",
+    )
+
+    def __init__(self, commands: Sequence[CommandRequest]) -> None:
+        self.commands = commands
+        self.started = perf_counter_ns()
+        self.first_byte: int | None = None
+        self.completed: int | None = None
+        self.byte_count = 0
+        self.responses = 0
+        self.errors: dict[int, int] = {}
+        self.error: BaseException | None = None
+
+    @property
+    def batch_size(self):
+        """number of commands in the request"""
+        return len(self.commands)
+
+    @property
+    def latency(self):
+        """seconds from start to completion, None while running"""
+        if self.completed is None:
+            return None
+        return (self.completed - self.started) / 1e9
+
+    @property
+    def time_to_first_byte(self):
+        """seconds from start to the first response, None before it arrived"""
+        if self.first_byte is None:
+            return None
+        return (self.first_byte - self.started) / 1e9
+
+    def command_type(self, index: int):
+        """command type name"""
+        return type(self.commands[index]).__name__
+
+    def channel(self, index: int) -> int | None:
+        """command channel, None for device wide commands"""
+        return getattr(self.commands[index], "channel_id", None)
+
+
+class RequestObserver:
+    """Connection request observer
+
+    Override the callbacks of interest, they run inline on the request path
+    and must not raise or block.
+    """
+
+    def request_started(self, request: ObservedRequest) -> None:
+        """request is about to be sent"""
+
+    def first_byte(self, request: ObservedRequest) -> None:
+        """first response or data of the request arrived"""
+
+    def response_received(
+        self,
+        request: ObservedRequest,
+        index: int,
+        response: CommandResponse,
+        elapsed: int,
+    ) -> None:
+        """response for the command at `index` arrived `elapsed` ns after start"""
+
+    def request_completed(self, request: ObservedRequest) -> None:
+        """request finished, `request.error` is set when it failed
+
+        Cancellation or the consumer stopping early count as completion.
+        """
+
+
+async def observed(
+    responses: AsyncIterable[CommandResponse | bytes],
+    commands: Sequence[CommandRequest],
+    observers: Sequence[RequestObserver],
+    correlate: Callable[[Sequence[CommandRequest], CommandResponse, int], int],
+) -> AsyncIterable[CommandResponse | bytes]:
+    """Pass responses through, reporting the request to observers"""
+
+    request = ObservedRequest(commands)
+    for observer in observers:
+        observer.request_started(request)
+    now: int | None = None
+    completed: int | None = None
+    # a stream answers one command, like a response does
+    position = 0
+    streaming = False
+    try:
+        async for response in responses:
+            now = perf_counter_ns()
+            if request.first_byte is None:
+                request.first_byte = now
+                for observer in observers:
+                    observer.first_byte(request)
+            kind = response_kind(response)
+            if kind is ResponseKind.DATA:
+                request.byte_count += len(response)
+                if not streaming:
+                    streaming = True
+                    position += 1
+            else:
+                streaming = False
+                index = correlate(commands, response, position)
+                position += 1
+                request.responses += 1
+                if kind is ResponseKind.ERROR:
+                    request.errors[index] = response.error_code
+                for observer in observers:
+                    observer.response_received(
+                        request, index, response, now - request.started
+                    )
+            yield response
+    except GeneratorExit:
+        # the consumer stopped early, possibly long before finalization,
+        # the request was done with the last response it took
+        completed = now
+        raise
+    except Exception as error:
+        request.error = error
+        raise
+    finally:
+        request.completed = completed or perf_counter_ns()
+        for observer in observers:
+            observer.request_completed(request)
+
+
+class LatencyHistogram:
+    """Log linear (HDR style) latency histogram
+
+    Values are kept as integer nanoseconds in buckets with a relative width
+    of 2**-(precision - 1), so percentiles are accurate to that fraction.
+    """
+
+    __slots__ = ("_precision", "_half", "_counts", "_count", "_total", "_min", "_max")
+
+    def __init__(self, precision: int = 8) -> None:
+        self._precision = max(precision, 2)
+        self._half = 1 << (self._precision - 1)
+        self._counts: dict[int, int] = {}
+        self._count = 0
+        self._total = 0
+        self._min: int | None = None
+        self._max: int | None = None
+
+    def _index(self, value: int):
+        if (shift := value.bit_length() - self._precision) <= 0:
+            return value
+        return shift * self._half + (value >> shift)
+
+    def _value(self, index: int):
+        """midpoint of a bucket"""
+        if index < (self._half << 1):
+            return index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return (mantissa << shift) + (1 << (shift - 1))
+
+    @property
+    def count(self):
+        """number of recorded values"""
+        return self._count
+
+    @property
+    def min(self):
+        """smallest value in seconds"""
+        return self._min / 1e9 if self._min is not None else None
+
+    @property
+    def max(self):
+        """largest value in seconds"""
+        return self._max / 1e9 if self._max is not None else None
+
+    @property
+    def mean(self):
+        """mean value in seconds"""
+        return self._total / self._count / 1e9 if self._count else None
+
+    def record_ns(self, value: int, count: int = 1):
+        """record a value in nanoseconds"""
+
+        value = max(int(value), 0)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self._count += count
+        self._total += value * count
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def record(self, seconds: float):
+        """record a value in seconds"""
+        self.record_ns(seconds * 1e9)
+
+    def percentile(self, percent: float):
+        """value in seconds at or below which `percent` of the values fall"""
+
+        if not self._count:
+            return None
+        target = max(1, -(-self._count * percent // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(max(self._value(index), self._min), self._max) / 1e9
+        return self._max / 1e9
+
+    def merge(self, other: LatencyHistogram):
+        """add the values of another histogram with the same precision"""
+
+        if other._precision != self._precision:
+            raise ValueError("Histogram precision differs")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self._count += other._count
+        self._total += other._total
+        if other._min is not None and (self._min is None or other._min < self._min):
+            self._min = other._min
+        if other._max is not None and (self._max is None or other._max > self._max):
+            self._max = other._max
+
+    def reset(self):
+        """clear all values"""
+        self._counts.clear()
+        self._count = self._total = 0
+        self._min = self._max = None
+
+
+class HistogramObserver(RequestObserver):
+    """Aggregates per command type latency, data size and error counts in memory"""
+
+    def __init__(self, precision: int = 8) -> None:
+        self._precision = precision
+        self.latency: dict[str, LatencyHistogram] = {}
+        """response latency by command type"""
+        self.first_byte_latency: dict[str, LatencyHistogram] = {}
+        """time to first byte by command type of single command requests"""
+        self.byte_count: Counter[str] = Counter()
+        """streamed bytes by command type of single command requests"""
+        self.errors: Counter[tuple[str, int]] = Counter()
+        """error responses by command type and error code"""
+        self.failures: Counter[str] = Counter()
+        """failed requests by exception type"""
+        self.batch_sizes: Counter[int] = Counter()
+        """requests by number of commands"""
+
+    def _histogram(self, table: dict[str, LatencyHistogram], name: str):
+        if (histogram := table.get(name)) is None:
+            histogram = table[name] = LatencyHistogram(self._precision)
+        return histogram
+
+    def response_received(
+        self,
+        request: ObservedRequest,
+        index: int,
+        response: CommandResponse,
+        elapsed: int,
+    ):
+        if not 0 <= index < len(request.commands):
+            return
+        name = request.command_type(index)
+        self._histogram(self.latency, name).record_ns(elapsed)
+        if index in request.errors:
+            self.errors[(name, request.errors[index])] += 1
+
+    def request_completed(self, request: ObservedRequest):
+        self.batch_sizes[request.batch_size] += 1
+        if request.error is not None:
+            self.failures[type(request.error).__name__] += 1
+        if request.batch_size != 1:
+            return
+        name = request.command_type(0)
+        if request.first_byte is not None:
+            self._histogram(self.first_byte_latency, name).record_ns(
+                request.first_byte - request.started
+            )
+        if request.byte_count:
+            self.byte_count[name] += request.byte_count
+            if not request.responses and request.error is None:
+                self._histogram(self.latency, name).record_ns(
+                    request.completed - request.started
+                )
+
+    def reset(self):
+        """clear all statistics"""
+        self.latency.clear()
+        self.first_byte_latency.clear()
+        self.byte_count.clear()
+        self.errors.clear()
+        self.failures.clear()
+        self.batch_sizes.clear()
@@ -0,0 +1,158 @@
+"""Device Profile Store"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import re
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .system.capabilities import Capabilities
+    from .system.typings import DeviceInfo
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _safe(value: Any):
+    return _UNSAFE.sub("_", str(value)).strip("._") or "_"
+
+
+class DeviceProfile:
+    """Static device information kept between runs"""
+
+    __slots__ = ("key", "hostname", "device_info", "capabilities", "saved")
+
+    def __init__(
+        self,
+        key: str,
+        device_info: DeviceInfo,
+        capabilities: Capabilities,
+        hostname: str | None = None,
+        saved: float | None = None,
+    ) -> None:
+        self.key = key
+        self.hostname = hostname
+        self.device_info = device_info
+        self.capabilities = capabilities
+        self.saved = time() if saved is None else saved
+
+    @property
+    def age(self):
+        """seconds since the profile was saved"""
+        return time() - self.saved
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict):
+        for name in self.__slots__:
+            setattr(self, name, state.get(name))
+
+
+class ProfileStore:
+    """On disk store of device profiles
+
+    Profiles are keyed by serial number, model and firmware version, with a
+    hostname index so a profile can be found before contacting the device.
+    Profiles are pickled, the directory must only be writable by trusted users.
+
+    Profiles older than `revalidate_after` seconds are refreshed from the
+    device in the background after being used.
+    """
+
+    SUFFIX = ".profile"
+    HOST_SUFFIX = ".host"
+
+    def __init__(
+        self, path: str | os.PathLike, revalidate_after: float = 86400
+    ) -> None:
+        self._path = Path(path)
+        self._revalidate_after = revalidate_after
+        self._profiles: dict[str, DeviceProfile] = {}
+
+    @property
+    def path(self):
+        """store directory"""
+        return self._path
+
+    @property
+    def revalidate_after(self):
+        """profile age in seconds after which it is refreshed in the background"""
+        return self._revalidate_after
+
+    @staticmethod
+    def key(info: DeviceInfo):
+        """profile key of a device"""
+        version = getattr(info, "version", None)
+        firmware = getattr(version, "firmware", None)
+        return "-".join(
+            _safe(part)
+            for part in (
+                getattr(info, "serial", None),
+                getattr(info, "model", None),
+                firmware,
+            )
+        )
+
+    def _write(self, file: Path, data: bytes):
+        self._path.mkdir(parents=True, exist_ok=True)
+        temp = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+        temp.write_bytes(data)
+        os.replace(temp, file)
+
+    def load(self, key: str):
+        """profile by key, None when not stored"""
+
+        if (profile := self._profiles.get(key)) is not None:
+            return profile
+        try:
+            data = (self._path / (key + self.SUFFIX)).read_bytes()
+        except OSError:
+            return None
+        try:
+            profile = pickle.loads(data)
+        except Exception:  # pylint: disable=broad-except
+            # corrupt or foreign files can fail unpickling in many ways
+            return None
+        if not isinstance(profile, DeviceProfile):
+            return None
+        self._profiles[key] = profile
+        return profile
+
+    def find(self, hostname: str):
+        """profile last seen at hostname, None when unknown"""
+
+        try:
+            key = (self._path / (_safe(hostname) + self.HOST_SUFFIX)).read_text(
+                encoding="utf-8"
+            )
+        except OSError:
+            return None
+        return self.load(key.strip())
+
+    def save(self, profile: DeviceProfile):
+        """store a profile, indexing its hostname"""
+
+        self._write(self._path / (profile.key + self.SUFFIX), pickle.dumps(profile))
+        self._profiles[profile.key] = profile
+        if profile.hostname:
+            self._write(
+                self._path / (_safe(profile.hostname) + self.HOST_SUFFIX),
+                profile.key.encode("utf-8"),
+            )
+
+    def remove(self, key: str):
+        """drop a profile"""
+
+        self._profiles.pop(key, None)
+        try:
+            (self._path / (key + self.SUFFIX)).unlink()
+        except FileNotFoundError:
+            pass
+
+    def stale(self, profile: DeviceProfile):
+        """profile should be refreshed"""
+        return profile.age >= self._revalidate_after
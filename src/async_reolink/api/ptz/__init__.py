@@ -2,10 +2,9 @@
 
 from abc import ABC, abstractmethod
 
-from .. import connection
-from ..commands import CommandErrorResponse, ResponseCode, ptz
+from ..commands import ptz
 
-from ..errors import ReolinkResponseError
+from ..executor import command
 
 from ..ptz.typings import Operation, Preset, Patrol, Track, ZoomOperation
 
@@ -17,20 +16,16 @@ class PTZ(ABC):
     def _create_get_ptz_presets_request(self, channel: int) -> ptz.GetPresetRequest:
         ...
 
-    async def get_ptz_presets(self, channel: int = 0):
+    @command(
+        ptz.GetPresetResponse,
+        "presets",
+        error="Get PTZ Presets failed",
+        cache="get_ptz_presets",
+    )
+    def get_ptz_presets(self, channel: int = 0):
         """Get PTZ Presets"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ptz_presets_request(channel)
-            ):
-                if isinstance(response, ptz.GetPresetResponse):
-                    return response.presets
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ Presets failed")
-
-        raise ReolinkResponseError("Get PTZ Presets failed")
+        return self._create_get_ptz_presets_request(channel)
 
     @abstractmethod
     def _create_set_ptz_preset_request(
@@ -38,39 +33,26 @@ class PTZ(ABC):
     ) -> ptz.SetPresetRequest:
         ...
 
-    async def set_ptz_preset(self, preset: Preset, channel: int = 0):
+    @command(error="Set PTZ Preset failed", evicts=("get_ptz_presets",))
+    def set_ptz_preset(self, preset: Preset, channel: int = 0):
         """Set PTZ Preset"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_preset_request(channel, preset)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ Preset failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ Preset failed")
+        return self._create_set_ptz_preset_request(channel, preset)
 
     @abstractmethod
     def _create_get_ptz_patrols_request(self, channel: int) -> ptz.GetPatrolRequest:
         ...
 
-    async def get_ptz_patrols(self, channel: int = 0):
+    @command(
+        ptz.GetPatrolResponse,
+        "patrols",
+        error="Get PTZ Patrols failed",
+        cache="get_ptz_patrols",
+    )
+    def get_ptz_patrols(self, channel: int = 0):
         """Get PTZ Patrols"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ptz_patrols_request(channel)
-            ):
-                if isinstance(response, ptz.GetPatrolResponse):
-                    return response.patrols
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ Patrols failed")
-
-        raise ReolinkResponseError("Get PTZ Patrols failed")
+        return self._create_get_ptz_patrols_request(channel)
 
     @abstractmethod
     def _create_set_ptz_patrol_request(
@@ -78,39 +60,26 @@ class PTZ(ABC):
     ) -> ptz.SetPatrolRequest:
         ...
 
-    async def set_ptz_patrol(self, patrol: Patrol, channel: int = 0):
+    @command(error="Set PTZ Patrol failed", evicts=("get_ptz_patrols",))
+    def set_ptz_patrol(self, patrol: Patrol, channel: int = 0):
         """Set PTZ Patrol"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_patrol_request(channel, patrol)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ Preset failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ Preset failed")
+        return self._create_set_ptz_patrol_request(channel, patrol)
 
     @abstractmethod
     def _create_get_ptz_tatterns_request(self, channel: int) -> ptz.GetTatternRequest:
         ...
 
-    async def get_ptz_tatterns(self, channel: int = 0):
+    @command(
+        ptz.GetTatternResponse,
+        "tracks",
+        error="Get PTZ Tatterns failed",
+        cache="get_ptz_tatterns",
+    )
+    def get_ptz_tatterns(self, channel: int = 0):
         """Get PTZ Tatterns"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ptz_tatterns_request(channel)
-            ):
-                if isinstance(response, ptz.GetTatternResponse):
-                    return response.tracks
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ Tatterns failed")
-
-        raise ReolinkResponseError("Get PTZ Tatterns failed")
+        return self._create_get_ptz_tatterns_request(channel)
 
     @abstractmethod
     def _create_set_ptz_tatterns_request(
@@ -118,20 +87,11 @@ class PTZ(ABC):
     ) -> ptz.SetTatternRequest:
         ...
 
-    async def set_ptz_tattern(self, *tracks: Track, channel: int = 0):
+    @command(error="Set PTZ Tattern failed", evicts=("get_ptz_tatterns",))
+    def set_ptz_tattern(self, *tracks: Track, channel: int = 0):
         """Set PTZ Tattern"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_tatterns_request(channel, *tracks)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ Tattern failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ Tattern failed")
+        return self._create_set_ptz_tatterns_request(channel, *tracks)
 
     @abstractmethod
     def _create_set_ptz_control_request(
@@ -143,7 +103,8 @@ class PTZ(ABC):
     ) -> ptz.SetControlRequest:
         ...
 
-    async def ptz_control(
+    @command(error="Set PTZ Control failed", evicts=("get_ptz_zoom_focus",))
+    def ptz_control(
         self,
         operation: Operation,
         speed: int | None = None,
@@ -152,19 +113,9 @@ class PTZ(ABC):
     ):
         """PTZ Control"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_control_request(
-                    channel, operation, speed, preset_id
-                )
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ Control failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ Control failed")
+        return self._create_set_ptz_control_request(
+            channel, operation, speed, preset_id
+        )
 
     @abstractmethod
     def _create_get_ptz_autofocus_request(
@@ -172,20 +123,16 @@ class PTZ(ABC):
     ) -> ptz.GetAutoFocusRequest:
         ...
 
-    async def get_ptz_autofocus(self, channel: int = 0):
+    @command(
+        ptz.GetAutoFocusResponse,
+        lambda response: not response.disabled,
+        error="Get PTZ AutoFocus failed",
+        cache="get_ptz_autofocus",
+    )
+    def get_ptz_autofocus(self, channel: int = 0):
         """Get PTZ AutoFocus"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ptz_autofocus_request(channel)
-            ):
-                if isinstance(response, ptz.GetAutoFocusResponse):
-                    return not response.disabled
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ AutoFocus failed")
-
-        raise ReolinkResponseError("Get PTZ AutoFocus failed")
+        return self._create_get_ptz_autofocus_request(channel)
 
     @abstractmethod
     def _create_set_ptz_autofocus_request(
@@ -193,20 +140,11 @@ class PTZ(ABC):
     ) -> ptz.SetAutoFocusRequest:
         ...
 
-    async def set_ptz_autofocus(self, disabled: bool, channel: int = 0):
+    @command(error="Set PTZ AutoFocus failed", evicts=("get_ptz_autofocus",))
+    def set_ptz_autofocus(self, disabled: bool, channel: int = 0):
         """Set PTZ AutoFocus"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_autofocus_request(channel, disabled)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ AutoFocus failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ AutoFocus failed")
+        return self._create_set_ptz_autofocus_request(channel, disabled)
 
     @abstractmethod
     def _create_get_ptz_zoom_focus_request(
@@ -214,20 +152,16 @@ class PTZ(ABC):
     ) -> ptz.GetZoomFocusRequest:
         ...
 
-    async def get_ptz_zoom_focus(self, channel: int = 0):
+    @command(
+        ptz.GetZoomFocusResponse,
+        "state",
+        error="Get PTZ Zoom Focus failed",
+        cache="get_ptz_zoom_focus",
+    )
+    def get_ptz_zoom_focus(self, channel: int = 0):
         """Get PTZ Zoom and Focus"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_ptz_zoom_focus_request(channel)
-            ):
-                if isinstance(response, ptz.GetZoomFocusResponse):
-                    return response.state
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ Zoom Focus failed")
-
-        raise ReolinkResponseError("Get PTZ Zoom Focus failed")
+        return self._create_get_ptz_zoom_focus_request(channel)
 
     @abstractmethod
     def _create_set_ptz_zoomfocus_request(
@@ -235,7 +169,8 @@ class PTZ(ABC):
     ) -> ptz.SetZoomFocusRequest:
         ...
 
-    async def set_ptz_zoomfocus(
+    @command(error="Set PTZ Zoom/Focus failed", evicts=("get_ptz_zoom_focus",))
+    def set_ptz_zoomfocus(
         self,
         position: int,
         operation: ZoomOperation = ZoomOperation.ZOOM,
@@ -243,14 +178,4 @@ class PTZ(ABC):
     ):
         """Set PTZ Zoom"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_set_ptz_zoomfocus_request(channel, operation, position)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Set PTZ Zoom/Focus failed")
-
-                if isinstance(response, ResponseCode):
-                    return True
-
-        raise ReolinkResponseError("Set PTZ Zoom/Focus failed")
+        return self._create_set_ptz_zoomfocus_request(channel, operation, position)
@@ -0,0 +1,114 @@
+"""Rate Limiting"""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Final, Iterable
+
+from .errors import ErrorCodes
+
+THROTTLE_CODES: Final = frozenset((ErrorCodes.SESSION_MAX, ErrorCodes.TIMEOUT))
+"""Error codes a device answers with when it is being hit too hard"""
+
+
+class RateLimiter:
+    """Adaptive per device token bucket
+
+    The rate is cut by `backoff` whenever the device reports it is overloaded
+    and grows back by `recovery` of the configured rate after every
+    `recover_after` consecutive successful requests.
+    """
+
+    __slots__ = (
+        "_rate",
+        "_burst",
+        "_min_rate",
+        "_backoff",
+        "_recovery",
+        "_recover_after",
+        "_throttle_codes",
+        "_current",
+        "_tokens",
+        "_stamp",
+        "_successes",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        min_rate: float | None = None,
+        backoff: float = 0.5,
+        recovery: float = 0.1,
+        recover_after: int = 10,
+        throttle_codes: Iterable[int] = THROTTLE_CODES,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._burst = max(burst, 1)
+        self._min_rate = min_rate if min_rate is not None else rate / 10
+        self._backoff = backoff
+        self._recovery = recovery
+        self._recover_after = recover_after
+        self._throttle_codes = frozenset(throttle_codes)
+        self._current = rate
+        self._tokens = float(self._burst)
+        self._stamp = monotonic()
+        self._successes = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self):
+        """configured requests per second"""
+        return self._rate
+
+    @property
+    def burst(self):
+        """maximum requests sent back to back"""
+        return self._burst
+
+    @property
+    def current_rate(self):
+        """adapted requests per second"""
+        return self._current
+
+    @property
+    def throttle_codes(self):
+        """error codes that cause a back off"""
+        return self._throttle_codes
+
+    def _refill(self):
+        now = monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self._current)
+        self._stamp = now
+
+    async def acquire(self):
+        """wait for a request slot"""
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._current)
+                self._refill()
+            self._tokens -= 1
+
+    def success(self):
+        """record a request the device handled"""
+
+        self._successes += 1
+        if self._successes >= self._recover_after and self._current < self._rate:
+            self._successes = 0
+            self._refill()
+            self._current = min(self._rate, self._current + self._rate * self._recovery)
+
+    def throttled(self):
+        """record an overload response from the device"""
+
+        self._successes = 0
+        self._refill()
+        self._current = max(self._min_rate, self._current * self._backoff)
+        self._tokens = min(self._tokens, 0)
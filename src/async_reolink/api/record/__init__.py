@@ -1,46 +1,225 @@
 """Record"""
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from datetime import datetime, time, timedelta
-from typing import TYPE_CHECKING, Sequence
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, AsyncIterator, Final, Iterable, Protocol, Sequence
 
 from ..typings import StreamTypes
 
-from ..errors import ReolinkResponseError
+from ..errors import (
+    ErrorCodes,
+    ReolinkError,
+    ReolinkResponseError,
+    ReolinkTimeoutError,
+)
 
-from ..commands import CommandErrorResponse, ResponseCode, record
+from ..commands import ResponseKind, is_error, record, response_kind
+
+from ..executor import command
 
 from .. import connection, system
 
-from ..record.typings import File, Search, SearchStatus
+from ..record.typings import File, Search, SearchStatus, Snapshot
+
+from .index import RecordingIndex
+
+
+class SupportsWrite(Protocol):
+    """File like snapshot destination"""
+
+    def write(self, data: memoryview, /) -> object:
+        """write data, may return an awaitable"""
 
 
 class Record(ABC):
     """Record Mixin"""
 
+    def __init__(
+        self, *args, recording_index: RecordingIndex | None = None, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.__recording_index = recording_index
+        self.__index_key: str | None = None
+
+        if isinstance(self, connection.Connection):
+            self._disconnect_callbacks.append(self.__clear)
+
+    def __clear(self):
+        self.__index_key = None
+
+    @property
+    def recording_index(self):
+        """Local recording index, None when every search goes to the device"""
+        return self.__recording_index
+
+    @recording_index.setter
+    def recording_index(self, value: RecordingIndex | None):
+        self.__recording_index = value
+
     @abstractmethod
     def _create_get_snapshot_request(self, channel: int) -> record.GetSnapshotRequest:
         ...
 
-    async def get_snap(self, channel: int = 0):
-        """get snapshot"""
+    async def iter_snap(self, channel: int = 0) -> AsyncIterator[memoryview]:
+        """stream a snapshot as it arrives, without copying the chunks"""
 
-        if isinstance(self, connection.Connection):
-            buffer = bytearray()
-            async for response in self._execute(
-                self._create_get_snapshot_request(channel)
-            ):
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get Snap failed")
+        if not isinstance(self, connection.Connection):
+            raise ReolinkResponseError("Get Snap failed")
+
+        async for response in self._transmit(
+            self._create_get_snapshot_request(channel)
+        ):
+            if is_error(response):
+                response.throw("Get Snap failed")
+
+            if response_kind(response) is not ResponseKind.DATA:
+                raise ReolinkResponseError("Get Snap failed")
+
+            yield memoryview(response)
+
+    async def get_snap_into(
+        self, writer: SupportsWrite | bytearray | memoryview, channel: int = 0
+    ):
+        """write a snapshot into a file like object or writable buffer
+
+        `writer.write` may be a coroutine function, a buffer must be large
+        enough for the whole snapshot. Returns the snapshot size.
+        """
+
+        size = 0
+        if (write := getattr(writer, "write", None)) is not None:
+            async for chunk in self.iter_snap(channel):
+                if inspect.isawaitable(result := write(chunk)):
+                    await result
+                size += len(chunk)
+            return size
+
+        with memoryview(writer) as view:
+            async for chunk in self.iter_snap(channel):
+                end = size + len(chunk)
+                if end > len(view):
+                    raise BufferError("Snapshot larger than buffer")
+                view[size:end] = chunk
+                size = end
+        return size
+
+    async def get_snap(self, channel: int = 0, length: int | None = None):
+        """get snapshot
+
+        When the snapshot `length` is known it is assembled in a single
+        preallocated buffer and returned as a bytearray.
+        """
+
+        if length is None:
+            chunks = [chunk async for chunk in self.iter_snap(channel)]
+            if len(chunks) == 1:
+                # no copy when the view covers a whole immutable response
+                (chunk,) = chunks
+                if isinstance(chunk.obj, bytes) and chunk.nbytes == len(chunk.obj):
+                    return chunk.obj
+                return chunk.tobytes()
+            return b"".join(chunks)
+
+        buffer = bytearray(length)
+        size = 0
+        async for chunk in self.iter_snap(channel):
+            end = size + len(chunk)
+            if end > length:
+                # longer than announced, grow past the preallocated part
+                buffer[size:] = chunk
+                length = end
+            else:
+                buffer[size:end] = chunk
+            size = end
+        if size < length:
+            del buffer[size:]
+        return buffer
+
+    @property
+    def _snapshot_batching(self) -> bool:
+        """transport answers each snapshot of a batch with a single data response"""
+        return False
+
+    async def get_snaps(
+        self, channels: Iterable[int] | None = None, *, concurrency: int = 4
+    ) -> AsyncIterator[Snapshot]:
+        """snapshot several channels, all by default, in completion order
+
+        At most `concurrency` snapshots are requested at once, or all of them
+        in one batch when the transport allows it. Failed channels yield
+        their error instead of the image.
+        """
 
-                if not isinstance(response, bytes):
-                    raise ReolinkResponseError("Get Snap failed")
+        if channels is None:
+            channels = [0]
+            if isinstance(self, system.System):
+                channels = list((await self._ensure_abilities()).channels) or channels
+        channels = list(channels)
+        clock = None
+        if isinstance(self, system.System):
+            await self._ensure_time()
+            clock = self.clock
+
+        if self._snapshot_batching and isinstance(self, connection.Connection):
+            async for snapshot in self.__batch_snaps(channels, clock):
+                yield snapshot
+            return
 
-                buffer += bytearray(response)
+        results: asyncio.Queue[Snapshot] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
 
-            return bytes(buffer)
+        async def capture(channel: int):
+            async with semaphore:
+                taken = clock.now() if clock is not None else None
+                try:
+                    image = await self.get_snap(channel)
+                except Exception as error:  # pylint: disable=broad-except
+                    # every channel must yield, or the results queue waits forever
+                    image = error
+                results.put_nowait(Snapshot(channel, image, taken))
 
-        raise ReolinkResponseError("Get Snap failed")
+        tasks = [asyncio.create_task(capture(channel)) for channel in channels]
+        try:
+            for _ in tasks:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __batch_snaps(self, channels: list[int], clock):
+        commands = [self._create_get_snapshot_request(channel) for channel in channels]
+        taken = clock.now() if clock is not None else None
+        pending = set(range(len(commands)))
+        position = 0
+        try:
+            async for response in self._transmit(*commands):
+                index = self._correlate(commands, response, position)
+                position += 1
+                if index not in pending:
+                    continue
+                pending.discard(index)
+                if is_error(response):
+                    image = ReolinkResponseError(
+                        "Get Snap failed",
+                        code=response.error_code,
+                        details=response.details,
+                    )
+                elif response_kind(response) is ResponseKind.DATA:
+                    image = bytes(response)
+                else:
+                    image = ReolinkResponseError("Get Snap failed")
+                yield Snapshot(channels[index], image, taken)
+        except ReolinkError as error:
+            for index in sorted(pending):
+                yield Snapshot(channels[index], error, taken)
+            return
+        for index in sorted(pending):
+            yield Snapshot(
+                channels[index], ReolinkResponseError("Get Snap failed"), taken
+            )
 
     @abstractmethod
     def _create_search_request(
@@ -58,21 +237,17 @@ class Record(ABC):
     ) -> Search:
         ...
 
-    async def _search(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        channel: int,
-        only_status: bool,
-        stream_type: StreamTypes,
-    ):
+    async def _search_range(self, start_time: datetime, end_time: datetime):
+        """search range in device time, today by default"""
+
         camera_time = None
         if isinstance(self, system.System):
             camera_time = await self._ensure_time()
         tzinfo = camera_time.tzinfo if camera_time is not None else None
 
         if end_time is None:
-            end_time = datetime.combine(datetime.now(tzinfo).date(), time.min, tzinfo)
+            today = (camera_time or datetime.now(tzinfo)).date()
+            end_time = datetime.combine(today, time.min, tzinfo)
             end_time += timedelta(days=1, seconds=-1)
         elif end_time.tzinfo is not None:
             end_time = end_time.astimezone(tzinfo)
@@ -82,19 +257,23 @@ class Record(ABC):
         elif start_time.tzinfo is not None:
             start_time = start_time.astimezone(tzinfo)
 
-        search = self._create_search(start_time, end_time, only_status, stream_type)
+        return (start_time, end_time)
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_search_request(channel, search)
-            ):
-                if isinstance(response, record.SearchRecordingsResponse):
-                    return response
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Search failed")
+    async def _search(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        channel: int,
+        only_status: bool,
+        stream_type: StreamTypes,
+    ):
+        (start_time, end_time) = await self._search_range(start_time, end_time)
+        search = self._create_search(start_time, end_time, only_status, stream_type)
+        return await self.__search(channel, search)
 
-        raise ReolinkResponseError("Search failed")
+    @command(record.SearchRecordingsResponse, error="Search failed")
+    def __search(self, channel: int, search: Search):
+        return self._create_search_request(channel, search)
 
     async def search_status(
         self,
@@ -120,10 +299,290 @@ class Record(ABC):
         end_time: datetime = None,
         stream_type: StreamTypes = StreamTypes.MAIN,
     ) -> Sequence[File]:
-        """Search for recordings in range"""
+        """Search for recordings in range
+
+        Ranges the recording index holds completely are answered locally.
+        """
+        if (
+            self.__recording_index is not None
+            and (
+                files := await self.__indexed(
+                    channel, start_time, end_time, stream_type
+                )
+            )
+            is not None
+        ):
+            return files
         files = (
             await self._search(start_time, end_time, channel, False, stream_type)
         ).files
         if files is None:
             files = []
         return files
+
+    async def _recording_key(self):
+        """device key in the recording index, the serial number by default"""
+
+        if self.__index_key is None:
+            key = None
+            if isinstance(self, system.System):
+                try:
+                    key = (await self.get_device_info()).serial or None
+                except ReolinkError:
+                    key = None
+            if key is None and isinstance(self, connection.Connection):
+                key = self.hostname
+            self.__index_key = key
+        return self.__index_key
+
+    async def __indexed(
+        self,
+        channel: int,
+        start_time: datetime,
+        end_time: datetime,
+        stream_type: StreamTypes,
+    ):
+        if (key := await self._recording_key()) is None:
+            return None
+        index = self.__recording_index
+        (start_time, end_time) = await self._search_range(start_time, end_time)
+        (first, last) = (start_time.date(), end_time.date())
+        days = await asyncio.to_thread(
+            index.days, key, channel, stream_type, first, last
+        )
+        if len(days) <= (last - first).days:
+            return None
+        return await asyncio.to_thread(
+            index.files, key, channel, stream_type, start_time, end_time
+        )
+
+    async def sync_recordings(
+        self,
+        channel: int = 0,
+        *,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        stream_type: StreamTypes = StreamTypes.MAIN,
+    ):
+        """Bring the recording index up to date for the days of a range
+
+        Past days the index holds are skipped, the remaining ones are checked
+        with a status search and only days with recordings are searched,
+        along with the current day. Past days are complete once synced, the
+        current day is searched again on every sync. Days of months missing
+        from the status answer are searched but stay incomplete. Days whose
+        search failed keep their indexed files, the first error is raised
+        after storing the others. Returns the number of days searched.
+        """
+
+        if (index := self.__recording_index) is None:
+            raise ReolinkError("No recording index")
+        if (key := await self._recording_key()) is None:
+            raise ReolinkError("No device key for the recording index")
+
+        (start_time, end_time) = await self._search_range(start_time, end_time)
+        tzinfo = start_time.tzinfo
+        today = (
+            self.clock.now() if isinstance(self, system.System) else None
+        ) or datetime.now(tzinfo)
+        today = today.date()
+        (first, last) = (start_time.date(), end_time.date())
+
+        indexed = await asyncio.to_thread(
+            index.days, key, channel, stream_type, first, last
+        )
+        missing = [
+            day
+            for day in _days(first, min(last, today - timedelta(days=1)))
+            if day not in indexed
+        ]
+        searching: list[date] = []
+        complete: set[date] = set()
+        if missing:
+            statuses = await self.search_status(
+                channel,
+                start_time=_day_start(missing[0], tzinfo),
+                end_time=_day_end(missing[-1], tzinfo),
+                stream_type=stream_type,
+            )
+            months = {(status.year, status.month) for status in statuses}
+            recorded = {day for status in statuses for day in status}
+            complete = {day for day in missing if (day.year, day.month) in months}
+            searching = [
+                day for day in missing if day in recorded or day not in complete
+            ]
+        if first <= today <= last:
+            searching.append(today)
+
+        searched: list[date] = []
+        files: list[File] = []
+        error: ReolinkError | None = None
+        for run_first, run_last in _runs(searching):
+            found: list[File] = []
+            try:
+                async for file in self.iter_search(
+                    channel,
+                    start_time=_day_start(run_first, tzinfo),
+                    end_time=_day_end(run_last, tzinfo),
+                    stream_type=stream_type,
+                ):
+                    found.append(file)
+            except ReolinkError as _error:
+                error = error or _error
+                complete.difference_update(_days(run_first, run_last))
+                continue
+            searched.extend(_days(run_first, run_last))
+            files.extend(found)
+        await asyncio.to_thread(
+            index.store, key, channel, stream_type, searched, files, sorted(complete)
+        )
+        if error is not None:
+            raise error
+        return len(searched)
+
+    async def iter_search(
+        self,
+        channel: int = 0,
+        *,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        stream_type: StreamTypes = StreamTypes.MAIN,
+        window: timedelta = timedelta(days=1),
+        min_window: timedelta = timedelta(hours=1),
+        concurrency: int = 4,
+    ) -> AsyncIterator[File]:
+        """Search for recordings in range, yielding files in time order
+
+        The range is searched in `window` sized pieces starting at device
+        midnight, at most `concurrency` searched or waiting to be yielded at
+        once, and files are yielded as soon as every earlier piece completed. A piece the device times out
+        on is split in halves down to `min_window`. Files spanning two
+        pieces are yielded once. Concurrent pieces share a batch when the
+        connection has a `coalesce_window`.
+        """
+
+        (start_time, end_time) = await self._search_range(start_time, end_time)
+        windows = list(_windows(start_time, end_time, window))
+        results: asyncio.Queue[tuple[int, list[File] | BaseException]] = asyncio.Queue()
+        pending = iter(enumerate(windows))
+
+        async def fetch(start: datetime, end: datetime) -> list[File]:
+            search = self._create_search(start, end, False, stream_type)
+            try:
+                files = (await self.__search(channel, search)).files
+            except ReolinkError as error:
+                if end - start < 2 * min_window or not _oversized(error):
+                    raise
+                middle = (start + (end - start) / 2).replace(microsecond=0)
+                first = await fetch(start, middle)
+                names = {file.name for file in first}
+                rest = await fetch(middle + _SECOND, end)
+                return [*first, *(file for file in rest if file.name not in names)]
+            return _ordered(files or (), start.tzinfo)
+
+        # a window is taken only while fewer than `concurrency` are searched or
+        # waiting to be yielded, so an early stop leaves little work behind
+        ahead = asyncio.Semaphore(max(concurrency, 1))
+
+        async def worker():
+            while True:
+                await ahead.acquire()
+                if (window := next(pending, None)) is None:
+                    ahead.release()
+                    return
+                (index, (start, end)) = window
+                try:
+                    result = await fetch(start, end)
+                except Exception as error:  # pylint: disable=broad-except
+                    result = error
+                results.put_nowait((index, result))
+
+        tasks = [
+            asyncio.create_task(worker())
+            for _ in range(min(max(concurrency, 1), len(windows)))
+        ]
+        done: dict[int, list[File] | BaseException] = {}
+        seen: set[str] = set()
+        try:
+            for index in range(len(windows)):
+                while index not in done:
+                    (completed, result) = await results.get()
+                    done[completed] = result
+                result = done.pop(index)
+                ahead.release()
+                if isinstance(result, BaseException):
+                    raise result
+                # only files spanning into the next piece can repeat
+                boundary = windows[index][1].replace(tzinfo=None)
+                spanning: set[str] = set()
+                for file in result:
+                    if file.end.to_datetime() > boundary:
+                        spanning.add(file.name)
+                    if file.name not in seen:
+                        yield file
+                seen = spanning
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_SECOND: Final = timedelta(seconds=1)
+
+_SPLIT_CODES: Final = frozenset(
+    (ErrorCodes.TIMEOUT, ErrorCodes.OUT_OF_MEMORY, ErrorCodes.MALLOC)
+)
+"""Error codes of searches over too many files"""
+
+
+def _oversized(error: ReolinkError):
+    if isinstance(error, ReolinkTimeoutError):
+        return True
+    return isinstance(error, ReolinkResponseError) and error.code in _SPLIT_CODES
+
+
+def _windows(start: datetime, end: datetime, size: timedelta):
+    """inclusive search ranges of `size` from device midnight covering the range"""
+
+    boundary = datetime.combine(start.date(), time.min, start.tzinfo)
+    while start <= end:
+        while boundary <= start:
+            boundary += size
+        stop = min(boundary - _SECOND, end)
+        yield (start, stop)
+        start = boundary
+
+
+def _days(first: date, last: date):
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def _runs(days: Sequence[date]):
+    """first and last day of each run of consecutive days"""
+
+    runs: list[tuple[date, date]] = []
+    for day in days:
+        if runs and runs[-1][1] + timedelta(days=1) == day:
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def _day_start(day: date, tzinfo):
+    return datetime.combine(day, time.min, tzinfo)
+
+
+def _day_end(day: date, tzinfo):
+    return datetime.combine(day, time(23, 59, 59), tzinfo)
+
+
+def _ordered(files: Iterable[File], tzinfo):
+    """files sorted by start, ambiguous device times resolved by the timezone"""
+
+    files = list(files)
+    if (timestamps := getattr(tzinfo, "timestamps", None)) is not None:
+        keys = timestamps(file.start for file in files)
+    else:
+        keys = [file.start.to_datetime() for file in files]
+    return [file for (_, _, file) in sorted(zip(keys, range(len(files)), files))]
@@ -0,0 +1,277 @@
+"""Recording Index
+
+Local SQLite index of recording file metadata. Past days do not change once
+recorded, so a device only has to be searched for days the index has not
+seen yet and for the current day.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, time
+from typing import Iterable, Sequence
+
+from ..typings import DateTimeValue, StreamTypes
+
+from .typings import File
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    device TEXT NOT NULL,
+    channel INTEGER NOT NULL,
+    stream TEXT NOT NULL,
+    name TEXT NOT NULL,
+    start TEXT NOT NULL,
+    "end" TEXT NOT NULL,
+    size INTEGER,
+    type TEXT,
+    frame_rate INTEGER,
+    width INTEGER,
+    height INTEGER,
+    PRIMARY KEY (device, channel, stream, name)
+);
+CREATE INDEX IF NOT EXISTS files_start ON files (device, channel, stream, start);
+CREATE INDEX IF NOT EXISTS files_time ON files (start, "end");
+CREATE TABLE IF NOT EXISTS days (
+    device TEXT NOT NULL,
+    channel INTEGER NOT NULL,
+    stream TEXT NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (device, channel, stream, day)
+);
+"""
+
+_COLUMNS = 'name, start, "end", size, type, frame_rate, width, height'
+
+# keeps IN lists below the SQLite bound parameter limit
+_CHUNK = 500
+
+
+def _text(value: datetime | DateTimeValue):
+    if not isinstance(value, datetime):
+        value = value.to_datetime()
+    return value.replace(tzinfo=None, microsecond=0).isoformat(" ")
+
+
+class IndexedDateTime(DateTimeValue):
+    """Date Time value read from the index"""
+
+    __slots__ = ("year", "month", "day", "hour", "minute", "second")
+
+    def __init__(self, value: datetime) -> None:
+        self.year = value.year
+        self.month = value.month
+        self.day = value.day
+        self.hour = value.hour
+        self.minute = value.minute
+        self.second = value.second
+
+    def __repr__(self) -> str:
+        return f"<IndexedDateTime {self.to_datetime()}>"
+
+
+class IndexedFile(File):
+    """Recording file read from the index"""
+
+    __slots__ = (
+        "channel",
+        "name",
+        "start",
+        "end",
+        "size",
+        "type",
+        "frame_rate",
+        "width",
+        "height",
+    )
+
+    def __init__(self, channel: int, row: Sequence) -> None:
+        self.channel = channel
+        (name, start, end, size, _type, frame_rate, width, height) = row
+        self.name = name
+        self.start = IndexedDateTime(datetime.fromisoformat(start))
+        self.end = IndexedDateTime(datetime.fromisoformat(end))
+        self.size = size
+        self.type = _type
+        self.frame_rate = frame_rate
+        self.width = width
+        self.height = height
+
+    def __repr__(self) -> str:
+        return f"<IndexedFile {self.name}>"
+
+
+class RecordingIndex:
+    """SQLite index of recording files
+
+    Files are keyed by a device key (the device serial number by default),
+    channel, stream type and name, times are device local. Days marked
+    complete are answered from the index, other days must be searched on
+    the device. Methods block, async callers run them in a thread.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if str(path) != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        with self._db:
+            self._db.executescript(_SCHEMA)
+
+    @property
+    def path(self):
+        """database path"""
+        return self._path
+
+    def close(self):
+        """close the database"""
+        with self._lock:
+            self._db.close()
+
+    def days(
+        self,
+        device: str,
+        channel: int,
+        stream_type: StreamTypes,
+        first: date,
+        last: date,
+    ):
+        """complete days between `first` and `last`"""
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT day FROM days WHERE device = ? AND channel = ? AND stream = ?"
+                " AND day BETWEEN ? AND ?",
+                (
+                    device,
+                    channel,
+                    stream_type.name,
+                    first.isoformat(),
+                    last.isoformat(),
+                ),
+            ).fetchall()
+        return {date.fromisoformat(day) for (day,) in rows}
+
+    def store(
+        self,
+        device: str,
+        channel: int,
+        stream_type: StreamTypes,
+        days: Iterable[date],
+        files: Iterable[File],
+        complete: Iterable[date] = (),
+    ):
+        """replace the files starting on `days`, marking the `complete` days"""
+
+        key = (device, channel, stream_type.name)
+        rows = [
+            (
+                *key,
+                file.name,
+                _text(file.start),
+                _text(file.end),
+                file.size,
+                file.type,
+                getattr(file, "frame_rate", None),
+                getattr(file, "width", None),
+                getattr(file, "height", None),
+            )
+            for file in files
+        ]
+        ranges = [
+            (
+                *key,
+                _text(datetime.combine(day, time.min)),
+                _text(datetime.combine(day, time.max)),
+            )
+            for day in days
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM files WHERE device = ? AND channel = ? AND stream = ?"
+                " AND start BETWEEN ? AND ?",
+                ranges,
+            )
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO files (device, channel, stream, {_COLUMNS})"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO days (device, channel, stream, day) VALUES (?, ?, ?, ?)",
+                [(*key, day.isoformat()) for day in complete],
+            )
+
+    def files(
+        self,
+        device: str,
+        channel: int,
+        stream_type: StreamTypes,
+        start: datetime,
+        end: datetime,
+    ):
+        """indexed files overlapping a device time range, ordered by start"""
+
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {_COLUMNS} FROM files"
+                " WHERE device = ? AND channel = ? AND stream = ?"
+                ' AND start <= ? AND "end" > ? ORDER BY start, name',
+                (device, channel, stream_type.name, _text(end), _text(start)),
+            ).fetchall()
+        return [IndexedFile(channel, row) for row in rows]
+
+    def timeline(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        devices: Iterable[str] | None = None,
+        stream_type: StreamTypes = StreamTypes.MAIN,
+    ):
+        """indexed files of every channel overlapping a device time range
+
+        Returns `(device, file)` pairs ordered by start, for all devices or
+        only `devices`.
+        """
+
+        query = (
+            f"SELECT device, channel, {_COLUMNS} FROM files WHERE stream = ?"
+            ' AND start <= ? AND "end" > ?'
+        )
+        parameters = [stream_type.name, _text(end), _text(start)]
+        rows: list = []
+        with self._lock:
+            if devices is None:
+                rows = self._db.execute(query, parameters).fetchall()
+            else:
+                devices = list(devices)
+                for offset in range(0, len(devices), _CHUNK):
+                    chunk = devices[offset : offset + _CHUNK]
+                    rows.extend(
+                        self._db.execute(
+                            f"{query} AND device IN ({', '.join('?' * len(chunk))})",
+                            [*parameters, *chunk],
+                        )
+                    )
+        rows.sort(key=lambda row: (row[3], row[0], row[1], row[2]))
+        return [(row[0], IndexedFile(row[1], row[2:])) for row in rows]
+
+    def remove(self, device: str, before: date | None = None):
+        """drop a device, or only its days before a date"""
+
+        with self._lock, self._db:
+            if before is None:
+                self._db.execute("DELETE FROM files WHERE device = ?", (device,))
+                self._db.execute("DELETE FROM days WHERE device = ?", (device,))
+                return
+            limit = before.isoformat()
+            self._db.execute(
+                "DELETE FROM files WHERE device = ? AND start < ?", (device, limit)
+            )
+            self._db.execute(
+                "DELETE FROM days WHERE device = ? AND day < ?", (device, limit)
+            )
@@ -1,7 +1,7 @@
 """Record typings"""
 
-from datetime import date
-from typing import Annotated, Iterable, Iterator, Protocol
+from datetime import date, datetime
+from typing import Annotated, Iterable, Iterator, NamedTuple, Protocol
 
 from ..typings import StreamTypes, DateTimeValue
 
@@ -37,3 +37,13 @@ class File(Protocol):
     type: str
     start: DateTimeValue
     end: DateTimeValue
+
+
+class Snapshot(NamedTuple):
+    """Channel snapshot"""
+
+    channel: int
+    image: bytes | Exception
+    """snapshot data, or the error capturing it"""
+    time: datetime | None
+    """device time the snapshot was requested, None when unknown"""
@@ -0,0 +1,177 @@
+"""Retry Policy"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, AsyncIterable, Callable, Final, Iterable, Sequence
+
+from .errors import (
+    ErrorCodes,
+    ReolinkCircuitOpenError,
+    ReolinkConnectionError,
+    ReolinkTimeoutError,
+)
+
+from .commands import CommandRequest, CommandResponse, is_error
+
+TRANSIENT_CODES: Final = frozenset(
+    (
+        ErrorCodes.TIMEOUT,
+        ErrorCodes.SEND_DATA,
+        ErrorCodes.RECV_DATA,
+        ErrorCodes.SESSION_MAX,
+        ErrorCodes.INTERNAL,
+    )
+)
+"""Error codes worth retrying"""
+
+PERMANENT_CODES: Final = frozenset(
+    (
+        ErrorCodes.NOT_SUPPORTED,
+        ErrorCodes.PARAMETER_ERROR,
+        ErrorCodes.ABILITY,
+    )
+)
+"""Error codes that will never succeed on retry"""
+
+_STREAMED: Any = object()
+"""stands in for a command answered with a stream already passed on"""
+
+
+class RetryPolicy:
+    """Retry policy with jittered exponential backoff"""
+
+    __slots__ = ("_attempts", "_base_delay", "_max_delay", "_transient_codes", "_retry_errors")
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10,
+        *,
+        transient_codes: Iterable[int] = TRANSIENT_CODES,
+        retry_errors: bool = True,
+    ) -> None:
+        self._attempts = max(attempts, 1)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._transient_codes = frozenset(transient_codes) - PERMANENT_CODES
+        self._retry_errors = retry_errors
+
+    @property
+    def attempts(self):
+        """maximum attempts per command"""
+        return self._attempts
+
+    def is_transient(self, code: int):
+        """error code is worth retrying"""
+        return code in self._transient_codes
+
+    def should_retry(self, error: BaseException):
+        """transport error is worth retrying"""
+        return (
+            self._retry_errors
+            and isinstance(error, (ReolinkConnectionError, ReolinkTimeoutError))
+            and not isinstance(error, ReolinkCircuitOpenError)
+        )
+
+    def delay(self, attempt: int):
+        """backoff before the given retry attempt (1 based)"""
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1)))
+
+
+async def retrying(
+    send: Callable[..., AsyncIterable[CommandResponse | bytes]],
+    commands: Sequence[CommandRequest],
+    policy: RetryPolicy,
+    correlate: Callable[[Sequence[CommandRequest], CommandResponse, int], int],
+    *,
+    backoff: bool = True,
+) -> AsyncIterable[CommandResponse | bytes]:
+    """Send commands, resending only those that failed with a transient error
+
+    Responses are yielded in command order, stream (bytes) responses answer the
+    next command. A stream is passed through once every earlier command is
+    answered and held back until then otherwise. A stream cannot be sent
+    again, a failure while it is being read is raised. Without `backoff`
+    failed commands are resent right away.
+    """
+
+    final: list[CommandResponse | list[bytes] | None] = [None] * len(commands)
+    todo = list(range(len(commands)))
+    emitted = 0
+    attempt = 1
+    while True:
+        sent = [commands[i] for i in todo]
+        failed: list[int] = []
+        answered: set[int] = set()
+        position = 0
+        streaming = False
+        chunks: list[bytes] | None = None
+        try:
+            async for response in send(*sent):
+                if isinstance(response, bytes):
+                    if not streaming:
+                        streaming = True
+                        chunks = None
+                        if position < len(sent):
+                            answered.add(position)
+                            if emitted == todo[position]:
+                                final[todo[position]] = _STREAMED
+                            else:
+                                # an earlier command is still unanswered
+                                chunks = final[todo[position]] = []
+                    if chunks is None:
+                        yield response
+                    else:
+                        chunks.append(response)
+                    continue
+                if streaming:
+                    streaming = False
+                    position += 1
+                index = correlate(sent, response, position)
+                position += 1
+                if not 0 <= index < len(sent):
+                    continue
+                answered.add(index)
+                if (
+                    attempt < policy.attempts
+                    and is_error(response)
+                    and policy.is_transient(response.error_code)
+                ):
+                    failed.append(todo[index])
+                    continue
+                final[todo[index]] = response
+                while emitted < len(final) and final[emitted] is not None:
+                    for response in _pending(final[emitted]):
+                        yield response
+                    emitted += 1
+        except Exception as error:  # pylint: disable=broad-except
+            if (
+                streaming
+                or attempt >= policy.attempts
+                or not policy.should_retry(error)
+            ):
+                raise
+            failed.extend(todo[i] for i in range(len(sent)) if i not in answered)
+
+        if not failed:
+            break
+        if backoff:
+            await asyncio.sleep(policy.delay(attempt))
+        attempt += 1
+        todo = sorted(failed)
+
+    for answer in final[emitted:]:
+        if answer is not None:
+            for response in _pending(answer):
+                yield response
+
+
+def _pending(answer: CommandResponse | list[bytes]):
+    if answer is _STREAMED:
+        return ()
+    if isinstance(answer, list):
+        return answer
+    return (answer,)
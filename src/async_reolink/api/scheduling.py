@@ -0,0 +1,121 @@
+"""Command Scheduling"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from itertools import count
+from typing import Iterable
+
+from .commands import CommandRequest
+
+
+class Priority(IntEnum):
+    """Command Priority, lower values are dispatched first"""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+_priority: ContextVar[Priority | None] = ContextVar("priority", default=None)
+
+
+@contextmanager
+def prioritized(priority: Priority):
+    """Send commands issued within the block at the given priority"""
+
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def command_priority(commands: Iterable[CommandRequest]):
+    """Priority of a set of commands, the most urgent command wins
+
+    Request classes declare their priority with a `priority` class attribute.
+    """
+
+    if (priority := _priority.get()) is not None:
+        return priority
+    return min(
+        (getattr(command, "priority", Priority.NORMAL) for command in commands),
+        default=Priority.NORMAL,
+    )
+
+
+class PriorityScheduler:
+    """Limits concurrent device requests, dispatching waiting requests by priority
+
+    `interactive_slots` are reserved for interactive requests on top of `slots`.
+    """
+
+    __slots__ = ("_free", "_free_interactive", "_waiters", "_sequence")
+
+    def __init__(self, slots: int = 1, interactive_slots: int = 0) -> None:
+        self._free = max(slots, 1)
+        self._free_interactive = max(interactive_slots, 0)
+        self._waiters: list[tuple[int, int, asyncio.Future[bool]]] = []
+        self._sequence = count()
+
+    @property
+    def waiting(self):
+        """number of queued requests"""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _take(self, priority: Priority):
+        if priority == Priority.INTERACTIVE and self._free_interactive > 0:
+            self._free_interactive -= 1
+            return True
+        if self._free > 0:
+            self._free -= 1
+            return False
+        return None
+
+    async def acquire(self, priority: Priority = Priority.NORMAL):
+        """wait for a request slot, returns whether a reserved slot was taken"""
+
+        if (not self._waiters or self._waiters[0][0] > priority) and (
+            reserved := self._take(priority)
+        ) is not None:
+            return reserved
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(future.result())
+            raise
+
+    def release(self, reserved: bool = False):
+        """return a request slot"""
+
+        if reserved:
+            self._free_interactive += 1
+        else:
+            self._free += 1
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if (reserved := self._take(priority)) is None:
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(reserved)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.NORMAL):
+        """hold a request slot"""
+
+        reserved = await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(reserved)
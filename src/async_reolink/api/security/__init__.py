@@ -8,12 +8,9 @@ from typing import Callable
 
 from ..const import DEFAULT_PASSWORD, DEFAULT_USERNAME
 
-from ..commands import (
-    CommandErrorResponse,
-    ResponseCode,
-)
+from ..errors import ErrorCodes
 
-from ..errors import ErrorCodes, ReolinkResponseError
+from ..executor import command
 
 from ..commands.security import (
     LoginRequest,
@@ -67,17 +64,11 @@ class Security(ABC):
     ) -> bool:
         """attempt to log into device"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_login_request(username, password)
-            ):
-                if isinstance(response, LoginResponse):
-                    return await self._process_login(response)
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Login request failed")
+        return await self._process_login(await self.__login(username, password))
 
-        raise ReolinkResponseError("Login request failed")
+    @command(LoginResponse, error="Login request failed", send="_transmit")
+    def __login(self, username: str, password: str):
+        return self._create_login_request(username, password)
 
     @abstractmethod
     def _create_logout_request(self) -> LogoutRequest:
@@ -94,15 +85,7 @@ class Security(ABC):
             return
 
         try:
-            if isinstance(self, connection.Connection):
-                async for response in self._execute(self._create_logout_request()):
-                    if isinstance(response, CommandErrorResponse):
-                        response.throw("Logout request failed")
-
-                    if isinstance(response, ResponseCode):
-                        return
-
-            raise ReolinkResponseError("Logout request failed")
+            await self.__logout()
         finally:
             try:
                 for callback in self._logout_callbacks:
@@ -114,19 +97,16 @@ class Security(ABC):
                 # whether clean or not logout always succeeds
                 self._clear_login()
 
+    @command(error="Logout request failed", send="_transmit")
+    def __logout(self):
+        return self._create_logout_request()
+
     @abstractmethod
     def _create_get_user_request(self) -> GetUserRequest:
         ...
 
-    async def get_users(self):
+    @command(GetUserResponse, "users", error="Get users failed", cache="get_users")
+    def get_users(self):
         """Get Device Users"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_user_request()):
-                if isinstance(response, GetUserResponse):
-                    return response.users
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get PTZ Zoom Focus failed")
-
-        raise ReolinkResponseError("Get PTZ Zoom Focus failed")
+        return self._create_get_user_request()
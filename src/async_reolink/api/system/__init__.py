@@ -1,18 +1,26 @@
 """System"""
 from __future__ import annotations
+import asyncio
 from abc import ABC, abstractmethod
 from ctypes import cast
 from datetime import datetime
+from time import monotonic
 from typing import TYPE_CHECKING
 
 from .typings import DeviceInfo
 
 from .capabilities import Capabilities
 
-from ..errors import ReolinkResponseError
+from .packed import pack_capabilities
 
+from ..errors import ReolinkError
+
+from ..executor import command
+
+from ..profiles import DeviceProfile, ProfileStore
+
+from ..clock import DeviceClock
 
-from ..commands import CommandErrorResponse, ResponseCode
 from ..commands.system import (
     GetAbilitiesRequest,
     GetAbilitiesResponse,
@@ -31,11 +39,22 @@ from .. import connection
 class System(ABC):
     """System Commands Mixin"""
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        profile_store: ProfileStore | None = None,
+        clock: DeviceClock | None = None,
+        packed_capabilities: bool = False,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.__abilities = None
+        self.__packed_capabilities = packed_capabilities
         self.__time = None
         self.__timezone = None
+        self.__profile_store = profile_store
+        self.__clock = clock if clock is not None else DeviceClock()
+        self.__revalidation: asyncio.Task | None = None
 
         if isinstance(self, connection.Connection):
             self._disconnect_callbacks.append(self.__clear)
@@ -44,6 +63,34 @@ class System(ABC):
         self.__abilities = None
         self.__timezone = None
         self.__time = None
+        self.__clock.reset()
+        if self.__revalidation is not None:
+            self.__revalidation.cancel()
+            self.__revalidation = None
+
+    @property
+    def profile_store(self):
+        """On disk device profile store, None when not persisting profiles"""
+        return self.__profile_store
+
+    @profile_store.setter
+    def profile_store(self, value: ProfileStore | None):
+        self.__profile_store = value
+
+    @property
+    def packed_capabilities(self):
+        """Keep fetched capabilities packed
+
+        Packed trees share identical channels and take a fraction of the
+        memory, for NVRs with many channels, but attribute lookups are
+        several times slower.
+        """
+        return self.__packed_capabilities
+
+    @property
+    def clock(self):
+        """Local model of the device clock"""
+        return self.__clock
 
     @abstractmethod
     def _create_get_capabilities_request(
@@ -61,22 +108,109 @@ class System(ABC):
         if username is None:
             self.__abilities = None
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(
-                self._create_get_capabilities_request(username)
-            ):
-                if isinstance(response, GetAbilitiesResponse):
-                    return response.capabilities
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get capabilities failed")
-
-        return self._create_empty_capabilities()
+        abilities = self.__kept(await self.__get_ability(username))
+        if username is None:
+            self.__abilities = abilities
+        return abilities
+
+    def __kept(self, abilities: Capabilities):
+        if self.__packed_capabilities:
+            return pack_capabilities(abilities)
+        return abilities
+
+    @command(
+        GetAbilitiesResponse,
+        "capabilities",
+        error="Get capabilities failed",
+        default=lambda self: self._create_empty_capabilities(),
+    )
+    def __get_ability(self, username: str | None):
+        return self._create_get_capabilities_request(username)
+
+    def _get_known_abilities(self):
+        """capabilities already fetched, None when not yet known"""
+        return self.__abilities
 
     async def _ensure_abilities(self):
         if self.__abilities:
             return self.__abilities
-        return await self.get_ability()
+        if (store := self.__profile_store) is None:
+            return await self.get_ability()
+
+        if (profile := await self.__load_profile(store)) is not None:
+            self.__abilities = self.__kept(profile.capabilities)
+            return self.__abilities
+
+        abilities = await self.get_ability()
+        try:
+            info = await self.get_device_info()
+        except ReolinkError:
+            return abilities
+        await self.__stored(
+            store.save,
+            DeviceProfile(store.key(info), info, abilities, self.__hostname()),
+        )
+        return abilities
+
+    @staticmethod
+    async def __stored(func, *args):
+        """run a profile store call in a thread, None when it fails
+
+        The store only saves round trips, a failing or corrupt store must
+        never break ability lookup.
+        """
+
+        try:
+            return await asyncio.to_thread(func, *args)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def __hostname(self) -> str | None:
+        if isinstance(self, connection.Connection):
+            return self.hostname
+        return None
+
+    async def __load_profile(self, store: ProfileStore):
+        info = None
+        profile = None
+        if hostname := self.__hostname():
+            profile = await self.__stored(store.find, hostname)
+        if profile is None or profile.capabilities is None:
+            try:
+                info = await self.get_device_info()
+            except ReolinkError:
+                return None
+            profile = await self.__stored(store.load, store.key(info))
+            if profile is None or profile.capabilities is None:
+                return None
+
+        if self.__revalidation is None or self.__revalidation.done():
+            self.__revalidation = asyncio.create_task(
+                self.__revalidate(store, profile, info)
+            )
+        return profile
+
+    async def __revalidate(
+        self, store: ProfileStore, profile: DeviceProfile, info: DeviceInfo | None
+    ):
+        """confirm a stored profile still matches the device, refreshing it if not"""
+
+        try:
+            if info is None:
+                info = await self.get_device_info()
+            key = store.key(info)
+            hostname = self.__hostname()
+            if key == profile.key and not store.stale(profile):
+                if profile.hostname != hostname:
+                    profile.hostname = hostname
+                    await self.__stored(store.save, profile)
+                return
+
+            abilities = self.__kept(await self.__get_ability(None))
+            self.__abilities = abilities
+        except ReolinkError:
+            return
+        await self.__stored(store.save, DeviceProfile(key, info, abilities, hostname))
 
     @abstractmethod
     def _create_get_device_info_request(self) -> GetDeviceInfoRequest:
@@ -86,18 +220,17 @@ class System(ABC):
     def _create_empty_device_info(self) -> DeviceInfo:
         ...
 
-    async def get_device_info(self):
+    @command(
+        GetDeviceInfoResponse,
+        "info",
+        error="Get device info failed",
+        cache="get_device_info",
+        default=lambda self: self._create_empty_device_info(),
+    )
+    def get_device_info(self):
         """Get Device Information"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_device_info_request()):
-                if isinstance(response, GetDeviceInfoResponse):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get device info failed")
-
-        return self._create_empty_device_info()
+        return self._create_get_device_info_request()
 
     @abstractmethod
     def _create_get_time_request(self) -> GetTimeRequest:
@@ -109,25 +242,27 @@ class System(ABC):
         self.__timezone = None
         self.__time = None
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_time_request()):
-                if isinstance(response, GetTimeResponse):
-                    self.__time = response.to_datetime()
-                    self.__timezone = response.to_timezone()
-
-                    return self.__time
+        sent = monotonic()
+        if (response := await self.__get_time()) is not None:
+            self.__time = response.to_datetime()
+            self.__timezone = response.to_timezone()
+            self.__clock.sync(self.__time, sent, monotonic())
 
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get time failed")
+            return self.__time
 
         if TYPE_CHECKING:
             _time = datetime.now()
             self.__time = _time
         return self.__time
 
+    @command(GetTimeResponse, error="Get time failed", default=lambda _: None)
+    def __get_time(self):
+        return self._create_get_time_request()
+
     async def _ensure_time(self):
-        if self.__time:
-            return self.__time
+        """current device time, read from the device only when the clock is stale"""
+        if self.__time and not self.__clock.stale:
+            return self.__clock.now()
         return await self.get_time()
 
     async def get_time_info(self):
@@ -144,32 +279,18 @@ class System(ABC):
     def _create_reboot_request(self) -> RebootRequest:
         ...
 
-    async def reboot(self):
+    @command(error="Reboot failed")
+    def reboot(self):
         """Reboot device"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_reboot_request()):
-                if isinstance(response, ResponseCode):
-                    return True
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Reboot failed")
-
-        raise ReolinkResponseError("Reboot failed")
+        return self._create_reboot_request()
 
     @abstractmethod
     def _create_get_hdd_info_request(self) -> GetHddInfoRequest:
         ...
 
-    async def get_storage_info(self):
+    @command(GetHddInfoResponse, "info", error="Get storage Info failed")
+    def get_storage_info(self):
         """Get Device Recording Capabilities"""
 
-        if isinstance(self, connection.Connection):
-            async for response in self._execute(self._create_get_hdd_info_request()):
-                if isinstance(response, GetHddInfoResponse):
-                    return response.info
-
-                if isinstance(response, CommandErrorResponse):
-                    response.throw("Get storage Info failed")
-
-        raise ReolinkResponseError("Get storage Info failed")
+        return self._create_get_hdd_info_request()
@@ -0,0 +1,312 @@
+"""Packed Capabilities
+
+Compact read only capabilities for devices with many channels. Every
+boolean and enum capability of a tree, with its permissions, is packed
+into a single integer bitfield, nodes are views created on access.
+Identical channel trees share one instance.
+
+Opt in with `System(packed_capabilities=True)` or pack a tree directly.
+In the benchmarks a 36 channel NVR keeps about 47 bytes per channel
+instead of 22.9 KB, most of it from sharing identical channels rather
+than from the bitfield, while attribute lookups are about 6 times slower
+than on a plain object tree.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping as AbcMapping
+from enum import Enum, Flag
+from functools import cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Mapping,
+    NamedTuple,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from weakref import WeakValueDictionary
+
+from .capabilities import Capabilities, Capability, ChannelCapabilities, Permissions
+
+
+class PackedCapability(NamedTuple):
+    """Capability value"""
+
+    value: Any
+    permissions: Permissions | None
+
+
+_leaf = cache(PackedCapability)
+
+
+@cache
+def _codec(value_type: Any) -> tuple[int, Callable[[Any], int | None], tuple]:
+    """bit width, encoder and code to value table of a capability value type
+
+    Code 0 is None, encoders return None for values that do not fit.
+    """
+
+    if isinstance(value_type, type) and issubclass(value_type, Flag):
+        combined = sum(member.value for member in value_type)
+
+        def encode_flag(value):
+            if value is None:
+                return 0
+            if type(value) is not value_type:
+                return None
+            return value.value + 1
+
+        values = (None, *(value_type(value) for value in range(combined + 1)))
+        return ((combined + 1).bit_length(), encode_flag, values)
+
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        values = (None, *value_type)
+    elif value_type is bool:
+        values = (None, False, True)
+    else:
+        values = (None,)
+    exact = value_type if isinstance(value_type, type) else None
+    codes = {value: code for code, value in enumerate(values) if value is not None}
+
+    def encode(value):
+        if value is None:
+            return 0
+        if type(value) is not exact:
+            return None
+        return codes.get(value)
+
+    return ((len(values) - 1).bit_length(), encode, values)
+
+
+_PERMISSIONS_WIDTH, _encode_permissions, _PERMISSIONS = _codec(Permissions)
+
+
+@cache
+def _leaves(value_type: Any):
+    """capability per combined value and permissions code"""
+
+    width, _, values = _codec(value_type)
+    mask = (1 << width) - 1
+
+    def leaf(code: int):
+        value, permissions = code & mask, code >> width
+        return _leaf(
+            values[value] if value < len(values) else None,
+            _PERMISSIONS[permissions] if permissions < len(_PERMISSIONS) else None,
+        )
+
+    return tuple(leaf(code) for code in range(1 << (width + _PERMISSIONS_WIDTH)))
+
+
+class _Field(NamedTuple):
+    path: str
+    offset: int
+    value_type: Any
+
+    @property
+    def end(self):
+        """first bit after the field"""
+        return self.offset + _codec(self.value_type)[0] + _PERMISSIONS_WIDTH
+
+
+def _capability_type(protocol: type):
+    for base in getattr(protocol, "__orig_bases__", ()):
+        if get_origin(base) is Capability:
+            return get_args(base)[0]
+    return None
+
+
+class _PackedNode:
+    """view of a packed capability tree node"""
+
+    __slots__ = ("_bits", "_extra")
+
+    _root: ClassVar[type]
+    _path: ClassVar[str]
+
+    def __init__(self, bits: int, extra: dict[str, PackedCapability] | None = None):
+        self._bits = bits
+        self._extra = extra
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._bits:#x}>"
+
+    def __reduce__(self):
+        return (_view, (self._root, self._path, self._bits, self._extra))
+
+
+class _PackedRoot(_PackedNode):
+    """packed capability tree"""
+
+    __slots__ = ("__weakref__",)
+
+    _fields: ClassVar[tuple[_Field, ...]]
+    _children: ClassVar[dict[str, type]]
+
+    def __reduce__(self):
+        plain = {name: getattr(self, name) for name in self._children}
+        return (_restore, (self._root, self._bits, self._extra, plain))
+
+
+def _leaf_property(path: str, offset: int, value_type: Any):
+    table = _leaves(value_type)
+    mask = len(table) - 1
+
+    def get(self: _PackedNode):
+        if (extra := self._extra) is not None and path in extra:
+            return extra[path]
+        return table[(self._bits >> offset) & mask]
+
+    return property(get)
+
+
+def _member_property(path: str, offset: int, value_type: Any, member: str):
+    getter = attrgetter(member)
+    capability = _leaf_property(path, offset, value_type).fget
+
+    return property(lambda self: getter(capability(self)))
+
+
+def _node_property(node: type):
+    return property(lambda self: node(self._bits, self._extra))
+
+
+def _compile(
+    root: type,
+    protocol: type,
+    path: str,
+    fields: list[_Field],
+    children: dict[str, type],
+):
+    namespace: dict[str, Any] = {"__slots__": (), "__doc__": protocol.__doc__}
+    if (value_type := _capability_type(protocol)) is not None:
+        offset = fields[-1].end if fields else 0
+        fields.append(_Field(path.rstrip("."), offset, value_type))
+        namespace["value"] = _member_property(
+            path.rstrip("."), offset, value_type, "value"
+        )
+        namespace["permissions"] = _member_property(
+            path.rstrip("."), offset, value_type, "permissions"
+        )
+
+    for name, hint in get_type_hints(protocol).items():
+        if name in ("value", "permissions") and value_type is not None:
+            continue
+        if get_origin(hint) is Capability:
+            (child_type,) = get_args(hint)
+            offset = fields[-1].end if fields else 0
+            fields.append(_Field(path + name, offset, child_type))
+            namespace[name] = _leaf_property(path + name, offset, child_type)
+        elif isinstance(hint, type):
+            node = _compile(root, hint, path + name + ".", fields, children)
+            namespace[name] = _node_property(node)
+        elif not path:
+            children[name] = hint
+
+    if path:
+        namespace["_root"] = root
+        namespace["_path"] = path.rstrip(".")
+        return type(f"Packed{protocol.__name__}", (_PackedNode, protocol), namespace)
+    return namespace
+
+
+@cache
+def packed_type(protocol: type) -> type:
+    """packed implementation of a capabilities protocol"""
+
+    fields: list[_Field] = []
+    children: dict[str, type] = {}
+    namespace = _compile(protocol, protocol, "", fields, children)
+    namespace["__slots__"] = tuple(children)
+    namespace["_root"] = protocol
+    namespace["_path"] = ""
+    namespace["_fields"] = tuple(fields)
+    namespace["_children"] = children
+    return type(f"Packed{protocol.__name__}", (_PackedRoot, protocol), namespace)
+
+
+def _get(source: Any, path: str):
+    try:
+        return attrgetter(path)(source)
+    except AttributeError:
+        return None
+
+
+def _pack_bits(protocol: type, source: Any):
+    bits = 0
+    extra: dict[str, PackedCapability] | None = None
+    for field in packed_type(protocol)._fields:
+        capability = _get(source, field.path)
+        value = getattr(capability, "value", None)
+        permissions = getattr(capability, "permissions", None)
+        width, encode, _ = _codec(field.value_type)
+        value_code = encode(value)
+        permissions_code = _encode_permissions(permissions)
+        if value_code is None or permissions_code is None:
+            if extra is None:
+                extra = {}
+            extra[field.path] = PackedCapability(value, permissions)
+            continue
+        bits |= (value_code | (permissions_code << width)) << field.offset
+    return bits, extra
+
+
+_interned: WeakValueDictionary[tuple[type, int], _PackedRoot] = WeakValueDictionary()
+
+
+def pack(protocol: type, source: Any):
+    """packed copy of a capability tree implementing `protocol`"""
+
+    if isinstance(source, _PackedRoot) and source._root is protocol:
+        return source
+    cls = packed_type(protocol)
+    bits, extra = _pack_bits(protocol, source)
+    plain = {}
+    for name, hint in cls._children.items():
+        value = getattr(source, name, None)
+        if get_origin(hint) is AbcMapping and value is not None:
+            (_, item_type) = get_args(hint)
+            if isinstance(item_type, type) and _capability_type(item_type) is None:
+                value = {key: pack(item_type, item) for key, item in value.items()}
+        plain[name] = value
+
+    if extra is None and not plain:
+        if (packed := _interned.get((cls, bits))) is not None:
+            return packed
+    packed = cls(bits, extra)
+    for name, value in plain.items():
+        setattr(packed, name, value)
+    if extra is None and not plain:
+        _interned[(cls, bits)] = packed
+    return packed
+
+
+def pack_capabilities(capabilities: Capabilities) -> Capabilities:
+    """packed copy of device capabilities"""
+    return pack(Capabilities, capabilities)
+
+
+def pack_channel_capabilities(capabilities: ChannelCapabilities) -> ChannelCapabilities:
+    """packed copy of channel capabilities, equal channels share one instance"""
+    return pack(ChannelCapabilities, capabilities)
+
+
+def _restore(protocol: type, bits: int, extra: dict | None, plain: Mapping[str, Any]):
+    if extra is None and not plain:
+        cls = packed_type(protocol)
+        if (packed := _interned.get((cls, bits))) is None:
+            packed = _interned[(cls, bits)] = cls(bits)
+        return packed
+    packed = packed_type(protocol)(bits, extra)
+    for name, value in plain.items():
+        setattr(packed, name, value)
+    return packed
+
+
+def _view(protocol: type, path: str, bits: int, extra: dict | None):
+    node = packed_type(protocol)(bits, extra)
+    return attrgetter(path)(node) if path else node
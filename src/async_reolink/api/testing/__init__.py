@@ -0,0 +1,789 @@
+"""In memory reference device
+
+Implements every mixin against local state so the library can be exercised
+and benchmarked without a camera.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from functools import partial
+from time import monotonic
+from typing import Any, AsyncIterable, Callable, Iterable, Mapping, Sequence
+
+from ..const import DEFAULT_PASSWORD, DEFAULT_TIMEOUT, DEFAULT_USERNAME
+from ..errors import ErrorCodes, ReolinkConnectionError
+
+from ..connection import Connection
+from ..security import Security
+from ..system import System
+from ..network import Network
+from ..encoding import Encoding
+from ..record import Record
+from ..ptz import PTZ
+from ..led import LED
+from ..ai import AI
+from ..alarm import Alarm
+
+from ..lazy import LazySequence
+
+from ..commands import CommandRequest, CommandResponse
+from ..commands import (
+    ai as ai_commands,
+    alarm as alarm_commands,
+    encoding as encoding_commands,
+    led as led_commands,
+    network as network_commands,
+    ptz as ptz_commands,
+    record as record_commands,
+    security as security_commands,
+    system as system_commands,
+)
+
+from ..ai.typings import AITypes, Config
+from ..led.typings import LightStates, WhiteLedInfo
+from ..network.typings import LinkTypes
+from ..ptz.typings import Operation, Patrol, Preset, Track, ZoomOperation
+from ..record.typings import Search
+from ..security.typings import LevelTypes
+from ..system.typings import HourFormat, StorageTypes
+from ..typings import StreamTypes, WeekDays
+
+from . import commands
+from .typings import DateTime, DstTime, Status, Time, Value, build_capabilities
+
+Recording = tuple[datetime, datetime]
+"""Start and end of a recording in device local time"""
+
+
+def recording_schedule(
+    start: date, days: int, per_day: int = 24, duration: timedelta = timedelta(minutes=5)
+) -> list[Recording]:
+    """Evenly spaced recordings over a number of days"""
+
+    spacing = timedelta(days=1) / max(per_day, 1)
+    recordings = []
+    for day in range(days):
+        midnight = datetime.combine(start + timedelta(days=day), time.min)
+        for i in range(per_day):
+            begin = midnight + spacing * i
+            recordings.append((begin, begin + duration))
+    return recordings
+
+
+_HANDLERS: Mapping[type, str] = {
+    security_commands.LoginRequest: "_login",
+    security_commands.LogoutRequest: "_logout",
+    security_commands.GetUserRequest: "_get_users",
+    system_commands.GetAbilitiesRequest: "_get_abilities",
+    system_commands.GetDeviceInfoRequest: "_get_device_info",
+    system_commands.GetTimeRequest: "_get_time",
+    system_commands.RebootRequest: "_ok",
+    system_commands.GetHddInfoRequest: "_get_hdd_info",
+    network_commands.GetLocalLinkRequest: "_get_local_link",
+    network_commands.GetChannelStatusRequest: "_get_channel_status",
+    network_commands.GetNetworkPortsRequest: "_get_ports",
+    network_commands.GetRTSPUrlsRequest: "_get_rtsp_urls",
+    network_commands.GetP2PRequest: "_get_p2p",
+    network_commands.GetWifiInfoRequest: "_get_wifi",
+    network_commands.GetWifiSignalRequest: "_get_wifi_signal",
+    encoding_commands.GetEncodingRequest: "_get_encoding",
+    record_commands.SearchRecordingsRequest: "_search_recordings",
+    ptz_commands.GetPresetRequest: "_get_presets",
+    ptz_commands.SetPresetRequest: "_set_preset",
+    ptz_commands.GetPatrolRequest: "_get_patrols",
+    ptz_commands.SetPatrolRequest: "_set_patrol",
+    ptz_commands.SetControlRequest: "_ok",
+    ptz_commands.GetTatternRequest: "_get_tatterns",
+    ptz_commands.SetTatternRequest: "_set_tatterns",
+    ptz_commands.GetAutoFocusRequest: "_get_autofocus",
+    ptz_commands.SetAutoFocusRequest: "_set_autofocus",
+    ptz_commands.GetZoomFocusRequest: "_get_zoom_focus",
+    ptz_commands.SetZoomFocusRequest: "_set_zoom_focus",
+    led_commands.GetIrLightsRequest: "_get_ir_lights",
+    led_commands.SetIrLightsRequest: "_set_ir_lights",
+    led_commands.GetPowerLedRequest: "_get_power_led",
+    led_commands.SetPowerLedRequest: "_set_power_led",
+    led_commands.GetWhiteLedRequest: "_get_white_led",
+    led_commands.SetWhiteLedRequest: "_set_white_led",
+    ai_commands.GetAiStateRequest: "_get_ai_state",
+    ai_commands.GetAiConfigRequest: "_get_ai_config",
+    ai_commands.SetAiConfigRequest: "_set_ai_config",
+    alarm_commands.GetMotionStateRequest: "_get_md_state",
+}
+
+
+class _Channel:
+    """per channel device state"""
+
+    def __init__(self, channel: int) -> None:
+        self.ir_lights = LightStates.AUTO
+        self.power_led = LightStates.ON
+        self.white_led = Value(
+            brightness=100,
+            auto_mode=True,
+            brightness_state=0,
+            state=False,
+            lighting_schedule=Value(start=Value(hour=18, minute=0), end=Value(hour=6, minute=0)),
+            ai_detection_type={_type: False for _type in AITypes},
+        )
+        self.ai_config = Value(
+            detect_type={_type: True for _type in AITypes},
+            ai_track=False,
+            track_type={_type: False for _type in AITypes},
+        )
+        self.motion = False
+        self.presets: dict[int, Preset] = {}
+        self.patrols: dict[int, Patrol] = {}
+        self.tracks: dict[int, Track] = {}
+        self.autofocus_disabled = False
+        self.zoom = 1
+        self.focus = 1
+        self.encoding = Value(
+            audio=True,
+            stream={
+                StreamTypes.MAIN: Value(
+                    bit_rate=6144,
+                    frame_rate=25,
+                    gop=2,
+                    height=1440,
+                    width=2560,
+                    profile="High",
+                    size="2560*1440",
+                    video_type="H264",
+                ),
+                StreamTypes.SUB: Value(
+                    bit_rate=512,
+                    frame_rate=15,
+                    gop=4,
+                    height=480,
+                    width=640,
+                    profile="High",
+                    size="640*480",
+                    video_type="H264",
+                ),
+            },
+        )
+        self.name = f"Camera {channel + 1}"
+
+
+class FakeDevice(
+    Connection, Security, System, Network, Encoding, Record, PTZ, LED, AI, Alarm
+):
+    """In memory device implementing every command
+
+    `latency` is awaited once per request and may be a callable returning
+    seconds, `error_rate` is the chance each command answers `error_code`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        channels: int = 1,
+        capabilities: Mapping[str, Any] | None = None,
+        channel_capabilities: Mapping[str, Any] | None = None,
+        recordings: Mapping[int, Iterable[Recording]] | None = None,
+        latency: float | Callable[[], float] = 0,
+        error_rate: float = 0,
+        error_code: ErrorCodes = ErrorCodes.INTERNAL,
+        snapshot_size: int = 512 * 1024,
+        chunk_size: int = 64 * 1024,
+        timezone_offset: int = 0,
+        username: str = DEFAULT_USERNAME,
+        password: str = DEFAULT_PASSWORD,
+        seed: int | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._hostname: str | None = None
+        self._connected = False
+        self._connection_id = 0
+        self._token: int | None = None
+        self._token_expires = 0.0
+        self._username = username
+        self._password = password
+        self._latency = latency
+        self._error_rate = error_rate
+        self._error_code = error_code
+        self._random = random.Random(seed)
+        self._snapshot = b"\xff\xd8" + bytes(max(snapshot_size - 4, 0)) + b"\xff\xd9"
+        self._chunk_size = max(chunk_size, 1)
+        self._timezone_offset = timezone_offset
+        self._channels = [_Channel(channel) for channel in range(channels)]
+        self._capabilities = build_capabilities(
+            channels, capabilities, channel_capabilities, lazy=True
+        )
+        self._recordings: dict[int, list[Recording]] = {
+            channel: sorted(items) for channel, items in (recordings or {}).items()
+        }
+        self._info = Value(
+            io=Value(inputs=0, outputs=0),
+            audio_sources=1,
+            build_day="build 22090900",
+            channels=channels,
+            detail="FAKE_DEVICE",
+            disks=1,
+            version=Value(
+                firmware="v3.0.0.0_00000000",
+                framework="v1.0.0.1",
+                hardware="FAKE",
+                config="v3.0.0.0",
+            ),
+            model="FakeCam" if channels == 1 else "FakeNVR",
+            name="Fake Device",
+            type="IPC" if channels == 1 else "NVR",
+            wifi=False,
+            exact_type="IPC" if channels == 1 else "NVR",
+            serial="00000000000000",
+            pak_suffix="pak",
+        )
+        self._handlers: dict[type, Callable[[CommandRequest], CommandResponse]] = {}
+        self.requests = 0
+        """number of requests received"""
+        self.commands = 0
+        """number of commands received"""
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def connection_id(self) -> int:
+        return self._connection_id
+
+    @property
+    def hostname(self):
+        return self._hostname
+
+    async def connect(
+        self,
+        hostname: str = "fake",
+        port: int = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if self._connected:
+            await self.disconnect()
+        self._hostname = hostname
+        self._connected = True
+        self._connection_id += 1
+        for callback in self._connect_callbacks:
+            if inspect.isawaitable(result := callback()):
+                await result
+
+    async def disconnect(self):
+        for callback in self._disconnect_callbacks:
+            if inspect.isawaitable(result := callback()):
+                await result
+        self._connected = False
+
+    def _handler(self, command: CommandRequest):
+        if (handler := self._handlers.get(type(command))) is None:
+            handler = self._unsupported
+            for cls in type(command).__mro__:
+                if (name := _HANDLERS.get(cls)) is not None:
+                    handler = getattr(self, name)
+                    break
+            self._handlers[type(command)] = handler
+        return handler
+
+    async def _execute(self, *args: CommandRequest) -> AsyncIterable[CommandResponse | bytes]:
+        if not self._connected:
+            raise ReolinkConnectionError("Not connected")
+        self.requests += 1
+        self.commands += len(args)
+        latency = self._latency() if callable(self._latency) else self._latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+        for command in args:
+            if self._error_rate and self._random.random() < self._error_rate:
+                yield self._error(self._error_code)
+                continue
+            if isinstance(command, record_commands.GetSnapshotRequest):
+                view = memoryview(self._snapshot)
+                for offset in range(0, len(view), self._chunk_size):
+                    yield bytes(view[offset : offset + self._chunk_size])
+                continue
+            yield self._handler(command)(command)
+
+    def _error(self, code: ErrorCodes):
+        return commands.ErrorResponse(error_code=code, details=code.description)
+
+    def _unsupported(self, _command: CommandRequest):
+        return self._error(ErrorCodes.NOT_SUPPORTED)
+
+    def _ok(self, _command: CommandRequest):
+        return commands.CodeResponse(response_code=0)
+
+    def _channel(self, command: CommandRequest):
+        return self._channels[getattr(command, "channel_id", 0)]
+
+    # Security
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._token is not None and monotonic() < self._token_expires
+
+    @property
+    def authentication_timeout(self) -> float:
+        return max(0.0, self._token_expires - monotonic()) if self._token is not None else 0.0
+
+    @property
+    def authentication_id(self) -> int:
+        return self._token or 0
+
+    async def _prelogin(self, username: str) -> bool:
+        return True
+
+    async def _process_login(self, response: security_commands.LoginResponse) -> bool:
+        self._token = response.token
+        self._token_expires = monotonic() + response.lease_time
+        return True
+
+    def _create_login_request(self, username: str, password: str):
+        return commands.LoginRequest(user_name=username, password=password)
+
+    def _login(self, command: security_commands.LoginRequest):
+        if command.user_name != self._username or command.password != self._password:
+            return self._error(ErrorCodes.LOGIN_FAILED)
+        return commands.LoginResponse(token=self._random.getrandbits(31) or 1, lease_time=3600)
+
+    def _create_logout_request(self):
+        return commands.LogoutRequest()
+
+    def _logout(self, _command: security_commands.LogoutRequest):
+        return commands.CodeResponse(response_code=0)
+
+    def _clear_login(self) -> None:
+        self._token = None
+        self._token_expires = 0.0
+
+    def _create_get_user_request(self):
+        return commands.GetUserRequest()
+
+    def _get_users(self, _command: security_commands.GetUserRequest):
+        return commands.GetUserResponse(
+            users=[Value(user_name=self._username, level=LevelTypes.ADMIN)]
+        )
+
+    # System
+
+    def _create_get_capabilities_request(self, username: str | None):
+        return commands.GetAbilitiesRequest(user_name=username)
+
+    def _create_empty_capabilities(self):
+        return build_capabilities(0)
+
+    def _get_abilities(self, _command: system_commands.GetAbilitiesRequest):
+        return commands.GetAbilitiesResponse(capabilities=self._capabilities)
+
+    def _create_get_device_info_request(self):
+        return commands.GetDeviceInfoRequest()
+
+    def _create_empty_device_info(self):
+        return Value()
+
+    def _get_device_info(self, _command: system_commands.GetDeviceInfoRequest):
+        return commands.GetDeviceInfoResponse(info=self._info)
+
+    def _create_get_time_request(self):
+        return commands.GetTimeRequest()
+
+    def _get_time(self, _command: system_commands.GetTimeRequest):
+        now = datetime.now(timezone(timedelta(seconds=self._timezone_offset)))
+        return commands.GetTimeResponse(
+            dst=Value(
+                enabled=False,
+                hour_offset=1,
+                start=DstTime(month=3, week=2, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+                end=DstTime(month=11, week=1, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+            ),
+            time=Time(
+                year=now.year,
+                month=now.month,
+                day=now.day,
+                hour=now.hour,
+                minute=now.minute,
+                second=now.second,
+                hour_format=HourFormat.HR_24,
+                timezone_offset=self._timezone_offset,
+            ),
+        )
+
+    def _create_reboot_request(self):
+        return commands.RebootRequest()
+
+    def _create_get_hdd_info_request(self):
+        return commands.GetHddInfoRequest()
+
+    def _get_hdd_info(self, _command: system_commands.GetHddInfoRequest):
+        return commands.GetHddInfoResponse(
+            info={
+                0: Value(
+                    id=0,
+                    capacity=1907729,
+                    formatted=True,
+                    mounted=True,
+                    free_space=953864,
+                    type=StorageTypes.HDD,
+                )
+            }
+        )
+
+    # Network
+
+    def _create_get_local_link_request(self):
+        return commands.GetLocalLinkRequest()
+
+    def _get_local_link(self, _command: network_commands.GetLocalLinkRequest):
+        return commands.GetLocalLinkResponse(
+            local_link=Value(
+                active_link="LAN",
+                dns=Value(auto=True, dns_1="192.168.1.1", dns_2="0.0.0.0"),
+                mac="00:00:00:00:00:00",
+                type=LinkTypes.DHCP,
+                ip=Value(gateway="192.168.1.1", address="192.168.1.100", mask="255.255.255.0"),
+            )
+        )
+
+    def _create_get_channel_status_request(self):
+        return commands.GetChannelStatusRequest()
+
+    def _get_channel_status(self, _command: network_commands.GetChannelStatusRequest):
+        return commands.GetChannelStatusResponse(
+            channels={
+                channel: Value(channel_id=channel, name=state.name, online=True, type="")
+                for channel, state in enumerate(self._channels)
+            }
+        )
+
+    def _create_get_ports_request(self):
+        return commands.GetNetworkPortsRequest()
+
+    def _get_ports(self, _command: network_commands.GetNetworkPortsRequest):
+        return commands.GetNetworkPortsResponse(
+            ports=Value(
+                media=Value(value=9000, enabled=True),
+                http=Value(value=80, enabled=True),
+                https=Value(value=443, enabled=True),
+                onvif=Value(value=8000, enabled=True),
+                rtmp=Value(value=1935, enabled=True),
+                rtsp=Value(value=554, enabled=True),
+            )
+        )
+
+    def _create_get_rtsp_urls_request(self, channel_id: int = 0):
+        return commands.GetRTSPUrlsRequest(channel_id=channel_id)
+
+    def _get_rtsp_urls(self, command: network_commands.GetRTSPUrlsRequest):
+        prefix = f"rtsp://{self._hostname}/h264Preview_{command.channel_id + 1:02}"
+        return commands.GetRTSPUrlsResponse(
+            channel_id=command.channel_id,
+            urls={stream: f"{prefix}_{stream.name.lower()}" for stream in StreamTypes},
+        )
+
+    def _create_get_p2p_request(self):
+        return commands.GetP2PRequest()
+
+    def _get_p2p(self, _command: network_commands.GetP2PRequest):
+        return commands.GetP2PResponse(info=Value(enabled=True, uid=self._info.serial))
+
+    def _create_get_wifi_info_request(self):
+        return commands.GetWifiInfoRequest()
+
+    def _get_wifi(self, _command: network_commands.GetWifiInfoRequest):
+        return commands.GetWifiInfoResponse(info=Value(ssid="", password=""))
+
+    def _create_get_wifi_signal_request(self):
+        return commands.GetWifiSignalRequest()
+
+    def _get_wifi_signal(self, _command: network_commands.GetWifiSignalRequest):
+        return commands.GetWifiSignalResponse(signal=0)
+
+    # Encoding
+
+    def _create_get_encoding_request(self, channel: int):
+        return commands.GetEncodingRequest(channel_id=channel)
+
+    def _get_encoding(self, command: encoding_commands.GetEncodingRequest):
+        return commands.GetEncodingResponse(
+            channel_id=command.channel_id, info=self._channel(command).encoding
+        )
+
+    # Record
+
+    def _create_get_snapshot_request(self, channel: int):
+        return commands.GetSnapshotRequest(channel_id=channel)
+
+    def _create_search_request(self, channel: int, search: Search):
+        return commands.SearchRecordingsRequest(channel_id=channel, search=search)
+
+    def _create_search(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        only_status: bool,
+        stream_type: StreamTypes,
+    ):
+        return Value(
+            status_only=only_status,
+            stream_type=stream_type,
+            start=DateTime.from_datetime(start_time),
+            end=DateTime.from_datetime(end_time),
+        )
+
+    def _file(self, channel: int, stream_type: StreamTypes, recording: Recording):
+        (start, end) = recording
+        encoding = self._channels[channel].encoding.stream.get(
+            stream_type, self._channels[channel].encoding.stream[StreamTypes.MAIN]
+        )
+        return Value(
+            frame_rate=encoding.frame_rate,
+            width=encoding.width,
+            height=encoding.height,
+            name=f"Mp4Record/{start:%Y-%m-%d}/Rec{stream_type.name[0]}{channel:02}_"
+            f"{start:%Y%m%d_%H%M%S}_{end:%H%M%S}.mp4",
+            size=int((end - start).total_seconds() * encoding.bit_rate * 128),
+            type=stream_type.name.lower(),
+            start=DateTime.from_datetime(start),
+            end=DateTime.from_datetime(end),
+        )
+
+    def _search_recordings(self, command: record_commands.SearchRecordingsRequest):
+        search = command.search
+        start = search.start.to_datetime()
+        end = search.end.to_datetime()
+        recordings = self._recordings.get(command.channel_id, [])
+
+        status: list[Status] = []
+        (year, month) = (start.year, start.month)
+        while (year, month) <= (end.year, end.month):
+            days = sorted(
+                {
+                    begin.day
+                    for begin, _ in recordings
+                    if begin.year == year and begin.month == month
+                }
+            )
+            status.append(Status(year=year, month=month, days=days))
+            (year, month) = (year + month // 12, month % 12 + 1)
+
+        files = None
+        if not search.status_only:
+            files = LazySequence(
+                [
+                    recording
+                    for recording in recordings
+                    if recording[0] < end and recording[1] > start
+                ],
+                partial(self._file, command.channel_id, search.stream_type),
+            )
+        return commands.SearchRecordingsResponse(
+            channel_id=command.channel_id, status=status, files=files
+        )
+
+    # PTZ
+
+    def _create_get_ptz_presets_request(self, channel: int):
+        return commands.GetPresetRequest(channel_id=channel)
+
+    def _get_presets(self, command: ptz_commands.GetPresetRequest):
+        return commands.GetPresetResponse(
+            channel_id=command.channel_id, presets=dict(self._channel(command).presets)
+        )
+
+    def _create_set_ptz_preset_request(self, channel_id: int, preset: Preset):
+        return commands.SetPresetRequest(channel_id=channel_id, preset=preset)
+
+    def _set_preset(self, command: ptz_commands.SetPresetRequest):
+        self._channel(command).presets[command.preset.id] = command.preset
+        return self._ok(command)
+
+    def _create_get_ptz_patrols_request(self, channel: int):
+        return commands.GetPatrolRequest(channel_id=channel)
+
+    def _get_patrols(self, command: ptz_commands.GetPatrolRequest):
+        return commands.GetPatrolResponse(
+            channel_id=command.channel_id, patrols=dict(self._channel(command).patrols)
+        )
+
+    def _create_set_ptz_patrol_request(self, channel_id: int, patrol: Patrol):
+        return commands.SetPatrolRequest(channel_id=channel_id, patrol=patrol)
+
+    def _set_patrol(self, command: ptz_commands.SetPatrolRequest):
+        self._channel(command).patrols[command.patrol.id] = command.patrol
+        return self._ok(command)
+
+    def _create_get_ptz_tatterns_request(self, channel: int):
+        return commands.GetTatternRequest(channel_id=channel)
+
+    def _get_tatterns(self, command: ptz_commands.GetTatternRequest):
+        return commands.GetTatternResponse(
+            channel_id=command.channel_id, tracks=dict(self._channel(command).tracks)
+        )
+
+    def _create_set_ptz_tatterns_request(self, channel_id: int, *track: Track):
+        return commands.SetTatternRequest(channel_id=channel_id, tracks=list(track))
+
+    def _set_tatterns(self, command: ptz_commands.SetTatternRequest):
+        self._channel(command).tracks.update((track.id, track) for track in command.tracks)
+        return self._ok(command)
+
+    def _create_set_ptz_control_request(
+        self,
+        channel: int,
+        operation: Operation,
+        speed: int | None,
+        preset_id: int | None,
+    ):
+        return commands.SetControlRequest(
+            channel_id=channel, operation=operation, speed=speed, preset_id=preset_id
+        )
+
+    def _create_get_ptz_autofocus_request(self, channel: int):
+        return commands.GetAutoFocusRequest(channel_id=channel)
+
+    def _get_autofocus(self, command: ptz_commands.GetAutoFocusRequest):
+        return commands.GetAutoFocusResponse(
+            channel_id=command.channel_id, disabled=self._channel(command).autofocus_disabled
+        )
+
+    def _create_set_ptz_autofocus_request(self, channel: int, disabled: bool):
+        return commands.SetAutoFocusRequest(channel_id=channel, disabled=disabled)
+
+    def _set_autofocus(self, command: ptz_commands.SetAutoFocusRequest):
+        self._channel(command).autofocus_disabled = command.disabled
+        return self._ok(command)
+
+    def _create_get_ptz_zoom_focus_request(self, channel: int):
+        return commands.GetZoomFocusRequest(channel_id=channel)
+
+    def _get_zoom_focus(self, command: ptz_commands.GetZoomFocusRequest):
+        state = self._channel(command)
+        return commands.GetZoomFocusResponse(
+            channel_id=command.channel_id, state=Value(zoom=state.zoom, focus=state.focus)
+        )
+
+    def _create_set_ptz_zoomfocus_request(
+        self, channel: int, operation: ZoomOperation, position: int
+    ):
+        return commands.SetZoomFocusRequest(
+            channel_id=channel, operation=operation, position=position
+        )
+
+    def _set_zoom_focus(self, command: ptz_commands.SetZoomFocusRequest):
+        state = self._channel(command)
+        if command.operation == ZoomOperation.ZOOM:
+            state.zoom = command.position
+        else:
+            state.focus = command.position
+        return self._ok(command)
+
+    # LED
+
+    def _create_get_ir_lights_request(self, channel: int):
+        return commands.GetIrLightsRequest(channel_id=channel)
+
+    def _get_ir_lights(self, command: led_commands.GetIrLightsRequest):
+        return commands.GetIrLightsResponse(
+            channel_id=command.channel_id, state=self._channel(command).ir_lights
+        )
+
+    def _create_set_ir_lights_request(self, state: LightStates, channel: int):
+        return commands.SetIrLightsRequest(channel_id=channel, state=state)
+
+    def _set_ir_lights(self, command: led_commands.SetIrLightsRequest):
+        self._channel(command).ir_lights = command.state
+        return self._ok(command)
+
+    def _create_get_power_led_request(self, channel: int):
+        return commands.GetPowerLedRequest(channel_id=channel)
+
+    def _get_power_led(self, command: led_commands.GetPowerLedRequest):
+        return commands.GetPowerLedResponse(
+            channel_id=command.channel_id, state=self._channel(command).power_led
+        )
+
+    def _create_set_power_led_request(self, state: LightStates, channel: int):
+        return commands.SetPowerLedRequest(channel_id=channel, state=state)
+
+    def _set_power_led(self, command: led_commands.SetPowerLedRequest):
+        self._channel(command).power_led = command.state
+        return self._ok(command)
+
+    def _create_get_white_led_request(self, channel: int):
+        return commands.GetWhiteLedRequest(channel_id=channel)
+
+    def _get_white_led(self, command: led_commands.GetWhiteLedRequest):
+        return commands.GetWhiteLedResponse(
+            channel_id=command.channel_id, info=self._channel(command).white_led
+        )
+
+    def _create_set_white_led_request(self, info: WhiteLedInfo, channel: int):
+        return commands.SetWhiteLedRequest(channel_id=channel, info=info)
+
+    def _set_white_led(self, command: led_commands.SetWhiteLedRequest):
+        self._channel(command).white_led = command.info
+        return self._ok(command)
+
+    # AI
+
+    def _create_get_ai_state_request(self, channel: int):
+        return commands.GetAiStateRequest(channel_id=channel)
+
+    def _get_ai_state(self, command: ai_commands.GetAiStateRequest):
+        config = self._channel(command).ai_config
+        return commands.GetAiStateResponse(
+            channel_id=command.channel_id,
+            state={
+                _type: Value(state=False, supported=enabled)
+                for _type, enabled in config.detect_type.items()
+            },
+        )
+
+    def _create_get_ai_config_request(self, channel: int):
+        return commands.GetAiConfigRequest(channel_id=channel)
+
+    def _get_ai_config(self, command: ai_commands.GetAiConfigRequest):
+        return commands.GetAiConfigResponse(
+            channel_id=command.channel_id, config=self._channel(command).ai_config
+        )
+
+    def _create_set_ai_config(self, channel: int, config: Config):
+        return commands.SetAiConfigRequest(
+            channel_id=channel,
+            detect_type=dict(config.detect_type),
+            ai_track=config.ai_track,
+            track_type=dict(config.track_type),
+        )
+
+    def _set_ai_config(self, command: ai_commands.SetAiConfigRequest):
+        self._channel(command).ai_config = Value(
+            detect_type=command.detect_type,
+            ai_track=command.ai_track,
+            track_type=command.track_type,
+        )
+        return self._ok(command)
+
+    # Alarm
+
+    def _create_get_md_state(self, channel: int):
+        return commands.GetMotionStateRequest(channel_id=channel)
+
+    def _get_md_state(self, command: alarm_commands.GetMotionStateRequest):
+        return commands.GetMostionStateResponse(
+            channel_id=command.channel_id, state=self._channel(command).motion
+        )
+
+    def set_motion(self, state: bool, channel: int = 0):
+        """Set the motion state reported for a channel"""
+        self._channels[channel].motion = state
+
+    def add_recordings(self, channel: int, recordings: Iterable[Recording]):
+        """Add recordings to a channel inventory"""
+        self._recordings[channel] = sorted([*self._recordings.get(channel, []), *recordings])
+
+
+__all__: Sequence[str] = ("FakeDevice", "Recording", "recording_schedule")
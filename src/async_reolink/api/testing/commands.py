@@ -0,0 +1,285 @@
+"""Concrete commands for the in memory device"""
+
+# mixin packages must load before their command modules
+from .. import ai as _, alarm as _, encoding as _, led as _, network as _  # noqa
+from .. import ptz as _, record as _, security as _, system as _  # noqa
+
+from ..commands import CommandErrorResponse, ResponseKind, register_response_kind
+from ..commands import ai, alarm, encoding, led, network, ptz, record, security, system
+
+from .typings import Value
+
+# pylint: disable=too-few-public-methods
+
+
+@register_response_kind(ResponseKind.ERROR)
+class ErrorResponse(Value, CommandErrorResponse):
+    """Command Error Response"""
+
+
+@register_response_kind(ResponseKind.CODE)
+class CodeResponse(Value):
+    """Command Response Code"""
+
+    response_code: int
+
+
+class GetAiStateRequest(Value, ai.GetAiStateRequest):
+    """Get AI State"""
+
+
+class GetAiStateResponse(Value, ai.GetAiStateResponse):
+    """Get AI State Response"""
+
+
+class GetAiConfigRequest(Value, ai.GetAiConfigRequest):
+    """Get AI Configuration"""
+
+
+class GetAiConfigResponse(Value, ai.GetAiConfigResponse):
+    """Get AI Configuration Response"""
+
+
+class SetAiConfigRequest(Value, ai.SetAiConfigRequest):
+    """Set AI Configuration"""
+
+
+class GetMotionStateRequest(Value, alarm.GetMotionStateRequest):
+    """Get Motion State Request"""
+
+
+class GetMostionStateResponse(Value, alarm.GetMostionStateResponse):
+    """Get Mostion State Response"""
+
+
+class GetEncodingRequest(Value, encoding.GetEncodingRequest):
+    """Get Encoding"""
+
+
+class GetEncodingResponse(Value, encoding.GetEncodingResponse):
+    """Get Encoding Response"""
+
+
+class GetIrLightsRequest(Value, led.GetIrLightsRequest):
+    """Get IR Lights"""
+
+
+class GetIrLightsResponse(Value, led.GetIrLightsResponse):
+    """Get IR Lights Response"""
+
+
+class SetIrLightsRequest(Value, led.SetIrLightsRequest):
+    """Set Ir Lights"""
+
+
+class GetPowerLedRequest(Value, led.GetPowerLedRequest):
+    """Get Power Led"""
+
+
+class GetPowerLedResponse(Value, led.GetPowerLedResponse):
+    """Get Power Led Response"""
+
+
+class SetPowerLedRequest(Value, led.SetPowerLedRequest):
+    """Set Power Led"""
+
+
+class GetWhiteLedRequest(Value, led.GetWhiteLedRequest):
+    """Get White Led"""
+
+
+class GetWhiteLedResponse(Value, led.GetWhiteLedResponse):
+    """Get White Led Response"""
+
+
+class SetWhiteLedRequest(Value, led.SetWhiteLedRequest):
+    """Set White Led"""
+
+
+class GetLocalLinkRequest(Value, network.GetLocalLinkRequest):
+    """Get Local Link Request"""
+
+
+class GetLocalLinkResponse(Value, network.GetLocalLinkResponse):
+    """Get Local Link Response"""
+
+
+class GetChannelStatusRequest(Value, network.GetChannelStatusRequest):
+    """Get Channel Status Request"""
+
+
+class GetChannelStatusResponse(Value, network.GetChannelStatusResponse):
+    """Get Channel Status Response"""
+
+
+class GetNetworkPortsRequest(Value, network.GetNetworkPortsRequest):
+    """Get Network Ports Request"""
+
+
+class GetNetworkPortsResponse(Value, network.GetNetworkPortsResponse):
+    """Get Network Ports Response"""
+
+
+class GetRTSPUrlsRequest(Value, network.GetRTSPUrlsRequest):
+    """Get RTSP URls Request"""
+
+
+class GetRTSPUrlsResponse(Value, network.GetRTSPUrlsResponse):
+    """Get RTSP Urls Repsonse"""
+
+
+class GetP2PRequest(Value, network.GetP2PRequest):
+    """Get P2P Info Request"""
+
+
+class GetP2PResponse(Value, network.GetP2PResponse):
+    """Get P2P Info Response"""
+
+
+class GetWifiInfoRequest(Value, network.GetWifiInfoRequest):
+    """Get Wifi Info Request"""
+
+
+class GetWifiInfoResponse(Value, network.GetWifiInfoResponse):
+    """Get Wifi Info Response"""
+
+
+class GetWifiSignalRequest(Value, network.GetWifiSignalRequest):
+    """Get Wifi Signal Strength Request"""
+
+
+class GetWifiSignalResponse(Value, network.GetWifiSignalResponse):
+    """Get Wifi Signal Stength Response"""
+
+
+class GetPresetRequest(Value, ptz.GetPresetRequest):
+    """Get Presets Request"""
+
+
+class GetPresetResponse(Value, ptz.GetPresetResponse):
+    """Get Presets Response"""
+
+
+class SetPresetRequest(Value, ptz.SetPresetRequest):
+    """Set Preset Request"""
+
+
+class GetPatrolRequest(Value, ptz.GetPatrolRequest):
+    """Get Patrol"""
+
+
+class GetPatrolResponse(Value, ptz.GetPatrolResponse):
+    """Get Patrol Response"""
+
+
+class SetPatrolRequest(Value, ptz.SetPatrolRequest):
+    """Set  Patrol"""
+
+
+class SetControlRequest(Value, ptz.SetControlRequest):
+    """PTZ Control"""
+
+
+class GetTatternRequest(Value, ptz.GetTatternRequest):
+    """Get Tattern"""
+
+
+class GetTatternResponse(Value, ptz.GetTatternResponse):
+    """Get Tattern Response"""
+
+
+class SetTatternRequest(Value, ptz.SetTatternRequest):
+    """Set PTZ Tattern"""
+
+
+class GetAutoFocusRequest(Value, ptz.GetAutoFocusRequest):
+    """Get PTZ AutoFocus"""
+
+
+class GetAutoFocusResponse(Value, ptz.GetAutoFocusResponse):
+    """Get PTZ Presets Response"""
+
+
+class SetAutoFocusRequest(Value, ptz.SetAutoFocusRequest):
+    """Set PTZ Preset"""
+
+
+class GetZoomFocusRequest(Value, ptz.GetZoomFocusRequest):
+    """Get Zoom and Focus"""
+
+
+class GetZoomFocusResponse(Value, ptz.GetZoomFocusResponse):
+    """Get Zoom/Focus Response"""
+
+
+class SetZoomFocusRequest(Value, ptz.SetZoomFocusRequest):
+    """Set Zoom or Focus"""
+
+
+class GetSnapshotRequest(Value, record.GetSnapshotRequest):
+    """Get Snapshot Request"""
+
+
+class SearchRecordingsRequest(Value, record.SearchRecordingsRequest):
+    """Search Recordings Request"""
+
+
+class SearchRecordingsResponse(Value, record.SearchRecordingsResponse):
+    """Search Recordings Response"""
+
+
+class LoginRequest(Value, security.LoginRequest):
+    """Login Request"""
+
+
+class LoginResponse(Value, security.LoginResponse):
+    """Login Response"""
+
+
+class LogoutRequest(Value, security.LogoutRequest):
+    """Logout Request"""
+
+
+class GetUserRequest(Value, security.GetUserRequest):
+    """Get User(s) Request"""
+
+
+class GetUserResponse(Value, security.GetUserResponse):
+    """Get User(s) Response"""
+
+
+class GetAbilitiesRequest(Value, system.GetAbilitiesRequest):
+    """Get Capabilities"""
+
+
+class GetAbilitiesResponse(Value, system.GetAbilitiesResponse):
+    """Get Capabilities Response"""
+
+
+class GetDeviceInfoRequest(Value, system.GetDeviceInfoRequest):
+    """Get Device Info"""
+
+
+class GetDeviceInfoResponse(Value, system.GetDeviceInfoResponse):
+    """Get Device Info Response"""
+
+
+class GetTimeRequest(Value, system.GetTimeRequest):
+    """Get Time"""
+
+
+class GetTimeResponse(Value, system.GetTimeResponse):
+    """Get Time Response"""
+
+
+class RebootRequest(Value, system.RebootRequest):
+    """Reboot Request"""
+
+
+class GetHddInfoRequest(Value, system.GetHddInfoRequest):
+    """Get HDD Info Request"""
+
+
+class GetHddInfoResponse(Value, system.GetHddInfoResponse):
+    """Get HDD Info Response"""
+
@@ -0,0 +1,143 @@
+"""Concrete typings for the in memory device"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from enum import Enum
+from functools import partial
+from typing import Any, Mapping, get_args, get_origin, get_type_hints
+
+from ..lazy import LazyMapping
+
+from ..system import capabilities
+from ..system.capabilities import Capabilities, ChannelCapabilities, Permissions
+
+from ..system.typings import DaylightSavingsTimeInfo, TimeInfo
+
+from ..record.typings import SearchStatus
+
+from ..typings import DateTimeValue
+
+DEFAULT_PERMISSIONS = Permissions.READ | Permissions.WRITE
+
+
+class Value:
+    """Plain attribute value"""
+
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Capability(Value):
+    """Capability value"""
+
+    value: Any
+    permissions: Permissions
+
+
+class DateTime(Value, DateTimeValue):
+    """Date Time value"""
+
+    @classmethod
+    def from_datetime(cls, value: datetime):
+        """create from datetime"""
+        return cls(
+            year=value.year,
+            month=value.month,
+            day=value.day,
+            hour=value.hour,
+            minute=value.minute,
+            second=value.second,
+        )
+
+
+class Time(Value, TimeInfo):
+    """Device Time Info"""
+
+
+class DstTime(Value, DaylightSavingsTimeInfo.TimeInfo):
+    """Daylight Savings Time point"""
+
+
+class Status(Value, SearchStatus):
+    """Recording Search Status"""
+
+    def __iter__(self):
+        return (date(self.year, self.month, day) for day in self.days)
+
+
+def _default(value_type: type):
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return next(iter(value_type))
+    return True
+
+
+def _capability_type(cls: type):
+    for base in getattr(cls, "__orig_bases__", ()):
+        if get_origin(base) is capabilities.Capability:
+            return get_args(base)[0]
+    return None
+
+
+def build_tree(protocol: type, overrides: Mapping[str, Any] | None = None, *, _path: str = ""):
+    """Build a naive object tree for a capabilities protocol
+
+    Every capability is enabled (or its first enum member) with read/write
+    permissions unless overridden by dotted path, e.g. `{"ptz.type": PTZType.PT}`.
+    """
+
+    overrides = overrides or {}
+    node = Value()
+    if (value_type := _capability_type(protocol)) is not None:
+        node = Capability(
+            value=overrides.get(_path.rstrip("."), _default(value_type)),
+            permissions=DEFAULT_PERMISSIONS,
+        )
+    for name, hint in get_type_hints(protocol).items():
+        if name in ("value", "permissions"):
+            continue
+        path = _path + name
+        if get_origin(hint) is capabilities.Capability:
+            (value_type,) = get_args(hint)
+            child = Capability(
+                value=overrides.get(path, _default(value_type)),
+                permissions=DEFAULT_PERMISSIONS,
+            )
+        elif isinstance(hint, type):
+            child = build_tree(hint, overrides, _path=path + ".")
+        else:
+            continue
+        setattr(node, name, child)
+    return node
+
+
+def build_capabilities(
+    channels: int = 1,
+    overrides: Mapping[str, Any] | None = None,
+    channel_overrides: Mapping[str, Any] | None = None,
+    *,
+    lazy: bool = False,
+) -> Capabilities:
+    """Build a device capability tree with the given channel count
+
+    With `lazy` each channel tree is built on first access, like an
+    implementation decoding the per channel abilities of the response only
+    for the channels read.
+    """
+
+    tree = build_tree(Capabilities, overrides)
+    if lazy:
+        tree.channels = LazyMapping(
+            {channel: channel_overrides for channel in range(channels)},
+            partial(build_tree, ChannelCapabilities),
+        )
+    else:
+        tree.channels = {
+            channel: build_tree(ChannelCapabilities, channel_overrides)
+            for channel in range(channels)
+        }
+    return tree
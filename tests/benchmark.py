@@ -0,0 +1,127 @@
+""" benchmark helpers
+
+Benchmarks only run when REOLINK_BENCH is set. Timings are divided by the
+time of a fixed reference workload measured in the same run, so the
+baseline in `benchmarks.json` holds machine independent ratios; memory is
+compared in bytes. A benchmark worse than its baseline by more than the
+tolerance fails, the baseline file is never written by the tests.
+
+REOLINK_BENCH: set to run the benchmarks
+REOLINK_BENCH_TOLERANCE: allowed slowdown as a fraction (default 0.5)
+REOLINK_BENCH_OUTPUT: file to write the measured ratios to, for updating
+    the baseline by hand
+"""
+
+import gc
+import json
+import os
+import tracemalloc
+from functools import cache
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable
+
+import pytest
+
+BASELINE = Path(__file__).with_name("benchmarks.json")
+ENABLED = bool(os.environ.get("REOLINK_BENCH"))
+TOLERANCE = float(os.environ.get("REOLINK_BENCH_TOLERANCE", "0.5"))
+OUTPUT = os.environ.get("REOLINK_BENCH_OUTPUT")
+
+REPEAT = 5
+
+benchmark = pytest.mark.skipif(not ENABLED, reason="set REOLINK_BENCH to run")
+
+
+@cache
+def _baseline():
+    if not BASELINE.exists():
+        return {}
+    with BASELINE.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _record(name: str, value: float):
+    if not OUTPUT:
+        return
+    path = Path(OUTPUT)
+    results = {}
+    if path.exists():
+        with path.open(encoding="utf-8") as file:
+            results = json.load(file)
+    results[name] = float(f"{value:.4g}")
+    with path.open("w", encoding="utf-8") as file:
+        json.dump(dict(sorted(results.items())), file, indent=2)
+        file.write("\n")
+
+
+def measure(func: Callable[[], object], number: int):
+    """best time per call in nanoseconds"""
+
+    best = None
+    for _ in range(REPEAT):
+        start = perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = (perf_counter_ns() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def measure_async(func: Callable[[], object], number: int):
+    """best time per awaited call in nanoseconds"""
+
+    best = None
+    for _ in range(REPEAT):
+        start = perf_counter_ns()
+        for _ in range(number):
+            await func()
+        elapsed = (perf_counter_ns() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_memory(func: Callable[[], object]):
+    """bytes still allocated by the result of a call"""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def _reference_workload():
+    values = {}
+    for index in range(1000):
+        values[index & 63] = (index, str(index))
+    return values
+
+
+@cache
+def reference():
+    """nanoseconds of the reference workload on this machine"""
+    return measure(_reference_workload, 200)
+
+
+def check(name: str, value: float, unit: str = "ns"):
+    """compare a measurement against the baseline
+
+    Timings (unit "ns") are compared as ratios to the reference workload.
+    """
+
+    if unit == "ns":
+        value = value / reference()
+        unit = "x"
+    _record(name, value)
+    if (expected := _baseline().get(name)) is None:
+        return
+    limit = expected * (1 + TOLERANCE)
+    assert (
+        value <= limit
+    ), f"{name}: {value:.3f}{unit} per op, baseline {expected:.3f}{unit} (limit {limit:.3f}{unit})"
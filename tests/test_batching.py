@@ -0,0 +1,113 @@
+""" command batching """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.batching import CommandHandle, resolve
+from async_reolink.api.errors import ReolinkResponseError
+
+
+def test_coalesce_window():
+    """concurrent commands within the window share one request"""
+
+    async def run():
+        device = FakeDevice(channels=4, coalesce_window=0.01, single_flight=False)
+        await device.connect()
+        results = await asyncio.gather(
+            *(device.get_ir_lights(channel) for channel in range(4))
+        )
+        return device, results
+
+    device, results = asyncio.run(run())
+    assert len(results) == 4
+    assert device.requests == 1
+    assert device.commands == 4
+
+
+def test_no_coalescing_by_default():
+    """without a window every call is its own request"""
+
+    async def run():
+        device = FakeDevice(channels=4, single_flight=False)
+        await device.connect()
+        await asyncio.gather(*(device.get_ir_lights(channel) for channel in range(4)))
+        return device
+
+    device = asyncio.run(run())
+    assert device.requests == 4
+
+
+def test_submit_handles():
+    """each submitted command gets its own response"""
+
+    async def run():
+        device = FakeDevice(channels=3)
+        await device.connect()
+        handles = device.submit(
+            device._create_get_ir_lights_request(channel) for channel in range(3)
+        )
+        return [(await handle).channel_id for handle in handles], device
+
+    channels, device = asyncio.run(run())
+    assert channels == [0, 1, 2]
+    assert device.requests == 1
+
+
+def test_resolve_missing_and_bytes():
+    """byte chunks join into one result, unanswered commands fail"""
+
+    async def run():
+        device = FakeDevice()
+        handles = [
+            CommandHandle(device._create_get_snapshot_request(0)),
+            CommandHandle(device._create_get_ir_lights_request(0)),
+        ]
+
+        async def responses():
+            yield b"ab"
+            yield b"cd"
+
+        await resolve(responses(), handles, lambda commands, response, position: position)
+        return handles
+
+    handles = asyncio.run(run())
+    assert handles[0].result() == b"abcd"
+    with pytest.raises(ReolinkResponseError):
+        handles[1].result()
+
+
+def test_batched_context():
+    """mixin calls in a batch context are sent in one round trip"""
+
+    async def run():
+        device = FakeDevice(channels=2)
+        await device.connect()
+        requests = device.requests
+        async with device.batched() as batch:
+            lights = batch.get_ir_lights(0)
+            led = batch.get_power_led(1)
+            info = batch.get_device_info()
+        return device.requests - requests, lights.result(), led.result(), info.result()
+
+    requests, lights, led, info = asyncio.run(run())
+    assert requests == 1
+    assert lights is not None and led is not None
+    assert info.model == "FakeNVR"
+
+
+def test_batched_context_error():
+    """an error inside the context cancels the pending calls"""
+
+    async def run():
+        device = FakeDevice()
+        await device.connect()
+        with pytest.raises(RuntimeError):
+            async with device.batched() as batch:
+                pending = batch.get_ir_lights(0)
+                raise RuntimeError()
+        await asyncio.sleep(0)
+        return pending
+
+    assert asyncio.run(run()).cancelled()
@@ -0,0 +1,263 @@
+""" hot path benchmarks """
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+from async_reolink.api.testing import FakeDevice, commands, recording_schedule
+from async_reolink.api.testing.typings import (
+    DateTime,
+    DstTime,
+    Time,
+    Value,
+    build_capabilities,
+)
+from async_reolink.api.commands import is_code, is_error
+from async_reolink.api.commands.system import _timezone
+from async_reolink.api.observers import HistogramObserver
+from async_reolink.api.record.index import RecordingIndex
+from async_reolink.api.system.capabilities import PTZType
+from async_reolink.api.system.packed import pack_capabilities
+from async_reolink.api.typings import WeekDays
+
+from .benchmark import benchmark, check, measure, measure_async, measure_memory
+
+pytestmark = benchmark
+
+
+def test_dispatch_error_check():
+    """error routing for a regular response"""
+
+    response = commands.GetIrLightsResponse(channel_id=0, state=None)
+    check(
+        "dispatch_error_check",
+        measure(lambda: is_error(response), 20000),
+    )
+
+
+def test_dispatch_response_code():
+    """response code routing"""
+
+    response = commands.CodeResponse(response_code=0)
+    check(
+        "dispatch_response_code",
+        measure(lambda: is_code(response), 20000),
+    )
+
+
+def test_timezone_utcoffset():
+    """device timezone offset lookups across a year"""
+
+    tzinfo = _timezone.get(
+        Value(
+            enabled=True,
+            hour_offset=1,
+            start=DstTime(month=3, week=2, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+            end=DstTime(month=11, week=1, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+        ),
+        Time(timezone_offset=-18000),
+    )
+    start = datetime(2022, 1, 1)
+    times = [start + timedelta(hours=7 * i) for i in range(1000)]
+
+    def run():
+        for value in times:
+            tzinfo.utcoffset(value)
+
+    check("timezone_utcoffset", measure(run, 20) / len(times))
+
+
+def test_timezone_timestamps():
+    """bulk conversion of device local date times to timestamps"""
+
+    tzinfo = _timezone.get(
+        Value(
+            enabled=True,
+            hour_offset=1,
+            start=DstTime(month=3, week=2, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+            end=DstTime(month=11, week=1, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+        ),
+        Time(timezone_offset=-18000),
+    )
+    start = datetime(2022, 1, 1)
+    values = [DateTime.from_datetime(start + timedelta(minutes=5 * i)) for i in range(1000)]
+
+    check("timezone_timestamps", measure(lambda: tzinfo.timestamps(values), 20) / len(values))
+
+
+def test_capabilities_lookup():
+    """nested capability attribute lookups"""
+
+    capabilities = build_capabilities(16)
+
+    def run():
+        for channel in range(16):
+            _ = capabilities.channels[channel].ptz.type.value
+            _ = capabilities.channels[channel].power_led.permissions
+        _ = capabilities.http.value
+
+    check("capabilities_lookup", measure(run, 2000) / 16)
+
+
+def _nvr_capabilities(channels: int = 36):
+    capabilities = build_capabilities(channels)
+    for channel, value in capabilities.channels.items():
+        value.ptz.type.value = PTZType.PTZ if channel % 4 else PTZType.AF
+        value.floodlight.value = None
+    return capabilities
+
+
+def test_capabilities_lookup_packed():
+    """nested capability attribute lookups on packed capabilities"""
+
+    capabilities = pack_capabilities(build_capabilities(16))
+
+    def run():
+        for channel in range(16):
+            _ = capabilities.channels[channel].ptz.type.value
+            _ = capabilities.channels[channel].power_led.permissions
+        _ = capabilities.http.value
+
+    check("capabilities_lookup_packed", measure(run, 2000) / 16)
+
+
+def test_capabilities_memory():
+    """retained capability memory per channel of 36 channel NVRs"""
+
+    devices = 10
+    naive = measure_memory(lambda: [_nvr_capabilities() for _ in range(devices)])
+    packed = measure_memory(
+        lambda: [pack_capabilities(_nvr_capabilities()) for _ in range(devices)]
+    )
+    assert packed * 10 < naive, f"packed {packed} bytes, naive {naive} bytes"
+    check("capabilities_memory_naive", naive / devices / 36, "B")
+    check("capabilities_memory_packed", packed / devices / 36, "B")
+
+
+def test_get_snap():
+    """snapshot assembly from streamed chunks"""
+
+    async def run():
+        device = FakeDevice(snapshot_size=1024 * 1024, chunk_size=16 * 1024)
+        await device.connect()
+        return await measure_async(lambda: device.get_snap(0), 50)
+
+    check("get_snap", asyncio.run(run()))
+
+
+def test_get_snap_into():
+    """snapshot streamed into a reused buffer"""
+
+    async def run():
+        device = FakeDevice(snapshot_size=1024 * 1024, chunk_size=16 * 1024)
+        await device.connect()
+        buffer = bytearray(2 * 1024 * 1024)
+        return await measure_async(lambda: device.get_snap_into(buffer), 50)
+
+    check("get_snap_into", asyncio.run(run()))
+
+
+def test_search_first_file():
+    """month long search reading only the first file"""
+
+    async def run():
+        device = FakeDevice()
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 30, per_day=96))
+        await device.connect()
+        start = datetime(2022, 1, 1)
+        end = datetime(2022, 1, 31)
+
+        async def search():
+            files = await device.search(0, start_time=start, end_time=end)
+            return files[0]
+
+        return await measure_async(search, 20)
+
+    check("search_first_file", asyncio.run(run()))
+
+
+def test_iter_search_first_file():
+    """month long chunked search reading only the first file"""
+
+    async def run():
+        device = FakeDevice()
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 30, per_day=96))
+        await device.connect()
+        start = datetime(2022, 1, 1)
+        end = datetime(2022, 1, 31)
+
+        async def search():
+            files = device.iter_search(0, start_time=start, end_time=end)
+            try:
+                return await files.__anext__()
+            finally:
+                await files.aclose()
+
+        return await measure_async(search, 20)
+
+    check("iter_search_first_file", asyncio.run(run()))
+
+
+def test_indexed_search():
+    """day search answered from the recording index"""
+
+    async def run():
+        device = FakeDevice(recording_index=RecordingIndex())
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 30, per_day=96))
+        await device.connect()
+        await device.sync_recordings(
+            0, start_time=datetime(2022, 1, 1), end_time=datetime(2022, 1, 31)
+        )
+        start = datetime(2022, 1, 15)
+        end = datetime(2022, 1, 15, 23, 59, 59)
+
+        async def search():
+            return await device.search(0, start_time=start, end_time=end)
+
+        return await measure_async(search, 20)
+
+    check("indexed_search", asyncio.run(run()))
+
+
+def test_batch():
+    """end to end batch execution of 32 reads"""
+
+    async def run():
+        device = FakeDevice(channels=32)
+        await device.connect()
+        requests = [device._create_get_ir_lights_request(channel) for channel in range(32)]
+
+        async def batch():
+            async for _ in device.batch(requests):
+                pass
+
+        return await measure_async(batch, 200)
+
+    check("batch", asyncio.run(run()) / 32)
+
+
+def test_batch_observed():
+    """end to end batch execution of 32 reads with a histogram observer"""
+
+    async def run():
+        device = FakeDevice(channels=32, observers=[HistogramObserver()])
+        await device.connect()
+        requests = [device._create_get_ir_lights_request(channel) for channel in range(32)]
+
+        async def batch():
+            async for _ in device.batch(requests):
+                pass
+
+        return await measure_async(batch, 200)
+
+    check("batch_observed", asyncio.run(run()) / 32)
+
+
+def test_command():
+    """single command method round trip"""
+
+    async def run():
+        device = FakeDevice()
+        await device.connect()
+        return await measure_async(lambda: device.get_ir_lights(0), 2000)
+
+    check("command", asyncio.run(run()))
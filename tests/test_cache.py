@@ -0,0 +1,82 @@
+""" response cache """
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.cache import ResponseCache
+
+
+def test_ttl_expiry():
+    """values expire after their time to live"""
+
+    cache = ResponseCache({"get_ir_lights": 10})
+    with patch("async_reolink.api.cache.monotonic", return_value=100):
+        cache.put("get_ir_lights", 0, "value")
+        assert cache.get("get_ir_lights", 0) == "value"
+    with patch("async_reolink.api.cache.monotonic", return_value=110):
+        assert cache.get("get_ir_lights", 0) is None
+    assert not len(cache)
+
+
+def test_uncached_names():
+    """names without a time to live are not stored"""
+
+    cache = ResponseCache({"get_ir_lights": 10})
+    cache.put("get_power_led", 0, "value")
+    assert cache.get("get_power_led", 0) is None
+    cache.set_ttl("get_ir_lights", None)
+    cache.put("get_ir_lights", 0, "value")
+    assert not len(cache)
+
+
+def test_evict():
+    """eviction drops the channel and device wide values, and stale puts"""
+
+    cache = ResponseCache({"get": 10})
+    cache.put("get", 0, 0)
+    cache.put("get", 1, 1)
+    cache.put("get", None, None)
+    epoch = cache.epoch
+    cache.evict("get", 0)
+    assert cache.get("get", 0, "missing") == "missing"
+    assert cache.get("get", None, "missing") == "missing"
+    assert cache.get("get", 1) == 1
+    cache.put("get", 0, 0, epoch)
+    assert cache.get("get", 0, "missing") == "missing"
+    cache.evict("get")
+    assert not len(cache)
+
+
+def test_bound_to_one_connection():
+    """a cache in use by one connection cannot serve another device"""
+
+    cache = ResponseCache()
+    device = FakeDevice(response_cache=cache)
+    with pytest.raises(ValueError):
+        FakeDevice(response_cache=cache)
+    other = FakeDevice()
+    with pytest.raises(ValueError):
+        other.response_cache = cache
+    assert other.response_cache is None
+    assert device.response_cache is cache
+
+
+def test_rebinding_clears():
+    """moving a cache to another connection drops the cached values"""
+
+    async def run():
+        cache = ResponseCache()
+        device = FakeDevice(response_cache=cache)
+        await device.connect()
+        await device.get_ir_lights(0)
+        cached = len(cache)
+        device.response_cache = None
+        other = FakeDevice(response_cache=cache)
+        await other.connect()
+        await other.get_ir_lights(0)
+        return cached, other.commands
+
+    assert asyncio.run(run()) == (1, 1)
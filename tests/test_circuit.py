@@ -0,0 +1,125 @@
+""" circuit breaker """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.circuit import CircuitBreaker, CircuitState
+from async_reolink.api.commands.system import GetTimeRequest
+from async_reolink.api.errors import (
+    ErrorCodes,
+    ReolinkCircuitOpenError,
+    ReolinkConnectionError,
+)
+
+
+class RecordingDevice(FakeDevice):
+    """keeps the type of every command received"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.received: list[type] = []
+        self.reachable = True
+
+    async def _execute(self, *args):
+        self.received.extend(type(command) for command in args)
+        if not self.reachable:
+            raise ReolinkConnectionError("unreachable")
+        async for response in super()._execute(*args):
+            yield response
+
+
+def _breaker():
+    return CircuitBreaker(failure_threshold=2, reset_timeout=0.01)
+
+
+def test_opens_after_failures():
+    """consecutive connection failures open the circuit"""
+
+    async def run():
+        device = RecordingDevice(circuit_breaker=_breaker())
+        await device.connect()
+        device.reachable = False
+        for _ in range(2):
+            with pytest.raises(ReolinkConnectionError):
+                await device.get_ir_lights(0)
+        sent = len(device.received)
+        with pytest.raises(ReolinkCircuitOpenError):
+            await device.get_ir_lights(0)
+        return device, sent
+
+    device, sent = asyncio.run(run())
+    assert device.circuit_state == CircuitState.OPEN
+    assert len(device.received) == sent
+
+
+def test_half_open_sends_probe():
+    """the half open trial is the probe request, then the command is sent"""
+
+    async def run():
+        device = RecordingDevice(circuit_breaker=_breaker())
+        await device.connect()
+        device.reachable = False
+        for _ in range(2):
+            with pytest.raises(ReolinkConnectionError):
+                await device.get_ir_lights(0)
+        device.reachable = True
+        await asyncio.sleep(0.02)
+        device.received.clear()
+        lights = await device.get_ir_lights(0)
+        return device, lights
+
+    device, lights = asyncio.run(run())
+    assert lights is not None
+    assert issubclass(device.received[0], GetTimeRequest)
+    assert len(device.received) == 2
+    assert device.circuit_state == CircuitState.CLOSED
+
+
+def test_failed_probe_reopens():
+    """a failed probe keeps the command from being sent"""
+
+    async def run():
+        device = RecordingDevice(circuit_breaker=_breaker())
+        await device.connect()
+        device.reachable = False
+        for _ in range(2):
+            with pytest.raises(ReolinkConnectionError):
+                await device.get_ir_lights(0)
+        await asyncio.sleep(0.02)
+        device.received.clear()
+        with pytest.raises(ReolinkCircuitOpenError):
+            await device.get_ir_lights(0)
+        return device
+
+    device = asyncio.run(run())
+    assert len(device.received) == 1
+    assert issubclass(device.received[0], GetTimeRequest)
+    assert device.circuit_state == CircuitState.OPEN
+
+
+class AnsweringDevice(RecordingDevice):
+    """answers the GetTime probe with an error code"""
+
+    def _get_time(self, _command):
+        return self._error(ErrorCodes.ABILITY)
+
+
+def test_error_answer_closes():
+    """a probe answered with an error code still shows the device is reachable"""
+
+    async def run():
+        device = AnsweringDevice(circuit_breaker=_breaker(), command_gate=False)
+        await device.connect()
+        device.reachable = False
+        for _ in range(2):
+            with pytest.raises(ReolinkConnectionError):
+                await device.get_ir_lights(0)
+        device.reachable = True
+        await asyncio.sleep(0.02)
+        return device, await device.get_ir_lights(0)
+
+    device, lights = asyncio.run(run())
+    assert lights is not None
+    assert device.circuit_state == CircuitState.CLOSED
@@ -0,0 +1,102 @@
+""" device clock model """
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.clock import DeviceClock
+
+EPOCH = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+class Monotonic:
+    """settable monotonic clock"""
+
+    def __init__(self, now: float = 1000) -> None:
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(name="monotonic")
+def _monotonic():
+    clock = Monotonic()
+    with patch("async_reolink.api.clock.monotonic", clock):
+        yield clock
+
+
+def test_unsynced():
+    """an unsynced clock is stale and has no time"""
+
+    clock = DeviceClock()
+    assert clock.stale and not clock.synced
+    assert clock.now() is None and clock.timestamp() is None
+
+
+def test_sync(monotonic):
+    """device time advances with the local clock from the request midpoint"""
+
+    clock = DeviceClock()
+    clock.sync(EPOCH.replace(microsecond=1), 999, 1001)
+    assert clock.uncertainty == 1
+    monotonic.now = 1010
+    assert clock.now() == EPOCH + timedelta(seconds=10, microseconds=1)
+    assert clock.tzinfo is timezone.utc
+
+
+def test_whole_seconds(monotonic):
+    """whole second times are taken as the middle of the second"""
+
+    clock = DeviceClock()
+    clock.sync(EPOCH, 1000, 1000)
+    assert clock.uncertainty == 0.5
+    assert clock.timestamp() == EPOCH.timestamp() + 0.5
+
+
+def test_stale_after_interval(monotonic):
+    """the clock goes stale after resync_after seconds, or when suspect"""
+
+    clock = DeviceClock(60)
+    clock.sync(EPOCH, 1000, 1000)
+    assert not clock.stale
+    monotonic.now = 1060
+    assert clock.stale
+    clock.sync(EPOCH + timedelta(seconds=60), 1060, 1060)
+    clock.suspect()
+    assert clock.stale
+    clock.reset()
+    assert not clock.synced and clock.resync_interval == 60
+
+
+def test_drift_shortens_interval(monotonic):
+    """disagreeing syncs halve the resync interval, agreeing ones restore it"""
+
+    clock = DeviceClock(3600, tolerance=1, min_resync_after=60)
+    clock.sync(EPOCH, 1000, 1000)
+    monotonic.now = 4600
+    clock.sync(EPOCH + timedelta(seconds=3610), 4600, 4600)
+    assert clock.resync_interval == 1800
+    assert clock.drift == pytest.approx(10 / 3600)
+    clock.sync(EPOCH + timedelta(seconds=3610), 4600, 4600)
+    assert clock.resync_interval == 3600
+
+
+def test_device_reads_time_once():
+    """device time is computed locally until the clock goes stale"""
+
+    async def run():
+        device = FakeDevice(timezone_offset=3600, clock=DeviceClock(60))
+        await device.connect()
+        first = await device._ensure_time()
+        requests = device.requests
+        second = await device._ensure_time()
+        return first, second, device.requests - requests
+
+    first, second, requests = asyncio.run(run())
+    assert requests == 0
+    assert second.utcoffset() == timedelta(hours=1)
+    assert timedelta(0) <= second - first < timedelta(seconds=2)
@@ -0,0 +1,112 @@
+""" declarative command methods """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.cache import ResponseCache
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.executor import command
+from async_reolink.api.led.typings import LightStates
+from async_reolink.api.testing.commands import CodeResponse, ErrorResponse
+
+
+class Response:
+    """channel value response"""
+
+    def __init__(self, channel_id: int, value: int) -> None:
+        self.channel_id = channel_id
+        self.value = value
+
+
+class Commands:
+    """answers every request with the queued responses"""
+
+    def __init__(self, *responses) -> None:
+        self.responses = responses
+        self.response_cache = None
+
+    async def _send(self, _request):
+        for response in self.responses:
+            yield response
+
+    @command(Response, "value", channel="channel", error="Get failed")
+    def get(self, channel: int = 0):
+        """channel value"""
+
+    @command(Response, "value", error="Get failed", default=lambda self: -1)
+    def get_default(self):
+        """any value"""
+
+    @command(error="Set failed")
+    def set(self, channel: int = 0):
+        """set a value"""
+
+
+def test_value_for_channel():
+    """the value of the response for the requested channel is returned"""
+
+    commands = Commands(Response(0, 10), Response(1, 11))
+    assert asyncio.run(commands.get(1)) == 11
+    assert asyncio.run(commands.get(channel=0)) == 10
+
+
+def test_missing_response():
+    """without a matching response the default is returned or error raised"""
+
+    commands = Commands(Response(1, 11))
+    with pytest.raises(ReolinkResponseError, match="Get failed"):
+        asyncio.run(commands.get(0))
+    assert asyncio.run(Commands().get_default()) == -1
+
+
+def test_codes_and_errors():
+    """response codes return True, error responses raise"""
+
+    assert asyncio.run(Commands(CodeResponse(response_code=0)).set()) is True
+    error = ErrorResponse(error_code=ErrorCodes.INTERNAL, details=None)
+    with pytest.raises(ReolinkResponseError) as info:
+        asyncio.run(Commands(error).set())
+    assert info.value.code == ErrorCodes.INTERNAL
+
+
+def test_missing_channel_argument():
+    """a channel name the factory does not take is rejected up front"""
+
+    with pytest.raises(TypeError):
+
+        @command(Response, channel="camera", error="Get failed")
+        def _get(self, channel: int = 0):
+            """channel value"""
+
+
+def test_cached_reads():
+    """cached reads are answered without a request until a setter evicts them"""
+
+    async def run():
+        device = FakeDevice(response_cache=ResponseCache())
+        await device.connect()
+        first = await device.get_ir_lights(0)
+        await device.get_ir_lights(0)
+        cached = device.commands
+        await device.set_ir_lights(LightStates.OFF, 0)
+        return first, cached, await device.get_ir_lights(0), device.commands
+
+    first, cached, second, commands = asyncio.run(run())
+    assert cached == 1
+    assert first != LightStates.OFF and second == LightStates.OFF
+    assert commands == 3
+
+
+def test_uncached_without_cache():
+    """without a response cache every read is sent"""
+
+    async def run():
+        device = FakeDevice()
+        await device.connect()
+        await device.get_ir_lights(0)
+        await device.get_ir_lights(0)
+        return device.commands
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,92 @@
+""" in memory reference device """
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice, recording_schedule
+from async_reolink.api.errors import ReolinkConnectionError, ReolinkResponseError
+from async_reolink.api.led.typings import LightStates
+
+
+def test_not_connected():
+    """commands fail before connecting"""
+
+    with pytest.raises(ReolinkConnectionError):
+        asyncio.run(FakeDevice().get_ir_lights(0))
+
+
+def test_login():
+    """only the configured credentials log in"""
+
+    async def run():
+        device = FakeDevice(username="user", password="secret")
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await device.login("user", "wrong")
+        return await device.login("user", "secret")
+
+    assert asyncio.run(run())
+
+
+def test_settings_round_trip():
+    """setters change the state read back by getters"""
+
+    async def run():
+        device = FakeDevice(channels=2)
+        await device.connect()
+        await device.set_ir_lights(LightStates.OFF, 1)
+        return await device.get_ir_lights(0), await device.get_ir_lights(1)
+
+    first, second = asyncio.run(run())
+    assert first != LightStates.OFF
+    assert second == LightStates.OFF
+
+
+def test_error_injection():
+    """error_rate answers commands with error_code"""
+
+    async def run():
+        device = FakeDevice(error_rate=1)
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await device.get_ir_lights(0)
+        return device
+
+    device = asyncio.run(run())
+    assert device.requests == 1
+
+
+def test_snapshot_size():
+    """snapshots are JPEG framed and streamed in chunks"""
+
+    async def run():
+        device = FakeDevice(snapshot_size=1000, chunk_size=300)
+        await device.connect()
+        return await device.get_snap(0)
+
+    image = asyncio.run(run())
+    assert len(image) == 1000
+    assert image[:2] == b"\xff\xd8" and image[-2:] == b"\xff\xd9"
+
+
+def test_recordings():
+    """searches return recordings overlapping the range, statuses the days"""
+
+    async def run():
+        device = FakeDevice()
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 3, per_day=4))
+        await device.connect()
+        files = await device.search(
+            0, start_time=datetime(2022, 1, 2), end_time=datetime(2022, 1, 2, 23, 59)
+        )
+        status = await device.search_status(
+            0, start_time=datetime(2022, 1, 1), end_time=datetime(2022, 1, 31)
+        )
+        return files, status
+
+    files, status = asyncio.run(run())
+    assert len(files) == 4
+    assert files[0].start.to_datetime() == datetime(2022, 1, 2)
+    assert list(status[0]) == [date(2022, 1, day) for day in (1, 2, 3)]
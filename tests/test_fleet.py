@@ -0,0 +1,97 @@
+""" device fleet """
+
+import asyncio
+from contextlib import aclosing
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import ReolinkConnectionError, ReolinkTimeoutError
+from async_reolink.api.fleet import Fleet
+
+
+async def _connected(count: int, **kwargs):
+    devices = []
+    for index in range(count):
+        device = FakeDevice(**kwargs)
+        await device.connect(f"device{index}")
+        devices.append(device)
+    return devices
+
+
+def test_run_collects_results_and_errors():
+    """every selected device yields a result, failures do not stop the others"""
+
+    async def run():
+        devices = await _connected(4)
+        await devices[0].disconnect()
+        fleet = Fleet(devices)
+        return [result async for result in fleet.run("get_device_info")]
+
+    results = asyncio.run(run())
+    assert len(results) == 4
+    failed = [result for result in results if not result.ok]
+    assert len(failed) == 1
+    assert isinstance(failed[0].error, ReolinkConnectionError)
+
+
+def test_run_concurrency_limit():
+    """no more than max_concurrency calls run at once"""
+
+    running = 0
+    peak = 0
+
+    async def call(device: FakeDevice):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return device.hostname
+
+    async def run():
+        fleet = Fleet(await _connected(10), max_concurrency=3)
+        return [result.result() async for result in fleet.run(call)]
+
+    assert len(asyncio.run(run())) == 10
+    assert peak == 3
+
+
+def test_run_selection_and_timeout():
+    """selectors limit the devices, slow devices time out"""
+
+    async def run():
+        devices = await _connected(3, latency=0.05)
+        fleet = Fleet(devices)
+        return [
+            result
+            async for result in fleet.run(
+                "get_device_info",
+                devices=lambda device: device.hostname != "device0",
+                timeout=0.001,
+            )
+        ]
+
+    results = asyncio.run(run())
+    assert {result.device.hostname for result in results} == {"device1", "device2"}
+    assert all(isinstance(result.error, ReolinkTimeoutError) for result in results)
+
+
+def test_early_stop_finishes_pending_calls():
+    """leaving the iteration waits for the cancelled calls to clean up"""
+
+    finished = []
+
+    async def call(device: FakeDevice):
+        try:
+            await asyncio.sleep(0 if device.hostname == "device0" else 1)
+        finally:
+            finished.append(device.hostname)
+
+    async def run():
+        fleet = Fleet(await _connected(4))
+        results = fleet.run(call)
+        async with aclosing(results):
+            async for _ in results:
+                break
+        return len(finished)
+
+    assert asyncio.run(run()) == 4
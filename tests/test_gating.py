@@ -0,0 +1,165 @@
+""" capability gating """
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.commands import is_error
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.gating import CommandGate
+from async_reolink.api.system.capabilities import ScheduleVersion
+
+SOURCE = Path(__file__).parent.parent / "src"
+
+
+def test_command_modules_import_alone():
+    """command modules declaring gates import in a fresh interpreter"""
+
+    subprocess.run(
+        [sys.executable, "-c", "import async_reolink.api.commands.network"],
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SOURCE)},
+    )
+
+
+def test_capability_gate():
+    """commands the capabilities rule out are answered without a request"""
+
+    async def run():
+        device = FakeDevice(channel_capabilities={"power_led": 0})
+        await device.connect()
+        await device._ensure_abilities()
+        requests = device.requests
+        with pytest.raises(ReolinkResponseError) as info:
+            await device.get_power_led(0)
+        return info.value.code, device.requests - requests
+
+    assert asyncio.run(run()) == (ErrorCodes.NOT_SUPPORTED, 0)
+
+
+def test_capability_accept():
+    """gates can accept capability values selectively"""
+
+    async def run():
+        device = FakeDevice(capabilities={"schedule_version": ScheduleVersion.BASIC})
+        await device.connect()
+        await device._ensure_abilities()
+        requests = device.requests
+        responses = [
+            response
+            async for response in device.batch(
+                [device._create_get_rtsp_urls_request(0)]
+            )
+        ]
+        return responses, device.requests - requests
+
+    (response,), requests = asyncio.run(run())
+    assert is_error(response)
+    assert requests == 0
+
+
+def test_learned_unsupported():
+    """commands the device refused as unsupported are not sent again"""
+
+    async def run():
+        device = FakeDevice(error_rate=1, error_code=ErrorCodes.NOT_SUPPORTED)
+        await device.connect()
+        for _ in range(2):
+            with pytest.raises(ReolinkResponseError):
+                await device.get_ir_lights(0)
+        return device.requests
+
+    assert asyncio.run(run()) == 1
+
+
+def test_ability_errors_are_not_learned():
+    """permission errors depend on the user and are sent again"""
+
+    async def run():
+        device = FakeDevice(error_rate=1, error_code=ErrorCodes.ABILITY)
+        await device.connect()
+        for _ in range(2):
+            with pytest.raises(ReolinkResponseError):
+                await device.get_ir_lights(0)
+        return device.requests
+
+    assert asyncio.run(run()) == 2
+
+
+def test_forget():
+    """forgotten failures are sent again"""
+
+    async def run():
+        gate = CommandGate()
+        device = FakeDevice(
+            command_gate=gate, error_rate=1, error_code=ErrorCodes.NOT_SUPPORTED
+        )
+        await device.connect()
+        for _ in range(2):
+            with pytest.raises(ReolinkResponseError):
+                await device.get_ir_lights(0)
+            gate.forget()
+        return device.requests
+
+    assert asyncio.run(run()) == 2
+
+
+class NoIrDevice(FakeDevice):
+    """refuses IR light reads as unsupported"""
+
+    def _get_ir_lights(self, _command):
+        return self._error(ErrorCodes.NOT_SUPPORTED)
+
+
+def test_learned_after_stream():
+    """an error after a stream is learned for its own command"""
+
+    async def run():
+        device = NoIrDevice(snapshot_size=40, chunk_size=20)
+        await device.connect()
+        commands = [
+            device._create_get_snapshot_request(0),
+            device._create_get_ir_lights_request(0),
+        ]
+        async for _ in device.batch(commands):
+            pass
+        requests = device.requests
+        image = await device.get_snap(0)
+        with pytest.raises(ReolinkResponseError):
+            await device.get_ir_lights(0)
+        return image, device.requests - requests
+
+    image, requests = asyncio.run(run())
+    assert len(image) == 40
+    assert requests == 1
+
+
+class NoRtspDevice(FakeDevice):
+    """refuses RTSP url reads with a code the gate does not learn"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.rtsp_requests = 0
+
+    def _get_rtsp_urls(self, _command):
+        self.rtsp_requests += 1
+        return self._error(ErrorCodes.INTERNAL)
+
+
+def test_rtsp_fallback_remembered():
+    """a refused RTSP url read falls back locally without asking again"""
+
+    async def run():
+        device = NoRtspDevice(command_gate=False)
+        await device.connect()
+        urls = [await device.get_rtsp_url(0) for _ in range(3)]
+        return urls, device.rtsp_requests
+
+    urls, requests = asyncio.run(run())
+    assert all(url.startswith("rtsp://") for url in urls)
+    assert requests == 1
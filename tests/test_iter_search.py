@@ -0,0 +1,142 @@
+""" windowed recording search """
+
+import asyncio
+from contextlib import aclosing
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice, recording_schedule
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+
+
+class LimitedDevice(FakeDevice):
+    """times out on searches longer than `limit`"""
+
+    def __init__(self, *args, limit: timedelta, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.limit = limit
+        self.searched: list[tuple[datetime, datetime]] = []
+
+    def _search_recordings(self, command):
+        start = command.search.start.to_datetime()
+        end = command.search.end.to_datetime()
+        self.searched.append((start, end))
+        if end - start > self.limit:
+            return self._error(ErrorCodes.TIMEOUT)
+        return super()._search_recordings(command)
+
+
+def _device(device_type=FakeDevice, **kwargs):
+    device = device_type(**kwargs)
+    device.add_recordings(
+        0,
+        [
+            *recording_schedule(date(2022, 1, 1), 3, per_day=4),
+            # spans midnight into the second day
+            (datetime(2022, 1, 1, 23, 50), datetime(2022, 1, 2, 0, 10)),
+        ],
+    )
+    return device
+
+
+async def _files(device: FakeDevice, **kwargs):
+    await device.connect()
+    return [
+        file
+        async for file in device.iter_search(
+            0,
+            start_time=datetime(2022, 1, 1),
+            end_time=datetime(2022, 1, 3, 23, 59, 59),
+            **kwargs,
+        )
+    ]
+
+
+def test_files_in_order():
+    """files of every window are yielded once, in time order"""
+
+    files = asyncio.run(_files(_device()))
+    starts = [file.start.to_datetime() for file in files]
+    assert len(files) == 13
+    assert starts == sorted(starts)
+    assert len({file.name for file in files}) == 13
+
+
+def test_window_size():
+    """the range is searched in window sized pieces"""
+
+    device = _device(LimitedDevice, limit=timedelta(days=1))
+    files = asyncio.run(_files(device, window=timedelta(hours=12)))
+    assert len(files) == 13
+    assert len(device.searched) == 6
+
+
+def test_timeouts_split_windows():
+    """windows the device times out on are searched in halves"""
+
+    device = _device(LimitedDevice, limit=timedelta(hours=12))
+    files = asyncio.run(_files(device))
+    assert len(files) == 13
+    assert len(device.searched) == 9
+
+
+def test_min_window():
+    """windows are not split below min_window"""
+
+    device = _device(LimitedDevice, limit=timedelta(hours=1))
+    with pytest.raises(ReolinkResponseError):
+        asyncio.run(_files(device, min_window=timedelta(hours=12)))
+
+
+def test_errors_propagate():
+    """errors other than timeouts are raised"""
+
+    with pytest.raises(ReolinkResponseError):
+        asyncio.run(_files(_device(error_rate=1)))
+
+
+def test_early_stop_cancels_workers():
+    """leaving the iteration stops the remaining searches"""
+
+    async def run():
+        device = _device(latency=0.01)
+        await device.connect()
+        files = device.iter_search(
+            0,
+            start_time=datetime(2022, 1, 1),
+            end_time=datetime(2022, 1, 3, 23, 59, 59),
+            concurrency=1,
+        )
+        async with aclosing(files):
+            async for _ in files:
+                break
+        await asyncio.sleep(0.05)
+        return device, [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+
+    device, tasks = asyncio.run(run())
+    assert not tasks
+    assert device.requests < 5
+
+
+def test_search_ahead_is_bounded():
+    """workers stop taking windows `concurrency` ahead of the files yielded"""
+
+    async def run():
+        device = _device(LimitedDevice, limit=timedelta(days=1))
+        device.add_recordings(0, recording_schedule(date(2022, 1, 4), 27, per_day=4))
+        await device.connect()
+        files = device.iter_search(
+            0,
+            start_time=datetime(2022, 1, 1),
+            end_time=datetime(2022, 1, 30, 23, 59, 59),
+            concurrency=2,
+        )
+        async with aclosing(files):
+            async for _ in files:
+                break
+        return device
+
+    assert len(asyncio.run(run()).searched) <= 3
@@ -0,0 +1,76 @@
+""" lazy containers """
+
+import asyncio
+import pickle
+from datetime import date, datetime
+
+from async_reolink.api.testing import FakeDevice, recording_schedule
+from async_reolink.api.lazy import LazyMapping, LazySequence
+
+
+def test_sequence_decodes_on_access():
+    """items are decoded once, when first read"""
+
+    calls = []
+
+    def decode(value):
+        calls.append(value)
+        return value * 2
+
+    items = LazySequence([1, 2, 3], decode)
+    assert len(items) == 3 and items.decoded == 0
+    assert items[-1] == 6
+    assert items[2] == 6
+    assert items[:2] == [2, 4]
+    assert list(items) == [2, 4, 6]
+    assert calls == [3, 1, 2]
+
+
+def test_mapping_decodes_on_access():
+    """values are decoded once, keys come from the raw mapping"""
+
+    values = LazyMapping({"a": 1, "b": 2}, str)
+    assert "a" in values and "c" not in values
+    assert values.decoded == 0
+    assert values["b"] == "2" and values.decoded == 1
+    assert dict(values) == {"a": "1", "b": "2"}
+
+
+def test_pickle_as_plain_containers():
+    """lazy containers pickle as lists and dicts"""
+
+    assert pickle.loads(pickle.dumps(LazySequence([1, 2], str))) == ["1", "2"]
+    assert pickle.loads(pickle.dumps(LazyMapping({1: 2}, str))) == {1: "2"}
+
+
+def test_search_decodes_read_files():
+    """device searches only build the files that are read"""
+
+    async def run():
+        device = FakeDevice()
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 1, per_day=24))
+        await device.connect()
+        return await device.search(
+            0, start_time=datetime(2022, 1, 1), end_time=datetime(2022, 1, 2)
+        )
+
+    files = asyncio.run(run())
+    assert files[0].start.to_datetime() == datetime(2022, 1, 1)
+    assert len(files) == 24
+    assert files.decoded == 1
+
+
+def test_abilities_decode_read_channels():
+    """device abilities only build the channel trees that are read"""
+
+    async def run():
+        device = FakeDevice(channels=16)
+        await device.connect()
+        return await device.get_ability()
+
+    abilities = asyncio.run(run())
+    assert abilities.channels[3].ptz.type.value is not None
+    assert len(abilities.channels) == 16
+    assert abilities.channels.decoded == 1
+    restored = pickle.loads(pickle.dumps(abilities.channels))
+    assert len(restored) == 16
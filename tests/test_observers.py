@@ -0,0 +1,173 @@
+""" request observers """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import ErrorCodes, ReolinkConnectionError, ReolinkResponseError
+from async_reolink.api.observers import (
+    HistogramObserver,
+    LatencyHistogram,
+    ObservedRequest,
+    RequestObserver,
+    observed,
+)
+
+
+class Recorder(RequestObserver):
+    """keeps the completed requests"""
+
+    def __init__(self) -> None:
+        self.completed: list[ObservedRequest] = []
+
+    def request_completed(self, request: ObservedRequest):
+        self.completed.append(request)
+
+
+def _position(_commands, _response, position: int):
+    return position
+
+
+def test_histogram_observer():
+    """latency, errors and batch sizes are counted by command type"""
+
+    async def run():
+        observer = HistogramObserver()
+        device = FakeDevice(observers=[observer])
+        failing = FakeDevice(observers=[observer], error_rate=1)
+        await device.connect()
+        await failing.connect()
+        await device.get_ir_lights(0)
+        with pytest.raises(ReolinkResponseError):
+            await failing.get_power_led(0)
+        return observer
+
+    observer = asyncio.run(run())
+    assert {name for name in observer.latency} == {
+        "GetIrLightsRequest",
+        "GetPowerLedRequest",
+    }
+    assert observer.errors == {("GetPowerLedRequest", ErrorCodes.INTERNAL): 1}
+    assert observer.batch_sizes == {1: 2}
+    assert not observer.failures
+
+
+def test_transport_error_is_a_failure():
+    """exceptions from the device are recorded on the request"""
+
+    async def responses():
+        raise ReolinkConnectionError("dropped")
+        yield  # pylint: disable=unreachable
+
+    async def run():
+        recorder = Recorder()
+        with pytest.raises(ReolinkConnectionError):
+            async for _ in observed(responses(), [None], [recorder], _position):
+                pass
+        return recorder.completed
+
+    (request,) = asyncio.run(run())
+    assert isinstance(request.error, ReolinkConnectionError)
+
+
+def test_early_stop_is_completion():
+    """a consumer stopping early completes the request at its last response"""
+
+    async def responses():
+        yield b"first"
+        yield b"second"
+
+    async def run():
+        recorder = Recorder()
+        stream = observed(responses(), [None], [recorder], _position)
+        async for _ in stream:
+            break
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+        return recorder.completed
+
+    (request,) = asyncio.run(run())
+    assert request.error is None
+    assert request.completed == request.first_byte
+    assert request.byte_count == 5
+
+
+def test_cancellation_is_completion():
+    """cancelled requests are not recorded as failures"""
+
+    async def responses():
+        await asyncio.sleep(1)
+        yield b""
+
+    async def run():
+        recorder = Recorder()
+
+        async def consume():
+            async for _ in observed(responses(), [None], [recorder], _position):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return recorder.completed
+
+    (request,) = asyncio.run(run())
+    assert request.error is None
+    assert request.completed is not None
+
+
+def test_latency_histogram():
+    """percentiles are within the bucket precision"""
+
+    histogram = LatencyHistogram(precision=8)
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+    assert histogram.count == 1000
+    assert histogram.min == pytest.approx(0.001)
+    assert histogram.max == pytest.approx(1)
+    assert histogram.mean == pytest.approx(0.5005)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=2**-7)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=2**-7)
+
+
+def test_latency_histogram_merge():
+    """merged histograms hold the values of both"""
+
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.001)
+    second.record(0.002)
+    first.merge(second)
+    assert first.count == 2
+    assert first.max == pytest.approx(0.002)
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(precision=4))
+
+
+class NoIrDevice(FakeDevice):
+    """answers IR light reads with an error"""
+
+    def _get_ir_lights(self, _command):
+        return self._error(ErrorCodes.INTERNAL)
+
+
+def test_error_after_stream():
+    """a stream counts as the answer of one command"""
+
+    async def run():
+        recorder = Recorder()
+        device = NoIrDevice(observers=[recorder], snapshot_size=40, chunk_size=20)
+        await device.connect()
+        commands = [
+            device._create_get_snapshot_request(0),
+            device._create_get_ir_lights_request(0),
+        ]
+        async for _ in device.batch(commands):
+            pass
+        return recorder.completed[-1]
+
+    request = asyncio.run(run())
+    assert request.errors == {1: ErrorCodes.INTERNAL}
+    assert request.byte_count == 40
@@ -0,0 +1,94 @@
+""" packed capabilities """
+
+import asyncio
+import pickle
+from operator import attrgetter
+
+from async_reolink.api.testing import FakeDevice, build_capabilities
+from async_reolink.api.system.capabilities import (
+    Capabilities,
+    ChannelCapabilities,
+    FloodLight,
+    Permissions,
+)
+from async_reolink.api.system.packed import (
+    pack_capabilities,
+    pack_channel_capabilities,
+    packed_type,
+)
+
+
+def _leaves(capabilities, protocol):
+    for field in packed_type(protocol)._fields:
+        leaf = attrgetter(field.path)(capabilities)
+        yield field.path, leaf.value, leaf.permissions
+
+
+def test_same_values():
+    """the packed tree reads the same values and permissions as the source"""
+
+    source = build_capabilities(
+        2,
+        channel_overrides={
+            "floodlight": FloodLight.AUTO,
+            "alarm.motion": False,
+        },
+    )
+    packed = pack_capabilities(source)
+    for channel in (0, 1):
+        assert list(_leaves(packed.channels[channel], ChannelCapabilities)) == list(
+            _leaves(source.channels[channel], ChannelCapabilities)
+        )
+    assert packed.channels[0].floodlight.value is FloodLight.AUTO
+    assert packed.channels[0].alarm.motion.value is False
+    assert packed.channels[0].alarm.motion.permissions == Permissions.READ | Permissions.WRITE
+
+
+def test_equal_channels_are_shared():
+    """identical channel trees pack to one instance"""
+
+    source = build_capabilities(4)
+    source.channels[3].alarm.motion.value = False
+    packed = pack_capabilities(source)
+    assert packed.channels[0] is packed.channels[2]
+    assert packed.channels[0] is not packed.channels[3]
+    assert pack_channel_capabilities(source.channels[1]) is packed.channels[1]
+
+
+def test_unfit_values_kept():
+    """values outside the declared type are kept as they are"""
+
+    source = build_capabilities(1).channels[0]
+    source.alarm.motion.value = 5
+    packed = pack_channel_capabilities(source)
+    assert packed.alarm.motion.value == 5
+    assert packed.alarm.audio.value is True
+
+
+def test_pickle():
+    """packed trees pickle by protocol and intern again when loaded"""
+
+    packed = pack_capabilities(build_capabilities(2))
+    loaded = pickle.loads(pickle.dumps(packed))
+    assert loaded.channels[0] is packed.channels[0]
+    assert list(_leaves(loaded.channels[1], ChannelCapabilities)) == list(
+        _leaves(packed.channels[1], ChannelCapabilities)
+    )
+    node = pickle.loads(pickle.dumps(packed.channels[0].alarm))
+    assert node.motion == packed.channels[0].alarm.motion
+
+
+def test_device_keeps_packed():
+    """connections opting in keep their fetched capabilities packed"""
+
+    async def run():
+        device = FakeDevice(channels=4, packed_capabilities=True)
+        await device.connect()
+        fetched = await device.get_ability()
+        return fetched, await device._ensure_abilities(), await device.get_snap(0)
+
+    fetched, known, image = asyncio.run(run())
+    assert known is fetched
+    assert isinstance(fetched, packed_type(Capabilities))
+    assert fetched.channels[0] is fetched.channels[3]
+    assert image
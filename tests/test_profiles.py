@@ -0,0 +1,87 @@
+""" device profile store """
+
+import asyncio
+import pickle
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.profiles import ProfileStore
+
+
+class CountingDevice(FakeDevice):
+    """counts capability requests"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.ability_requests = 0
+
+    def _get_abilities(self, _command):
+        self.ability_requests += 1
+        return super()._get_abilities(_command)
+
+
+class FailingStore(ProfileStore):
+    """store whose every operation fails"""
+
+    def __init__(self, error: Exception, path) -> None:
+        super().__init__(path)
+        self.error = error
+
+    def find(self, hostname: str):
+        raise self.error
+
+    def load(self, key: str):
+        raise self.error
+
+    def save(self, profile):
+        raise self.error
+
+
+async def _abilities(device: FakeDevice):
+    await device.connect()
+    abilities = await device._ensure_abilities()
+    await asyncio.sleep(0.01)
+    return abilities
+
+
+def test_warm_start(tmp_path):
+    """a saved profile answers capabilities without asking the device"""
+
+    cold = CountingDevice(profile_store=ProfileStore(tmp_path))
+    asyncio.run(_abilities(cold))
+    warm = CountingDevice(profile_store=ProfileStore(tmp_path))
+    abilities = asyncio.run(_abilities(warm))
+    assert cold.ability_requests == 1
+    assert warm.ability_requests == 0
+    assert abilities is not None
+
+
+def test_stale_profile_is_refreshed(tmp_path):
+    """profiles past revalidate_after are fetched again in the background"""
+
+    asyncio.run(_abilities(CountingDevice(profile_store=ProfileStore(tmp_path))))
+    device = CountingDevice(profile_store=ProfileStore(tmp_path, revalidate_after=0))
+    asyncio.run(_abilities(device))
+    assert device.ability_requests == 1
+
+
+def test_corrupt_files(tmp_path):
+    """unreadable profile files fall back to the device"""
+
+    asyncio.run(_abilities(FakeDevice(profile_store=ProfileStore(tmp_path))))
+    profiles = [file for file in tmp_path.iterdir() if file.suffix == ProfileStore.SUFFIX]
+    # truncated data, an unknown protocol and a foreign object
+    for data in (b"\x80\x04corrupt", b"\x80\x09", pickle.dumps(object())):
+        for file in profiles:
+            file.write_bytes(data)
+        device = CountingDevice(profile_store=ProfileStore(tmp_path))
+        assert asyncio.run(_abilities(device)) is not None
+        assert device.ability_requests == 1
+
+
+def test_failing_store(tmp_path):
+    """store errors never break ability lookup"""
+
+    for error in (OSError(), pickle.PicklingError(), AttributeError(), TypeError()):
+        device = CountingDevice(profile_store=FailingStore(error, tmp_path))
+        assert asyncio.run(_abilities(device)) is not None
+        assert device.ability_requests == 1
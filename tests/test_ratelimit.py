@@ -0,0 +1,68 @@
+""" rate limiting """
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.ratelimit import RateLimiter
+
+
+def test_acquire_paces_requests():
+    """requests past the burst wait for the rate"""
+
+    async def run():
+        limiter = RateLimiter(200, burst=2)
+        start = monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        return monotonic() - start
+
+    # 2 burst tokens, 4 more at 5ms each
+    assert asyncio.run(run()) >= 0.018
+
+
+def test_backoff_and_recovery():
+    """overload halves the rate, successes bring it back"""
+
+    async def run():
+        limiter = RateLimiter(10, recovery=0.5, recover_after=2)
+        limiter.throttled()
+        throttled = limiter.current_rate
+        for _ in range(4):
+            limiter.success()
+        return throttled, limiter.current_rate
+
+    throttled, recovered = asyncio.run(run())
+    assert throttled == 5
+    assert recovered == 10
+
+
+def test_min_rate():
+    """the rate never drops below min_rate"""
+
+    async def run():
+        limiter = RateLimiter(10, min_rate=4)
+        for _ in range(5):
+            limiter.throttled()
+        return limiter.current_rate
+
+    assert asyncio.run(run()) == 4
+
+
+def test_device_overload_throttles():
+    """SESSION_MAX responses slow the connection down"""
+
+    async def run():
+        limiter = RateLimiter(1000)
+        device = FakeDevice(
+            rate_limiter=limiter, error_rate=1, error_code=ErrorCodes.SESSION_MAX
+        )
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await device.get_ir_lights(0)
+        return limiter.current_rate
+
+    assert asyncio.run(run()) < 1000
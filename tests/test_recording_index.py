@@ -0,0 +1,136 @@
+""" recording index """
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice, recording_schedule
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.record.index import RecordingIndex
+from async_reolink.api.typings import StreamTypes
+
+FIRST = datetime(2022, 1, 30)
+LAST = datetime(2022, 2, 2, 23, 59, 59)
+
+
+class PartialDevice(FakeDevice):
+    """leaves months out of status answers and fails searches of some days"""
+
+    def __init__(self, *args, months=(), failing=(), **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.months = set(months)
+        self.failing = set(failing)
+        self.searched: list[date] = []
+
+    def _search_recordings(self, command):
+        start = command.search.start.to_datetime()
+        if not command.search.status_only:
+            self.searched.append(start.date())
+            if start.date() in self.failing:
+                return self._error(ErrorCodes.INTERNAL)
+        response = super()._search_recordings(command)
+        response.status = [
+            status for status in response.status if status.month not in self.months
+        ]
+        return response
+
+
+def _device(device_type=FakeDevice, **kwargs):
+    device = device_type(recording_index=RecordingIndex(), **kwargs)
+    # no recordings on the 31st
+    device.add_recordings(0, recording_schedule(date(2022, 1, 30), 1, per_day=4))
+    device.add_recordings(0, recording_schedule(date(2022, 2, 1), 2, per_day=4))
+    return device
+
+
+async def _sync(device: FakeDevice):
+    return await device.sync_recordings(0, start_time=FIRST, end_time=LAST)
+
+
+def _complete(device: FakeDevice):
+    return device.recording_index.days(
+        "00000000000000", 0, StreamTypes.MAIN, FIRST.date(), LAST.date()
+    )
+
+
+def test_sync_and_search():
+    """synced days are searched once and answered from the index"""
+
+    async def run():
+        device = _device()
+        await device.connect()
+        counts = (await _sync(device), await _sync(device))
+        requests = device.requests
+        files = await device.search(0, start_time=FIRST, end_time=LAST)
+        return device, counts, files, device.requests - requests
+
+    device, counts, files, requests = asyncio.run(run())
+    assert counts == (3, 0)
+    assert len(files) == 12 and requests == 0
+    assert _complete(device) == {date(2022, 1, day) for day in (30, 31)} | {
+        date(2022, 2, day) for day in (1, 2)
+    }
+
+
+def test_month_missing_from_status():
+    """days of months the status search left out are not complete"""
+
+    async def run():
+        device = _device(PartialDevice, months={2})
+        await device.connect()
+        await _sync(device)
+        return device
+
+    device = asyncio.run(run())
+    assert _complete(device) == {date(2022, 1, 30), date(2022, 1, 31)}
+    assert date(2022, 2, 1) in device.searched
+    files = device.recording_index.files(
+        "00000000000000", 0, StreamTypes.MAIN, FIRST, LAST
+    )
+    assert len(files) == 12
+
+
+def test_failed_search():
+    """days whose search failed stay incomplete, the error is raised"""
+
+    async def run():
+        device = _device(PartialDevice, failing={date(2022, 1, 30)})
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await _sync(device)
+        device.failing.clear()
+        return device, await _sync(device)
+
+    device, searched = asyncio.run(run())
+    assert searched == 1
+    assert date(2022, 1, 30) in _complete(device)
+
+
+def test_index_store_and_timeline():
+    """stored files are found by range, across devices, and removed"""
+
+    async def run():
+        device = FakeDevice()
+        device.add_recordings(0, recording_schedule(date(2022, 1, 1), 1, per_day=4))
+        await device.connect()
+        return await device.search(
+            0, start_time=datetime(2022, 1, 1), end_time=datetime(2022, 1, 1, 23, 59)
+        )
+
+    files = asyncio.run(run())
+    index = RecordingIndex()
+    day = date(2022, 1, 1)
+    for device in ("a", "b"):
+        index.store(device, 0, StreamTypes.MAIN, [day], files, [day])
+    noon = datetime(2022, 1, 1, 12)
+    found = index.files("a", 0, StreamTypes.MAIN, noon, noon + timedelta(hours=12))
+    assert [file.start.to_datetime() for file in found] == [
+        noon,
+        datetime(2022, 1, 1, 18),
+    ]
+    timeline = index.timeline(noon, noon + timedelta(hours=12))
+    assert [device for device, _ in timeline] == ["a", "b", "a", "b"]
+    index.remove("a")
+    assert not index.days("a", 0, StreamTypes.MAIN, day, day)
+    assert index.days("b", 0, StreamTypes.MAIN, day, day) == {day}
@@ -0,0 +1,78 @@
+""" response routing """
+
+import asyncio
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.commands import (
+    ResponseKind,
+    is_code,
+    is_error,
+    register_response_kind,
+    response_kind,
+)
+from async_reolink.api.errors import ErrorCodes
+from async_reolink.api.testing.commands import CodeResponse, ErrorResponse
+
+
+def test_tagged_kinds():
+    """tagged response types route without classification"""
+
+    error = ErrorResponse(error_code=ErrorCodes.INTERNAL, details=None)
+    code = CodeResponse(response_code=0)
+    assert is_error(error) and not is_code(error)
+    assert is_code(code) and not is_error(code)
+    assert response_kind(b"data") is ResponseKind.DATA
+    assert response_kind(memoryview(b"data")) is ResponseKind.DATA
+
+
+def test_untagged_kinds_are_classified():
+    """untagged types are classified against the protocols"""
+
+    class Error:
+        """error like response"""
+
+        error_code = ErrorCodes.INTERNAL
+        details = None
+
+        def throw(self, *args):
+            """throw as error"""
+
+    class Code:
+        """code like response"""
+
+        response_code = 0
+
+    class Other:
+        """command specific response"""
+
+    assert is_error(Error())
+    assert is_code(Code())
+    assert response_kind(Other()) is ResponseKind.VALUE
+
+
+def test_register_overrides_classification():
+    """a registered kind wins over the protocol check"""
+
+    @register_response_kind(ResponseKind.VALUE)
+    class Value:
+        """value response carrying a code"""
+
+        response_code = 0
+
+    assert response_kind(Value()) is ResponseKind.VALUE
+
+
+def test_device_routes_errors():
+    """the fake device answers unknown commands with an error response"""
+
+    class Unknown:
+        """command the device does not know"""
+
+    async def run():
+        device = FakeDevice(command_gate=False)
+        await device.connect()
+        return [response async for response in device.batch([Unknown()])]
+
+    (response,) = asyncio.run(run())
+    assert is_error(response)
+    assert response.error_code == ErrorCodes.NOT_SUPPORTED
@@ -0,0 +1,153 @@
+""" retry policy """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import (
+    ErrorCodes,
+    ReolinkConnectionError,
+    ReolinkResponseError,
+)
+from async_reolink.api.retry import RetryPolicy
+
+
+class FlakyDevice(FakeDevice):
+    """fails the first `failures` requests after yielding `chunks` responses"""
+
+    def __init__(self, *args, failures: int = 1, chunks: int = 0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+        self.chunks = chunks
+
+    async def _execute(self, *args):
+        count = 0
+        async for response in super()._execute(*args):
+            if self.failures and count >= self.chunks:
+                self.failures -= 1
+                raise ReolinkConnectionError("dropped")
+            count += 1
+            yield response
+
+
+def _policy(attempts: int = 3):
+    return RetryPolicy(attempts, base_delay=0)
+
+
+def test_transport_error_is_retried():
+    """a dropped request is sent again"""
+
+    async def run():
+        device = FlakyDevice(retry_policy=_policy())
+        await device.connect()
+        return await device.get_ir_lights(0), device.requests
+
+    lights, requests = asyncio.run(run())
+    assert lights is not None
+    assert requests == 2
+
+
+def test_transient_code_is_retried():
+    """transient error codes are resent until the attempts run out"""
+
+    async def run():
+        device = FakeDevice(
+            retry_policy=_policy(), error_rate=1, error_code=ErrorCodes.INTERNAL
+        )
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await device.get_ir_lights(0)
+        return device.requests
+
+    assert asyncio.run(run()) == 3
+
+
+def test_permanent_code_is_not_retried():
+    """permanent error codes fail on the first attempt"""
+
+    async def run():
+        device = FakeDevice(
+            retry_policy=_policy(),
+            command_gate=False,
+            error_rate=1,
+            error_code=ErrorCodes.NOT_SUPPORTED,
+        )
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await device.get_ir_lights(0)
+        return device.requests
+
+    assert asyncio.run(run()) == 1
+
+
+def test_stream_is_not_resent():
+    """a failure after snapshot data was passed on raises instead of repeating it"""
+
+    async def run():
+        device = FlakyDevice(
+            retry_policy=_policy(), chunks=1, snapshot_size=40, chunk_size=20
+        )
+        await device.connect()
+        with pytest.raises(ReolinkConnectionError):
+            await device.get_snap(0)
+        return device.requests
+
+    assert asyncio.run(run()) == 1
+
+
+def test_stream_answers_its_command():
+    """commands after a stream keep their responses, the stream is not repeated"""
+
+    async def run():
+        device = FlakyDevice(
+            retry_policy=_policy(), chunks=3, snapshot_size=40, chunk_size=20
+        )
+        await device.connect()
+        commands = [
+            device._create_get_snapshot_request(0),
+            device._create_get_ir_lights_request(0),
+            device._create_get_power_led_request(0),
+        ]
+        return [response async for response in device.batch(commands)]
+
+    responses = asyncio.run(run())
+    data = b"".join(
+        response for response in responses if isinstance(response, bytes)
+    )
+    assert len(data) == 40
+    assert len([r for r in responses if not isinstance(r, bytes)]) == 2
+
+
+class BusyDevice(FakeDevice):
+    """answers the first `busy` IR light reads with SESSION_MAX"""
+
+    def __init__(self, *args, busy: int = 1, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.busy = busy
+
+    def _get_ir_lights(self, command):
+        if self.busy:
+            self.busy -= 1
+            return self._error(ErrorCodes.SESSION_MAX)
+        return super()._get_ir_lights(command)
+
+
+def test_stream_waits_for_resent_command():
+    """a stream after a resent command is held back until that command answers"""
+
+    async def run():
+        device = BusyDevice(retry_policy=_policy(), snapshot_size=40, chunk_size=20)
+        await device.connect()
+        commands = [
+            device._create_get_ir_lights_request(0),
+            device._create_get_snapshot_request(0),
+        ]
+        return device, [response async for response in device.batch(commands)]
+
+    device, responses = asyncio.run(run())
+    assert device.requests == 2
+    assert not isinstance(responses[0], bytes)
+    assert b"".join(responses[1:]) and all(
+        isinstance(response, bytes) for response in responses[1:]
+    )
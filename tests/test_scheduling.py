@@ -0,0 +1,94 @@
+""" priority scheduling """
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.ptz.typings import Operation
+from async_reolink.api.retry import RetryPolicy
+from async_reolink.api.scheduling import Priority, PriorityScheduler, prioritized
+
+
+def test_waiters_dispatched_by_priority():
+    """interactive waiters go before bulk waiters queued earlier"""
+
+    async def run():
+        scheduler = PriorityScheduler(1)
+        order: list[Priority] = []
+
+        async def request(priority: Priority):
+            async with scheduler.slot(priority):
+                order.append(priority)
+
+        async with scheduler.slot():
+            tasks = [
+                asyncio.ensure_future(request(Priority.BULK)),
+                asyncio.ensure_future(request(Priority.NORMAL)),
+                asyncio.ensure_future(request(Priority.INTERACTIVE)),
+            ]
+            await asyncio.sleep(0)
+            assert scheduler.waiting == 3
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == [Priority.INTERACTIVE, Priority.NORMAL, Priority.BULK]
+
+
+def test_reserved_interactive_slot():
+    """interactive requests use the reserved slot while bulk traffic holds the rest"""
+
+    async def run():
+        scheduler = PriorityScheduler(1, interactive_slots=1)
+        async with scheduler.slot(Priority.BULK):
+            return await asyncio.wait_for(scheduler.acquire(Priority.INTERACTIVE), 1)
+
+    assert asyncio.run(run()) is True
+
+
+def test_interactive_skips_coalescing():
+    """PTZ control is sent at once, outside the coalescing batch"""
+
+    async def run():
+        device = FakeDevice(coalesce_window=0.2)
+        await device.connect()
+        start = monotonic()
+        await device.ptz_control(Operation.LEFT)
+        return monotonic() - start, device.requests
+
+    elapsed, requests = asyncio.run(run())
+    assert elapsed < 0.1
+    assert requests == 1
+
+
+def test_prioritized_block():
+    """reads inside an interactive block skip coalescing too"""
+
+    async def run():
+        device = FakeDevice(coalesce_window=0.2)
+        await device.connect()
+        start = monotonic()
+        with prioritized(Priority.INTERACTIVE):
+            await device.get_ir_lights(0)
+        return monotonic() - start
+
+    assert asyncio.run(run()) < 0.1
+
+
+def test_interactive_retry_without_backoff():
+    """failed interactive commands are resent right away"""
+
+    async def run():
+        device = FakeDevice(
+            retry_policy=RetryPolicy(3, base_delay=5, max_delay=5),
+            error_rate=1,
+            error_code=ErrorCodes.INTERNAL,
+        )
+        await device.connect()
+        with pytest.raises(ReolinkResponseError):
+            await asyncio.wait_for(device.ptz_control(Operation.LEFT), 1)
+        return device.requests
+
+    assert asyncio.run(run()) == 3
@@ -0,0 +1,92 @@
+""" single-flight deduplication """
+
+import asyncio
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.errors import ReolinkResponseError
+
+
+def test_identical_reads_share_a_request():
+    """concurrent identical reads are sent once"""
+
+    async def run():
+        device = FakeDevice(latency=0.01)
+        await device.connect()
+        results = await asyncio.gather(*(device.get_ir_lights(0) for _ in range(5)))
+        return device, results
+
+    device, results = asyncio.run(run())
+    assert device.commands == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_sequential_reads_are_sent():
+    """a read after an answered one is sent again"""
+
+    async def run():
+        device = FakeDevice()
+        await device.connect()
+        await device.get_ir_lights(0)
+        await device.get_ir_lights(0)
+        return device
+
+    assert asyncio.run(run()).commands == 2
+
+
+def test_different_reads_are_sent():
+    """reads for other channels are not shared"""
+
+    async def run():
+        device = FakeDevice(channels=2, latency=0.01)
+        await device.connect()
+        await asyncio.gather(device.get_ir_lights(0), device.get_ir_lights(1))
+        return device
+
+    assert asyncio.run(run()).commands == 2
+
+
+def test_shared_error():
+    """joined reads see the error of the shared request"""
+
+    async def run():
+        device = FakeDevice(latency=0.01, error_rate=1)
+        await device.connect()
+        results = await asyncio.gather(
+            *(device.get_ir_lights(0) for _ in range(3)), return_exceptions=True
+        )
+        return device, results
+
+    device, results = asyncio.run(run())
+    assert device.commands == 1
+    assert all(isinstance(result, ReolinkResponseError) for result in results)
+
+
+def test_disabled():
+    """without single-flight every read is sent"""
+
+    async def run():
+        device = FakeDevice(latency=0.01, single_flight=False)
+        await device.connect()
+        await asyncio.gather(*(device.get_ir_lights(0) for _ in range(3)))
+        return device
+
+    assert asyncio.run(run()).commands == 3
+
+
+def test_leader_cancelled():
+    """joined reads fail instead of hanging when the first caller gives up"""
+
+    async def run():
+        device = FakeDevice(latency=0.05)
+        await device.connect()
+        leader = asyncio.ensure_future(device.get_ir_lights(0))
+        await asyncio.sleep(0.01)
+        joined = asyncio.ensure_future(device.get_ir_lights(0))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(ReolinkResponseError):
+            await asyncio.wait_for(joined, 1)
+
+    asyncio.run(run())
@@ -0,0 +1,203 @@
+""" snapshots """
+
+import asyncio
+import io
+
+import pytest
+
+from async_reolink.api.testing import FakeDevice
+from async_reolink.api.commands.record import GetSnapshotRequest
+from async_reolink.api.errors import ReolinkResponseError
+
+
+class BufferedDevice(FakeDevice):
+    """answers snapshots with views into a larger receive buffer"""
+
+    async def _execute(self, *args):
+        async for response in super()._execute(*args):
+            if isinstance(response, bytes):
+                buffer = b"header" + response + b"trailer"
+                response = memoryview(buffer)[6 : 6 + len(response)]
+            yield response
+
+
+async def _connected(device: FakeDevice):
+    await device.connect()
+    return device
+
+
+def test_iter_snap():
+    """chunks arrive as views in order"""
+
+    async def run():
+        device = await _connected(FakeDevice(snapshot_size=100, chunk_size=30))
+        return [chunk async for chunk in device.iter_snap(0)]
+
+    chunks = asyncio.run(run())
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+
+
+def test_iter_snap_error():
+    """error responses raise"""
+
+    async def run():
+        device = await _connected(FakeDevice(error_rate=1))
+        return [chunk async for chunk in device.iter_snap(0)]
+
+    with pytest.raises(ReolinkResponseError):
+        asyncio.run(run())
+
+
+def test_get_snap_single_view():
+    """a single chunk viewing part of a buffer returns only its bytes"""
+
+    async def run():
+        device = await _connected(BufferedDevice(snapshot_size=100, chunk_size=100))
+        return await device.get_snap(0)
+
+    image = asyncio.run(run())
+    assert isinstance(image, bytes)
+    assert len(image) == 100
+    assert image[:2] == b"\xff\xd8" and image[-2:] == b"\xff\xd9"
+
+
+def test_get_snap_whole_response():
+    """a single chunk covering a whole response is returned as is"""
+
+    async def run():
+        device = await _connected(FakeDevice(snapshot_size=100, chunk_size=100))
+        return await device.get_snap(0)
+
+    assert len(asyncio.run(run())) == 100
+
+
+@pytest.mark.parametrize("length", (None, 50, 100, 400))
+def test_get_snap_chunks(length):
+    """chunks are joined, into a preallocated buffer when the length is given"""
+
+    async def run():
+        device = await _connected(BufferedDevice(snapshot_size=100, chunk_size=30))
+        return await device.get_snap(0, length)
+
+    image = asyncio.run(run())
+    assert len(image) == 100
+    assert image[:2] == b"\xff\xd8" and image[-2:] == b"\xff\xd9"
+
+
+def test_get_snap_into_writer():
+    """file like objects receive every chunk, async writers are awaited"""
+
+    class AsyncWriter:
+        """async file like object"""
+
+        def __init__(self) -> None:
+            self.data = bytearray()
+
+        async def write(self, data):
+            """append data"""
+            self.data += data
+
+    async def run():
+        device = await _connected(FakeDevice(snapshot_size=100, chunk_size=30))
+        file, writer = io.BytesIO(), AsyncWriter()
+        sizes = (
+            await device.get_snap_into(file, 0),
+            await device.get_snap_into(writer, 0),
+        )
+        return sizes, file.getvalue(), bytes(writer.data)
+
+    sizes, written, awaited = asyncio.run(run())
+    assert sizes == (100, 100)
+    assert written == awaited and len(written) == 100
+
+
+def test_get_snap_into_buffer():
+    """buffers are filled in place and must hold the whole snapshot"""
+
+    async def run():
+        device = await _connected(FakeDevice(snapshot_size=100, chunk_size=30))
+        buffer = bytearray(128)
+        size = await device.get_snap_into(buffer, 0)
+        with pytest.raises(BufferError):
+            await device.get_snap_into(bytearray(64), 0)
+        return size, buffer
+
+    size, buffer = asyncio.run(run())
+    assert size == 100
+    assert buffer[:2] == b"\xff\xd8" and buffer[98:100] == b"\xff\xd9"
+
+
+class DroppingDevice(FakeDevice):
+    """fails snapshots of the given channels with a transport error"""
+
+    def __init__(self, *args, dropped=(), **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.dropped = set(dropped)
+
+    async def _execute(self, *args):
+        if any(getattr(command, "channel_id", None) in self.dropped for command in args):
+            raise OSError("connection reset")
+        async for response in super()._execute(*args):
+            yield response
+
+
+def test_get_snaps():
+    """every channel is captured, all of them by default"""
+
+    async def run():
+        device = await _connected(FakeDevice(channels=4, snapshot_size=100))
+        return [snapshot async for snapshot in device.get_snaps()]
+
+    snapshots = asyncio.run(run())
+    assert sorted(snapshot.channel for snapshot in snapshots) == [0, 1, 2, 3]
+    assert all(len(snapshot.image) == 100 for snapshot in snapshots)
+    assert all(snapshot.time is not None for snapshot in snapshots)
+
+
+def test_get_snaps_concurrency():
+    """at most `concurrency` snapshots are requested at once"""
+
+    active = peak = 0
+
+    class Tracking(FakeDevice):
+        """tracks concurrent requests"""
+
+        async def _execute(self, *args):
+            nonlocal active, peak
+            if not isinstance(args[0], GetSnapshotRequest):
+                async for response in super()._execute(*args):
+                    yield response
+                return
+            active += 1
+            peak = max(peak, active)
+            try:
+                async for response in super()._execute(*args):
+                    yield response
+            finally:
+                active -= 1
+
+    async def run():
+        device = await _connected(Tracking(channels=6, latency=0.01))
+        return [snapshot async for snapshot in device.get_snaps(concurrency=2)]
+
+    assert len(asyncio.run(run())) == 6
+    assert peak == 2
+
+
+def test_get_snaps_errors():
+    """failed channels yield their error, transport errors included"""
+
+    async def run():
+        device = await _connected(
+            DroppingDevice(channels=3, snapshot_size=100, dropped={1})
+        )
+        snapshots = device.get_snaps([0, 1, 2])
+        return await asyncio.wait_for(_collect(snapshots), 1)
+
+    async def _collect(snapshots):
+        return [snapshot async for snapshot in snapshots]
+
+    snapshots = {snapshot.channel: snapshot for snapshot in asyncio.run(run())}
+    assert isinstance(snapshots[1].image, OSError)
+    assert len(snapshots[0].image) == len(snapshots[2].image) == 100
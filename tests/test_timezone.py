@@ -0,0 +1,99 @@
+""" device timezone """
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from async_reolink.api.testing.typings import DstTime, Time, Value
+from async_reolink.api.commands.system import _timezone
+from async_reolink.api.typings import WeekDays
+
+STANDARD = timedelta(hours=-5)
+SUMMER = timedelta(hours=-4)
+
+
+def _rule(start: DstTime, end: DstTime, offset: int):
+    return (
+        Value(enabled=True, hour_offset=1, start=start, end=end),
+        Time(timezone_offset=offset),
+    )
+
+
+NORTH = _rule(
+    DstTime(month=3, week=2, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+    DstTime(month=11, week=1, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+    -18000,
+)
+SOUTH = _rule(
+    DstTime(month=10, week=1, weekday=WeekDays.SUNDAY, hour=2, minute=0),
+    DstTime(month=4, week=1, weekday=WeekDays.SUNDAY, hour=3, minute=0),
+    -18000,
+)
+
+
+def _transitions(rule):
+    (dst, _) = rule
+    return dst.start.to_datetime(2022), dst.end.to_datetime(2022)
+
+
+def _local_times():
+    start = datetime(2022, 1, 1)
+    return [start + timedelta(minutes=15 * i) for i in range(365 * 96)]
+
+
+@pytest.mark.parametrize("rule", (NORTH, SOUTH), ids=("north", "south"))
+def test_skipped_hour(rule):
+    """times in the skipped hour use the offset before the transition unless fold"""
+
+    tzinfo = _timezone.get(*rule)
+    (start, _) = _transitions(rule)
+    skipped = start + timedelta(minutes=30)
+    assert tzinfo.utcoffset(start - timedelta(minutes=1)) == STANDARD
+    assert tzinfo.utcoffset(skipped) == STANDARD
+    assert tzinfo.utcoffset(skipped.replace(fold=1)) == SUMMER
+    assert tzinfo.dst(skipped) == timedelta(0)
+    assert tzinfo.dst(skipped.replace(fold=1)) == timedelta(hours=1)
+    assert tzinfo.utcoffset(start + timedelta(hours=1)) == SUMMER
+
+
+@pytest.mark.parametrize("rule", (NORTH, SOUTH), ids=("north", "south"))
+def test_repeated_hour(rule):
+    """fold selects the standard time occurrence of the repeated hour"""
+
+    tzinfo = _timezone.get(*rule)
+    (_, end) = _transitions(rule)
+    repeated = end - timedelta(minutes=30)
+    assert tzinfo.utcoffset(repeated) == SUMMER
+    assert tzinfo.utcoffset(repeated.replace(fold=1)) == STANDARD
+    assert tzinfo.dst(repeated.replace(fold=1)) == timedelta(0)
+    assert tzinfo.utcoffset(end) == STANDARD
+    assert tzinfo.utcoffset(repeated - timedelta(hours=1)) == SUMMER
+
+
+@pytest.mark.parametrize("rule", (NORTH, SOUTH), ids=("north", "south"))
+def test_fromutc_round_trip(rule):
+    """every instant converts to local time and back, fold marks the second hour"""
+
+    tzinfo = _timezone.get(*rule)
+    (_, end) = _transitions(rule)
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    folds = []
+    for step in range(365 * 96):
+        instant = start + timedelta(minutes=15 * step)
+        local = instant.astimezone(tzinfo)
+        assert local.astimezone(timezone.utc) == instant, instant
+        if local.fold:
+            folds.append(local.replace(tzinfo=None))
+    assert folds == [end - timedelta(minutes=m) for m in (60, 45, 30, 15)]
+
+
+@pytest.mark.parametrize("rule", (NORTH, SOUTH), ids=("north", "south"))
+@pytest.mark.parametrize("fold", (0, 1))
+def test_timestamps(rule, fold: int):
+    """bulk conversion agrees with single conversions, including fold"""
+
+    tzinfo = _timezone.get(*rule)
+    values = [value.replace(fold=fold) for value in _local_times()]
+    assert list(tzinfo.timestamps(values)) == [
+        int(value.replace(tzinfo=tzinfo).timestamp()) for value in values
+    ]